@@ -0,0 +1,414 @@
+"""
+Benchmarks for the simulated devices of ophyd_devices.
+
+The benchmarks compare the optimised code paths of the simulation against their
+reference implementation and print the achieved frame rates and the peak memory allocated
+per call as a table. Each benchmark returns a list of (variant, function, frames per call).
+
+>>> python -m ophyd_devices.sim.sim_benchmark --benchmark camera_grid --shape 2048 2048
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Callable
+
+import numpy as np
+from bec_lib import messages
+from bec_lib.serialization import MsgpackSerialization
+from prettytable import PrettyTable
+
+from ophyd_devices.sim.sim_camera import SimCamera
+from ophyd_devices.sim.sim_data import NoiseType, SimulatedDataMonitor
+from ophyd_devices.sim.sim_monitor import SimMonitor
+from ophyd_devices.sim.sim_positioner import SimPositioner
+from ophyd_devices.sim.sim_waveform import SimWaveform
+from ophyd_devices.tests.utils import get_mock_scan_info
+from ophyd_devices.utils.array_encoding import ArrayEncoding, decode_signals, encode_signals
+from ophyd_devices.utils.bec_utils import DMMock
+
+Variants = list[tuple[str, Callable[[], object], int]]
+
+
+def _rate(func: Callable[[], object], repeat: int) -> float:
+    """Return the number of calls per second of func, averaged over repeat calls."""
+    func()  # warm up, i.e. fill caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    return repeat / elapsed if elapsed > 0 else float("inf")
+
+
+def _peak_memory(func: Callable[[], object]) -> float:
+    """Return the peak memory in MB allocated during a single call of func.
+
+    Numpy reports its data allocations to tracemalloc, so large arrays are included.
+    """
+    func()  # warm up, i.e. fill caches
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1e6
+
+
+def _make_camera(shape: tuple[int, int]) -> SimCamera:
+    """Create a simulated camera with the given image shape."""
+    camera = SimCamera(name="camera")
+    camera.image_shape.set(tuple(shape)).wait()
+    return camera
+
+
+def benchmark_camera_grid(shape: tuple[int, int]) -> Variants:
+    """Frames/s of the gaussian camera with and without the cached coordinate grid.
+
+    The cached template is invalidated in both variants, so each frame evaluates the gaussian.
+    """
+    camera = _make_camera(shape)
+
+    # pylint: disable=protected-access
+    def uncached():
+        camera.sim._grid_cache = None
+        camera.sim._invalidate_cache()
+        camera.image.get()
+
+    def cached():
+        camera.sim._invalidate_cache()
+        camera.image.get()
+
+    return [("uncached grid", uncached, 1), ("cached grid", cached, 1)]
+
+
+def benchmark_camera_template(shape: tuple[int, int]) -> Variants:
+    """Frames/s of the gaussian camera with and without the cached noise-free template."""
+    camera = _make_camera(shape)
+
+    def uncached():
+        camera.sim._invalidate_cache()  # pylint: disable=protected-access
+        camera.image.get()
+
+    return [("uncached template", uncached, 1), ("cached template", camera.image.get, 1)]
+
+
+def benchmark_camera_burst(shape: tuple[int, int]) -> Variants:
+    """Frames/s of the camera computing a burst frame by frame and as one stack."""
+    camera = _make_camera(shape)
+    burst = 10
+
+    def frame_by_frame():
+        for _ in range(burst):
+            camera.image.get()
+
+    def stacked():
+        camera.sim.compute_burst(signal_name=camera.image.name, burst=burst)
+
+    return [("frame by frame", frame_by_frame, burst), ("stacked burst", stacked, burst)]
+
+
+def benchmark_camera_noise(shape: tuple[int, int]) -> Variants:
+    """Frames/s and peak memory of the gaussian camera for each noise type."""
+    variants = []
+    for noise in NoiseType:
+        camera = _make_camera(shape)
+        camera.sim.params = {"noise": noise}
+        variants.append((f"noise {noise.value}", camera.image.get, 1))
+    return variants
+
+
+def benchmark_camera_workers(shape: tuple[int, int]) -> Variants:
+    """Frames/s of the camera with poisson noise rendered by an increasing number of threads."""
+    variants = []
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        camera = _make_camera(shape)
+        camera.sim.params = {"noise": NoiseType.POISSON}
+        camera.render_workers.set(workers).wait()
+        variants.append((f"{workers} workers", camera.image.get, 1))
+        workers *= 2
+    return variants
+
+
+def benchmark_camera_movie_bank(shape: tuple[int, int]) -> Variants:
+    """Frames/s of camera triggers with rendered frames and with frames from a movie bank."""
+    # pylint: disable=protected-access
+    rendered = _make_camera(shape)
+    banked = _make_camera(shape)
+    banked.movie_bank_frames.set(16).wait()
+    banked.prepare_movie_bank()
+    return [
+        ("rendered", lambda: rendered._acquire_frames(burst=1), 1),
+        ("movie bank", lambda: banked._acquire_frames(burst=1), 1),
+    ]
+
+
+def benchmark_camera_events(shape: tuple[int, int]) -> Variants:
+    """Frames/s of the camera at low flux, as dense frames and as sparse photon events."""
+    camera = _make_camera(shape)
+    camera.sim.params = {"noise": NoiseType.POISSON, "amplitude": 1}
+    return [
+        ("dense frame", camera.image.get, 1),
+        ("photon events", lambda: camera.sim.compute_events(signal_name=camera.image.name), 1),
+    ]
+
+
+def benchmark_camera_readout(shape: tuple[int, int]) -> Variants:
+    """Frames/s of the camera reading out the full frame, a quarter of it and the quarter
+    binned 2x2."""
+    variants = []
+    for label, binning in (("full frame", 0), ("quarter roi", 1), ("quarter roi, 2x2 binned", 2)):
+        camera = _make_camera(shape)
+        camera.sim.params = {"noise": NoiseType.POISSON}
+        if binning:
+            camera.readout_size.set((shape[0] // 2, shape[1] // 2)).wait()
+            camera.binning.set(binning).wait()
+        variants.append((label, camera.image.get, 1))
+    return variants
+
+
+def benchmark_camera_poisson_approximation(shape: tuple[int, int]) -> Variants:
+    """Frames/s of the camera at high counts with exact and approximated Poisson noise."""
+    variants = []
+    for noise in (NoiseType.POISSON, NoiseType.NORMAL, NoiseType.NOISE_BANK):
+        camera = _make_camera(shape)
+        camera.sim.select_model("constant")
+        camera.sim.params = {"noise": noise, "amplitude": 1000}
+        variants.append((f"noise {noise.value}", camera.image.get, 1))
+    return variants
+
+
+def benchmark_waveform_poisson_approximation(shape: tuple[int, int]) -> Variants:
+    """Waveforms/s with prod(shape) samples at high counts, with exact and approximated Poisson
+    noise."""
+    variants = []
+    for noise in (NoiseType.POISSON, NoiseType.NORMAL, NoiseType.NOISE_BANK):
+        waveform = SimWaveform(name="waveform")
+        waveform.waveform_shape.put(int(np.prod(shape)))
+        waveform.sim.select_model("ConstantModel")
+        waveform.sim.params = {"noise": noise, "c": 1000}
+        variants.append((f"noise {noise.value}", waveform.waveform.get, 1))
+    return variants
+
+
+def benchmark_monitor_model(shape: tuple[int, int]) -> Variants:
+    """Readbacks/s of 200 gaussian monitors, evaluated by lmfit and by the compiled model."""
+    variants = []
+    for label, compiled in (("lmfit eval", False), ("compiled model", True)):
+        monitors = [SimMonitor(name=f"monitor_{ii}") for ii in range(200)]
+        for monitor in monitors:
+            monitor.sim.select_model("GaussianModel")
+            monitor.sim.use_compiled_model = compiled
+
+        def read_all(monitors=monitors):
+            for monitor in monitors:
+                monitor.get()
+
+        variants.append((label, read_all, len(monitors)))
+    return variants
+
+
+def benchmark_monitor_startup(shape: tuple[int, int]) -> Variants:
+    """Startup time of 500 monitors, introspecting lmfit per monitor and with the shared model
+    lookup. The rate is given in monitors/s."""
+    count = 500
+
+    def introspect_per_monitor():
+        for ii in range(count):
+            # pylint: disable=protected-access
+            SimulatedDataMonitor._model_lookups.clear()
+            SimMonitor(name=f"monitor_{ii}")
+
+    def shared_lookup():
+        for ii in range(count):
+            SimMonitor(name=f"monitor_{ii}")
+
+    return [
+        ("introspect per monitor", introspect_per_monitor, count),
+        ("shared model lookup", shared_lookup, count),
+    ]
+
+
+def benchmark_monitor_scan(shape: tuple[int, int]) -> Variants:
+    """Readbacks/s of a gaussian monitor during a step scan of prod(shape) // 100 points over a
+    simulated motor, evaluated live and precomputed at stage.
+
+    The motor is placed at each planned position without moving it, so only the readbacks
+    are timed.
+    """
+    num_points = int(np.prod(shape)) // 100
+    positions = np.linspace(-10, 10, num_points)
+    variants = []
+    for label, precompute in (("live evaluation", False), ("precomputed scan", True)):
+        device_manager = DMMock()
+        motor = SimPositioner(name="samx")
+        device_manager.devices["samx"] = SimpleNamespace(obj=motor)
+        monitor = SimMonitor(name="monitor", device_manager=device_manager)
+        monitor.scan_info = get_mock_scan_info(device=monitor)
+        monitor.scan_info.msg.num_points = num_points
+        monitor.scan_info.msg.info.update(
+            scan_motors=["samx"], positions=positions[:, None].tolist()
+        )
+        monitor.sim.select_model("GaussianModel")
+        monitor.sim.params = {"ref_motor": "samx", "noise": NoiseType.POISSON}
+        monitor.sim.precompute_scan = precompute
+
+        def scan(monitor=monitor, motor=motor):
+            monitor.stage()
+            for position in positions:
+                # pylint: disable=protected-access
+                motor._update_state(position)
+                monitor.read()
+            monitor.unstage()
+
+        variants.append((label, scan, num_points))
+    return variants
+
+
+def benchmark_monitor_grid(shape: tuple[int, int]) -> Variants:
+    """Positions/s of a 2D gaussian monitor over a grid of the given shape, evaluated position
+    by position and vectorized over the grid."""
+    monitor = SimMonitor(name="monitor")
+    monitor.sim.select_model("MotorGaussianModel")
+    grid = np.stack(np.meshgrid(*(np.linspace(-5, 5, size) for size in shape)), axis=-1)
+    positions = grid.reshape(-1, 2)[:10000]
+
+    def per_position():
+        for position in positions:
+            monitor.sim.evaluate_model(position)
+
+    return [
+        ("per position", per_position, len(positions)),
+        (
+            "vectorized grid",
+            lambda: monitor.sim.evaluate_model(grid),
+            grid.shape[0] * grid.shape[1],
+        ),
+    ]
+
+
+BENCHMARKS = {
+    "camera_grid": benchmark_camera_grid,
+    "camera_template": benchmark_camera_template,
+    "camera_burst": benchmark_camera_burst,
+    "camera_noise": benchmark_camera_noise,
+    "camera_workers": benchmark_camera_workers,
+    "camera_movie_bank": benchmark_camera_movie_bank,
+    "camera_events": benchmark_camera_events,
+    "camera_readout": benchmark_camera_readout,
+    "camera_poisson_approximation": benchmark_camera_poisson_approximation,
+    "waveform_poisson_approximation": benchmark_waveform_poisson_approximation,
+    "monitor_model": benchmark_monitor_model,
+    "monitor_startup": benchmark_monitor_startup,
+    "monitor_scan": benchmark_monitor_scan,
+    "monitor_grid": benchmark_monitor_grid,
+}
+
+
+def run_benchmark(name: str, shape: tuple[int, int], repeat: int) -> PrettyTable:
+    """Run a benchmark and return the results as a table.
+
+    Args:
+        name (str): Name of the benchmark, must be a key of BENCHMARKS.
+        shape (tuple): Shape of the simulated data.
+        repeat (int): Number of repetitions.
+    """
+    table = PrettyTable()
+    table.title = f"{name}, shape={tuple(shape)}, repeat={repeat}"
+    table.field_names = ["Variant", "Frames [1/s]", "Speedup", "Peak memory per call [MB]"]
+    reference = None
+    for variant, func, frames_per_call in BENCHMARKS[name](shape):
+        rate = frames_per_call * _rate(func, repeat)
+        peak = _peak_memory(func)
+        reference = reference or rate
+        table.add_row([variant, f"{rate:.2f}", f"{rate / reference:.2f}x", f"{peak:.2f}"])
+    return table
+
+
+def run_encoding_benchmark(shape: tuple[int, int], repeat: int) -> PrettyTable:
+    """Compare the size and the encode and decode rates of device messages for each array
+    encoding, with a simulated waveform of prod(shape) // 16 samples and a camera frame.
+
+    Encoding includes the serialization of the message, decoding its deserialization.
+
+    Args:
+        shape (tuple): Shape of the camera frame.
+        repeat (int): Number of repetitions.
+    """
+    waveform = SimWaveform(name="waveform")
+    waveform.waveform_shape.put(int(np.prod(shape)) // 16)
+    waveform.sim.params = {"noise": NoiseType.POISSON}
+    camera = _make_camera(shape)
+    camera.sim.params = {"noise": NoiseType.POISSON}
+    payloads = {
+        f"waveform {waveform.waveform.get().shape}": waveform.waveform.get(),
+        f"image {camera.image.get().shape}": camera.image.get(),
+    }
+    table = PrettyTable()
+    table.title = f"array_encoding, repeat={repeat}"
+    table.field_names = [
+        "Payload",
+        "Encoding",
+        "Message size [kB]",
+        "Ratio",
+        "Encode [1/s]",
+        "Decode [1/s]",
+    ]
+    for payload, value in payloads.items():
+        signals = {"data": {"value": value, "timestamp": time.time()}}
+        reference = None
+        for encoding in ArrayEncoding:
+
+            def encode(encoding=encoding):
+                msg = messages.DeviceMessage(signals=encode_signals(signals, encoding=encoding))
+                return MsgpackSerialization.dumps(msg)
+
+            serialized = encode()
+
+            def decode(serialized=serialized):
+                return decode_signals(MsgpackSerialization.loads(serialized).signals)
+
+            reference = reference or len(serialized)
+            table.add_row(
+                [
+                    payload,
+                    encoding.value,
+                    f"{len(serialized) / 1e3:.1f}",
+                    f"{reference / len(serialized):.2f}x",
+                    f"{_rate(encode, repeat):.1f}",
+                    f"{_rate(decode, repeat):.1f}",
+                ]
+            )
+    return table
+
+
+def launch() -> None:
+    """Launch the benchmarks."""
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description="Benchmark the simulated devices of ophyd_devices.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        choices=[*BENCHMARKS, "array_encoding"],
+        nargs="+",
+        default=[*BENCHMARKS, "array_encoding"],
+        help="benchmarks to run",
+    )
+    parser.add_argument("--shape", type=int, nargs="+", default=[1024, 1024], help="data shape")
+    parser.add_argument("--repeat", type=int, default=20, help="number of repetitions")
+    args = parser.parse_args()
+    for name in args.benchmark:
+        if name == "array_encoding":
+            print(run_encoding_benchmark(tuple(args.shape), args.repeat))
+        else:
+            print(run_benchmark(name, tuple(args.shape), args.repeat))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    launch()
@@ -1,5 +1,10 @@
 """Simulated 2D camera device"""
 
+import threading
+import time
+from functools import partial
+
+import h5py
 import numpy as np
 from bec_lib.logger import bec_logger
 from ophyd import Component as Cpt
@@ -8,11 +13,121 @@ from ophyd import Device, Kind, StatusBase
 from ophyd_devices.interfaces.base_classes.psi_device_base import PSIDeviceBase
 from ophyd_devices.sim.sim_data import SimulatedDataCamera
 from ophyd_devices.sim.sim_signals import ReadOnlySignal, SetableSignal
-from ophyd_devices.sim.sim_utils import H5Writer
+from ophyd_devices.sim.sim_utils import FrameBufferPool, FramePrefetcher, H5Writer, SharedFrameRing
+from ophyd_devices.utils.psi_device_base_utils import PreviewHandler
 
 logger = bec_logger.logger
 
 
+class SimCameraRoi(Device):
+    """Region of interest of a simulated camera, with statistics of the latest burst.
+
+    The region is given in pixels of the frame as (x, y, width, height), with x the column and
+    y the row of its first pixel. A width or height of 0 disables the ROI. The statistics are
+    updated when frames are published, without reading the image signal. Only enabled ROIs
+    are read and hinted.
+
+    The statistics cover all frames of a burst: roi_sum is the sum over the region of all
+    frames, mean the mean per pixel and frame, roi_max the maximum pixel of all frames and
+    the centroid is the one of the frames summed over the burst.
+    """
+
+    region = Cpt(SetableSignal, name="region", value=(0, 0, 0, 0), kind=Kind.config)
+    roi_sum = Cpt(SetableSignal, name="roi_sum", value=0.0, kind=Kind.omitted)
+    mean = Cpt(SetableSignal, name="mean", value=0.0, kind=Kind.omitted)
+    roi_max = Cpt(SetableSignal, name="roi_max", value=0.0, kind=Kind.omitted)
+    centroid_x = Cpt(SetableSignal, name="centroid_x", value=0.0, kind=Kind.omitted)
+    centroid_y = Cpt(SetableSignal, name="centroid_y", value=0.0, kind=Kind.omitted)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.region.subscribe(self._update_kind, run=False)
+        self._update_kind(self.region.get())
+
+    @property
+    def enabled(self) -> bool:
+        """True if the region has a non-zero width and height."""
+        _, _, width, height = self.region.get()
+        return width > 0 and height > 0
+
+    def _update_kind(self, value: tuple, **kwargs) -> None:
+        """Read and hint the statistics of the ROI only while it is enabled."""
+        _, _, width, height = value
+        kind = Kind.hinted if width > 0 and height > 0 else Kind.omitted
+        for signal in (self.roi_sum, self.mean, self.roi_max, self.centroid_x, self.centroid_y):
+            signal.kind = kind
+
+    def _get_bounds(self, shape: tuple) -> tuple[int, int, int, int] | None:
+        """Return the bounds (x0, x1, y0, y1) of the region clipped to the frame, None if empty."""
+        x, y, width, height = (int(entry) for entry in self.region.get())
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(shape[1], x + width), min(shape[0], y + height)
+        if width <= 0 or height <= 0 or x1 <= x0 or y1 <= y0:
+            return None
+        return x0, x1, y0, y1
+
+    def update(self, frames: np.ndarray | list[np.ndarray]) -> None:
+        """Compute the statistics of the region over a burst of dense frames.
+
+        Args:
+            frames (np.ndarray | list[np.ndarray]): Frames with shape (rows, columns).
+        """
+        bounds = self._get_bounds(frames[0].shape)
+        if bounds is None:
+            return
+        x0, x1, y0, y1 = bounds
+        columns = np.zeros(x1 - x0)
+        rows = np.zeros(y1 - y0)
+        maximum = -np.inf
+        for frame in frames:
+            roi = frame[y0:y1, x0:x1]
+            columns += roi.sum(axis=0, dtype=np.float64)
+            rows += roi.sum(axis=1, dtype=np.float64)
+            maximum = max(maximum, roi.max())
+        self._put_stats(
+            total=columns.sum(),
+            area=len(frames) * (x1 - x0) * (y1 - y0),
+            maximum=maximum,
+            weighted_x=columns @ np.arange(x0, x1),
+            weighted_y=rows @ np.arange(y0, y1),
+        )
+
+    def update_from_events(
+        self, events: dict[str, np.ndarray], shape: tuple, frames: int = 1
+    ) -> None:
+        """Compute the statistics of the region from the photon events of a burst.
+
+        Args:
+            events (dict): Arrays x, y and count of the events of all frames.
+            shape (tuple): Shape of a frame.
+            frames (int): Number of frames of the burst.
+        """
+        bounds = self._get_bounds(shape)
+        if bounds is None:
+            return
+        x0, x1, y0, y1 = bounds
+        x, y = events["x"], events["y"]
+        inside = (x >= x0) & (x < x1) & (y >= y0) & (y < y1)
+        counts = events["count"][inside].astype(np.float64)
+        self._put_stats(
+            total=counts.sum(),
+            area=frames * (x1 - x0) * (y1 - y0),
+            maximum=counts.max() if counts.size else 0.0,
+            weighted_x=counts @ x[inside],
+            weighted_y=counts @ y[inside],
+        )
+
+    def _put_stats(
+        self, total: float, area: int, maximum: float, weighted_x: float, weighted_y: float
+    ) -> None:
+        """Put the statistics to the signals, the centroid is nan for an empty region."""
+        self.roi_sum.put(float(total))
+        self.mean.put(float(total) / area)
+        self.roi_max.put(float(maximum))
+        self.centroid_x.put(float(weighted_x / total) if total else np.nan)
+        self.centroid_y.put(float(weighted_y / total) if total else np.nan)
+
+
 class SimCameraControl(Device):
     """SimCamera Control layer"""
 
@@ -23,6 +138,8 @@ class SimCameraControl(Device):
     BIT_DEPTH = np.uint16
 
     SUB_MONITOR = "device_monitor_2d"
+    SUB_SHARED_FRAME = "shared_frame"
+    SUB_EVENTS = "photon_events"
     _default_sub = SUB_MONITOR
 
     exp_time = Cpt(SetableSignal, name="exp_time", value=1, kind=Kind.config)
@@ -39,6 +156,62 @@ class SimCameraControl(Device):
         kind=Kind.omitted,
     )
     write_to_disk = Cpt(SetableSignal, name="write_to_disk", value=False, kind=Kind.config)
+    # Hardware region of interest read out from the full frame, as (x, y) offset and
+    # (width, height) size in pixels, a size of 0 extends to the edge of the frame.
+    # Binning sums binning x binning pixels into one. Only the read out pixels are simulated.
+    readout_offset = Cpt(SetableSignal, name="readout_offset", value=(0, 0), kind=Kind.config)
+    readout_size = Cpt(SetableSignal, name="readout_size", value=(0, 0), kind=Kind.config)
+    binning = Cpt(SetableSignal, name="binning", value=1, kind=Kind.config)
+
+    # Number of frames precomputed in the background, 0 disables prefetching
+    prefetch_frames = Cpt(SetableSignal, name="prefetch_frames", value=0, kind=Kind.config)
+    prefetch_hits = Cpt(SetableSignal, name="prefetch_hits", value=0, kind=Kind.omitted)
+    prefetch_misses = Cpt(SetableSignal, name="prefetch_misses", value=0, kind=Kind.omitted)
+    prefetch_refill_lag = Cpt(
+        SetableSignal, name="prefetch_refill_lag", value=0.0, kind=Kind.omitted
+    )
+    # Number of threads rendering the tiles of a frame, 1 renders in the calling thread
+    render_workers = Cpt(SetableSignal, name="render_workers", value=1, kind=Kind.config)
+    # Number of slots of the shared memory ring frames are handed to other processes with,
+    # 0 disables the shared memory handoff
+    shared_memory_slots = Cpt(SetableSignal, name="shared_memory_slots", value=0, kind=Kind.config)
+    shared_memory_name = Cpt(SetableSignal, name="shared_memory_name", value="", kind=Kind.omitted)
+    # Number of reusable frame buffers, 0 allocates a new buffer for every trigger
+    frame_pool_size = Cpt(SetableSignal, name="frame_pool_size", value=0, kind=Kind.config)
+    frame_pool_in_use = Cpt(SetableSignal, name="frame_pool_in_use", value=0, kind=Kind.omitted)
+    frame_pool_exhausted = Cpt(
+        SetableSignal, name="frame_pool_exhausted", value=0, kind=Kind.omitted
+    )
+    # Number of frames of the movie bank prepared on stage, which triggers cycle through.
+    # The frames are loaded from movie_bank_file if it is set, otherwise they are simulated.
+    movie_bank_frames = Cpt(SetableSignal, name="movie_bank_frames", value=0, kind=Kind.config)
+    movie_bank_file = Cpt(SetableSignal, name="movie_bank_file", value="", kind=Kind.config)
+
+    # Period in seconds of the free-running acquisition between kickoff and complete,
+    # 0 disables free-running
+    frame_period = Cpt(SetableSignal, name="frame_period", value=0.0, kind=Kind.config)
+    frame_number = Cpt(SetableSignal, name="frame_number", value=-1, kind=Kind.omitted)
+    dropped_frames = Cpt(SetableSignal, name="dropped_frames", value=0, kind=Kind.omitted)
+    late_frames = Cpt(SetableSignal, name="late_frames", value=0, kind=Kind.omitted)
+
+    # Publish frames as sparse photon events (x, y, count) instead of dense images
+    sparse_events = Cpt(SetableSignal, name="sparse_events", value=False, kind=Kind.config)
+
+    # Maximum rate in Hz of the preview on SUB_MONITOR, 0 publishes every frame,
+    # and number of pixels along each axis averaged into one preview pixel
+    preview_rate = Cpt(SetableSignal, name="preview_rate", value=0.0, kind=Kind.config)
+    preview_binning = Cpt(SetableSignal, name="preview_binning", value=1, kind=Kind.config)
+    preview_dropped = Cpt(SetableSignal, name="preview_dropped", value=0, kind=Kind.omitted)
+
+    # Regions of interest with statistics of the latest frame
+    roi1 = Cpt(SimCameraRoi, name="roi1")
+    roi2 = Cpt(SimCameraRoi, name="roi2")
+    roi3 = Cpt(SimCameraRoi, name="roi3")
+    roi4 = Cpt(SimCameraRoi, name="roi4")
+
+    # Dataset of the frames and group of the photon events in h5 files, as written by SimCamera
+    H5_ENTRY = "/entry/data/data"
+    H5_EVENT_ENTRY = "/entry/data/events"
 
     def __init__(self, name, *, parent=None, sim_init: dict = None, device_manager=None, **kwargs):
         self.sim_init = sim_init
@@ -46,10 +219,190 @@ class SimCameraControl(Device):
         self._registered_proxies = {}
         self.sim = self.sim_cls(parent=self, **kwargs)
         self.h5_writer = H5Writer()
+        self.shared_ring = None
+        self._held_frame = None
+        self.movie_bank = None
+        self._movie_bank_index = 0
         super().__init__(name=name, parent=parent, **kwargs)
+        self.prefetcher = FramePrefetcher(
+            produce=lambda: self.sim.prefetch_frame(signal_name=self.image.name),
+            generation=lambda: self.sim.generation,
+        )
+        self.prefetch_frames.subscribe(self._update_prefetcher, run=False)
+        self.render_workers.subscribe(self._update_render_workers, run=False)
+        self.shared_memory_slots.subscribe(self._close_shared_ring, run=False)
+        self.frame_pool = FrameBufferPool(dtype=self.BIT_DEPTH)
+        self.frame_pool_size.subscribe(self._update_frame_pool, run=False)
+        self.preview = PreviewHandler(parent=self, sub_type=self.SUB_MONITOR)
+        self.preview_rate.subscribe(self._update_preview, run=False)
+        self.preview_binning.subscribe(self._update_preview, run=False)
         if self.sim_init:
             self.sim.set_init(self.sim_init)
 
+    def _update_prefetcher(self, value: int, **kwargs) -> None:
+        """Start, resize or stop the prefetching of frames."""
+        self.prefetcher.start(size=int(value))
+
+    def _update_render_workers(self, value: int, **kwargs) -> None:
+        """Set the number of threads rendering the tiles of a frame."""
+        self.sim.render_workers = max(1, int(value))
+
+    def _update_frame_pool(self, **kwargs) -> None:
+        """Resize the frame buffer pool to the pool size and the shape of the rendered frames."""
+        self.frame_pool.resize(
+            size=int(self.frame_pool_size.get()),
+            shape=self.sim.get_frame_shape(),
+            dtype=self.BIT_DEPTH,
+        )
+        self._update_frame_pool_stats()
+
+    def _update_preview(self, **kwargs) -> None:
+        """Apply the preview rate and binning."""
+        self.preview.configure(max_rate=self.preview_rate.get(), binning=self.preview_binning.get())
+
+    @property
+    def rois(self) -> list[SimCameraRoi]:
+        """Regions of interest of the camera."""
+        return [self.roi1, self.roi2, self.roi3, self.roi4]
+
+    def _update_frame_pool_stats(self) -> None:
+        """Publish the occupancy and the exhaustion events of the frame buffer pool."""
+        self.frame_pool_in_use.put(self.frame_pool.in_use)
+        self.frame_pool_exhausted.put(self.frame_pool.exhausted)
+
+    def _release_frames(self, data: list[np.ndarray] | np.ndarray) -> None:
+        """Return the frames of a trigger to the frame buffer pool.
+
+        The last frame is referenced by sim_state and is only returned after the next trigger.
+
+        Args:
+            data (list[np.ndarray] | np.ndarray): Frames checked out for the trigger.
+        """
+        held, self._held_frame = self._held_frame, data[-1]
+        released = list(data[:-1])
+        if held is not None:
+            released.append(held)
+        self.frame_pool.release(released)
+
+    def _close_shared_ring(self, **kwargs) -> None:
+        """Release the shared memory ring, it is recreated with the new size on the next frame."""
+        if self.shared_ring is not None:
+            self.shared_ring.close()
+            self.shared_ring = None
+            self.shared_memory_name.put("")
+
+    def _publish_shared_frames(self, data: np.ndarray) -> None:
+        """Write frames into the shared memory ring and publish their descriptors on SUB_SHARED_FRAME.
+
+        Consumers in other processes attach to the ring with SharedFrameRing.attach and read
+        the frames of the descriptors. The ring is (re)allocated if frames do not fit its slots.
+
+        Args:
+            data (np.ndarray): Stack of frames.
+        """
+        slots = int(self.shared_memory_slots.get())
+        if slots <= 0:
+            return
+        if self.shared_ring is not None and not self.shared_ring.fits(data[0]):
+            self._close_shared_ring()
+        if self.shared_ring is None:
+            self.shared_ring = SharedFrameRing(slots=slots, slot_nbytes=data[0].nbytes)
+            self.shared_memory_name.put(self.shared_ring.name)
+        for frame in data:
+            descriptor = self.shared_ring.write(frame)
+            # pylint: disable=protected-access
+            self._run_subs(sub_type=self.SUB_SHARED_FRAME, value=descriptor)
+
+    def prepare_movie_bank(self) -> None:
+        """Prepare the movie bank if movie_bank_frames or movie_bank_file is set, drop it otherwise.
+
+        Without a file, movie_bank_frames frames are simulated with the current model, noise and
+        hot pixels. A file is either a .npy file or an h5 file with the frames in H5_ENTRY, of
+        which the first movie_bank_frames frames are loaded, all frames if it is 0.
+        """
+        num_frames = int(self.movie_bank_frames.get())
+        file_path = self.movie_bank_file.get()
+        self.movie_bank = None
+        self._movie_bank_index = 0
+        if file_path:
+            if file_path.endswith(".npy"):
+                bank = np.load(file_path, mmap_mode="r")
+                bank = bank[:num_frames] if num_frames > 0 else bank
+            else:
+                with h5py.File(file_path, mode="r") as h5_file:
+                    dataset = h5_file[self.H5_ENTRY]
+                    bank = dataset[:num_frames] if num_frames > 0 else dataset[()]
+            bank = np.asarray(bank, dtype=self.BIT_DEPTH)
+            if bank.ndim == 2:
+                bank = bank[np.newaxis]
+        elif num_frames > 0:
+            bank = self.sim.compute_burst(signal_name=self.image.name, burst=num_frames)
+        else:
+            return
+        bank.flags.writeable = False
+        self.movie_bank = bank
+
+    def _acquire_movie_bank_frames(self, burst: int) -> list[np.ndarray]:
+        """Return the next frames of the movie bank, as read-only views without a copy.
+
+        Args:
+            burst (int): Number of frames.
+        """
+        num_frames = len(self.movie_bank)
+        start = self._movie_bank_index
+        self._movie_bank_index = (start + burst) % num_frames
+        frames = [self.movie_bank[(start + index) % num_frames] for index in range(burst)]
+        self.sim.update_sim_state(self.image.name, frames[-1])
+        return frames
+
+    def _acquire_frames(self, burst: int) -> np.ndarray | list[np.ndarray]:
+        """Acquire a burst of frames, served from the prefetch ring if it is enabled.
+
+        Frames missing in the ring are computed on the fly. Without prefetching, frames are
+        rendered into buffers of the frame buffer pool if it is enabled, which have to be
+        released with _release_frames. A prepared movie bank takes precedence over both.
+
+        Args:
+            burst (int): Number of frames.
+
+        Returns:
+            np.ndarray | list[np.ndarray]: Stack or list of frames with shape frame_shape.
+        """
+        if self.movie_bank is not None:
+            return self._acquire_movie_bank_frames(burst)
+        if not self.prefetcher.running:
+            if self.frame_pool.size and self.sim.get_active_proxy(self.image.name) is None:
+                # The pool follows changes of the image shape and the model
+                self._update_frame_pool()
+                return self.sim.compute_burst(
+                    signal_name=self.image.name, burst=burst, out=self.frame_pool.checkout(burst)
+                )
+            return self.sim.compute_burst(signal_name=self.image.name, burst=burst)
+        if self.sim.get_active_proxy(self.image.name) is not None:
+            self.prefetcher.flush()
+            return self.sim.compute_burst(signal_name=self.image.name, burst=burst)
+        frames = [self.prefetcher.pop() for _ in range(burst)]
+        num_missing = sum(frame is None for frame in frames)
+        if num_missing:
+            computed = iter(self.sim.compute_burst(signal_name=self.image.name, burst=num_missing))
+            frames = [frame if frame is not None else next(computed) for frame in frames]
+        self.prefetch_hits.put(self.prefetcher.hits)
+        self.prefetch_misses.put(self.prefetcher.misses)
+        self.prefetch_refill_lag.put(self.prefetcher.refill_lag)
+        return np.stack(frames)
+
+    def destroy(self) -> None:
+        """Stop the prefetching of frames, release the shared memory and destroy the device."""
+        self.prefetcher.stop()
+        self.preview.shutdown()
+        self._close_shared_ring()
+        super().destroy()
+
+    def read(self):
+        """Read the device, computing each simulated signal at most once."""
+        with self.sim.read_cycle():
+            return super().read()
+
     @property
     def registered_proxies(self) -> None:
         """Dictionary of registered signal_names and proxies."""
@@ -77,6 +430,124 @@ class SimCamera(PSIDeviceBase, SimCameraControl):
     def __init__(self, name: str, scan_info=None, device_manager=None, **kwargs):
         super().__init__(name=name, scan_info=scan_info, device_manager=device_manager, **kwargs)
         self.file_path = None
+        self._free_run_thread = None
+        self._free_run_stop = threading.Event()
+
+    def _publish_frames(self, data: np.ndarray | list[np.ndarray]) -> None:
+        """Publish acquired frames to subscribers, the shared memory ring and the H5Writer.
+
+        Args:
+            data (np.ndarray | list[np.ndarray]): Frames returned by _acquire_frames.
+        """
+        for roi in self.rois:
+            roi.update(data)
+        # Pooled buffers are reused before a rate-limited preview is published
+        copy = self.frame_pool.size > 0 and self.preview.max_rate > 0
+        for frame in data:
+            self.preview.update(frame.copy() if copy else frame)
+        self.preview_dropped.put(self.preview.dropped)
+        self._publish_shared_frames(data)
+        if self.write_to_disk.get():
+            self.frame_pool.retain(data)
+            self.h5_writer.receive_data(
+                data, stacked=True, release=partial(self.frame_pool.release, data)
+            )
+        self._release_frames(data)
+        self._update_frame_pool_stats()
+
+    def _publish_events(self, burst: int) -> None:
+        """Sample frames as photon events and publish them on SUB_EVENTS and to the H5Writer.
+
+        Args:
+            burst (int): Number of frames.
+        """
+        rois = [roi for roi in self.rois if roi.enabled]
+        burst_events = []
+        for _ in range(burst):
+            events = self.sim.compute_events(signal_name=self.image.name)
+            if rois:
+                burst_events.append(events)
+            # pylint: disable=protected-access
+            self._run_subs(sub_type=self.SUB_EVENTS, value=events)
+            if self.write_to_disk.get():
+                self.h5_writer.receive_events(events)
+        if rois:
+            events = {
+                key: np.concatenate([entry[key] for entry in burst_events])
+                for key in ("x", "y", "count")
+            }
+            shape = self.sim.get_frame_shape()
+            for roi in rois:
+                roi.update_from_events(events, shape=shape, frames=burst)
+
+    def _acquire_and_publish(self, burst: int) -> None:
+        """Acquire and publish a burst of frames, as dense images or as sparse photon events."""
+        if self.sparse_events.get():
+            self._publish_events(burst)
+        else:
+            self._publish_frames(self._acquire_frames(burst=burst))
+
+    @property
+    def h5_entry(self) -> str:
+        """Location of the data in the h5 file, depending on the output mode."""
+        return self.H5_EVENT_ENTRY if self.sparse_events.get() else self.H5_ENTRY
+
+    def _start_free_run(self) -> None:
+        """Start the timer thread of the free-running acquisition, if frame_period is set."""
+        self._stop_free_run()
+        period = float(self.frame_period.get())
+        if period <= 0:
+            return
+        self.frame_number.put(-1)
+        self.dropped_frames.put(0)
+        self.late_frames.put(0)
+        self._free_run_stop.clear()
+        self._free_run_thread = threading.Thread(
+            target=self._free_run, args=(period,), name=f"{self.name}_free_run", daemon=True
+        )
+        self._free_run_thread.start()
+
+    def _stop_free_run(self) -> None:
+        """Stop the free-running acquisition and wait for the frame in flight."""
+        self._free_run_stop.set()
+        if self._free_run_thread is not None:
+            if self._free_run_thread is not threading.current_thread():
+                self._free_run_thread.join()
+            self._free_run_thread = None
+
+    def _free_run(self, period: float) -> None:
+        """Acquire and publish one frame per period, like a detector streaming at a fixed rate.
+
+        Frame n is due at the end of its exposure, i.e. (n + 1) periods after the start. A frame
+        that is published more than one period after it was due is counted as late. If consumers
+        block the loop for longer than a period, frames whose slot has passed are dropped and
+        their numbers skipped, so frame numbers increase monotonically with gaps.
+
+        Args:
+            period (float): Frame period in seconds.
+        """
+        start = time.monotonic()
+        frame_number = 0
+        while True:
+            due = start + (frame_number + 1) * period
+            if self._free_run_stop.wait(max(0.0, due - time.monotonic())):
+                return
+            self.frame_number.put(frame_number)
+            try:
+                self._acquire_and_publish(burst=1)
+            # pylint: disable=broad-except
+            except Exception:
+                logger.exception(f"Free-running acquisition of {self.name} failed.")
+                return
+            now = time.monotonic()
+            if now > due + period:
+                self.late_frames.put(self.late_frames.get() + 1)
+            # Frames due in the meantime, except the most recent one, are lost
+            latest_due = int((now - start) / period) - 1
+            dropped = max(0, latest_due - frame_number - 1)
+            if dropped:
+                self.dropped_frames.put(self.dropped_frames.get() + dropped)
+            frame_number += 1 + dropped
 
     def on_trigger(self) -> StatusBase:
         """Trigger the camera to acquire images.
@@ -89,12 +560,7 @@ class SimCamera(PSIDeviceBase, SimCameraControl):
 
         def trigger_cam() -> None:
             """Trigger the camera to acquire images."""
-            for _ in range(self.burst.get()):
-                data = self.image.get()
-                # pylint: disable=protected-access
-                self._run_subs(sub_type=self.SUB_MONITOR, value=data)
-                if self.write_to_disk.get():
-                    self.h5_writer.receive_data(data)
+            self._acquire_and_publish(burst=self.burst.get())
 
         status = self.task_handler.submit_task(trigger_cam)
         return status
@@ -117,19 +583,25 @@ class SimCamera(PSIDeviceBase, SimCameraControl):
         ).wait()
         self.exp_time.set(self.scan_info.msg.scan_parameters["exp_time"]).wait()
         self.burst.set(self.scan_info.msg.scan_parameters["frames_per_trigger"]).wait()
+        self.prepare_movie_bank()
         if self.write_to_disk.get():
-            self.h5_writer.on_stage(file_path=self.file_path, h5_entry="/entry/data/data")
+            self.h5_writer.on_stage(file_path=self.file_path, h5_entry=self.h5_entry)
             # pylint: disable=protected-access
             self._run_subs(
                 sub_type=self.SUB_FILE_EVENT,
                 file_path=self.file_path,
                 done=False,
                 successful=False,
-                hinted_location={"data": "/entry/data/data"},
+                hinted_location={"data": self.h5_entry},
             )
 
+    def on_kickoff(self) -> None:
+        """Start the free-running acquisition if frame_period is set."""
+        self._start_free_run()
+
     def on_complete(self) -> StatusBase:
         """Complete the motion of the simulated device."""
+        self._stop_free_run()
 
         if not self.write_to_disk.get():
             return None
@@ -137,12 +609,13 @@ class SimCamera(PSIDeviceBase, SimCameraControl):
         def complete_cam():
             """Complete the camera acquisition."""
             self.h5_writer.on_complete()
+            self._update_frame_pool_stats()
             self._run_subs(
                 sub_type=self.SUB_FILE_EVENT,
                 file_path=self.file_path,
                 done=True,
                 successful=True,
-                hinted_location={"data": "/entry/data/data"},
+                hinted_location={"data": self.h5_entry},
             )
 
         status = self.task_handler.submit_task(complete_cam)
@@ -150,6 +623,8 @@ class SimCamera(PSIDeviceBase, SimCameraControl):
 
     def on_unstage(self) -> None:
         """Unstage the camera device."""
+        self._stop_free_run()
+        self.movie_bank = None
         if self.write_to_disk.get():
             self.h5_writer.on_unstage()
 
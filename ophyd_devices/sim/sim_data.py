@@ -2,18 +2,34 @@ from __future__ import annotations
 
 import enum
 import inspect
+import threading
 import time as ttime
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
+from functools import partial
+from typing import Callable
 
 import numpy as np
+from asteval import Interpreter
 from bec_lib import bec_logger
 from lmfit import Model, models
 from prettytable import PrettyTable
 
 logger = bec_logger.logger
 
+# Root of the random streams of all simulated devices, each device spawns an independent child
+_ROOT_SEED_SEQUENCE = np.random.SeedSequence()
+_ROOT_SEED_SEQUENCE_LOCK = threading.Lock()
+
+
+def spawn_seed_sequence() -> np.random.SeedSequence:
+    """Spawn an independent seed sequence from the root sequence of the simulation."""
+    with _ROOT_SEED_SEQUENCE_LOCK:
+        return _ROOT_SEED_SEQUENCE.spawn(1)[0]
+
 
 class SimulatedDataException(Exception):
     """Exception raised when there is an issue with the simulated data."""
@@ -27,11 +43,19 @@ class SimulationType2D(str, enum.Enum):
 
 
 class NoiseType(str, enum.Enum):
-    """Type of noise to add to simulated data."""
+    """Type of noise to add to simulated data.
+
+    NORMAL and NOISE_BANK are fast approximations of POISSON for large frames and waveforms.
+    Counts below a threshold are drawn exactly, counts above from a normal distribution with
+    the same mean and variance. NOISE_BANK takes the normal samples from shifted slices of a
+    cached noise bank instead of drawing them for every frame.
+    """
 
     NONE = "none"
     UNIFORM = "uniform"
     POISSON = "poisson"
+    NORMAL = "normal"
+    NOISE_BANK = "noise_bank"
 
 
 class HotPixelType(str, enum.Enum):
@@ -41,6 +65,37 @@ class HotPixelType(str, enum.Enum):
     FLUCTUATING = "fluctuating"
 
 
+# Number of pixels for which Poisson noise is drawn at once
+POISSON_BLOCK_SIZE = 2**16
+
+# Mean count above which Poisson noise is approximated by a normal distribution
+NORMAL_APPROXIMATION_THRESHOLD = 100
+
+# Number of standard normal samples in the noise bank of NoiseType.NOISE_BANK
+NOISE_BANK_SIZE = 2**20
+
+# Number of pixels per tile of a frame. Frames are split into tiles of whole rows, each with its
+# own random stream, so that the result for a fixed seed does not depend on the number of workers.
+RENDER_TILE_SIZE = 2**18
+
+_RENDER_POOLS: dict[int, ThreadPoolExecutor] = {}
+_RENDER_POOLS_LOCK = threading.Lock()
+
+
+def get_render_pool(workers: int) -> ThreadPoolExecutor:
+    """Return the thread pool shared by all simulated devices rendering with the given number of workers.
+
+    Args:
+        workers (int): Number of worker threads.
+    """
+    with _RENDER_POOLS_LOCK:
+        pool = _RENDER_POOLS.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sim_render")
+            _RENDER_POOLS[workers] = pool
+        return pool
+
+
 DEFAULT_PARAMS_LMFIT = {
     "c0": 1,
     "c1": 1,
@@ -102,25 +157,115 @@ class SimulatedDataBase(ABC):
         self._model = {}
         self._model_params = None
         self._params = {}
+        self.rng = np.random.default_rng(spawn_seed_sequence())
+        self.normal_threshold = NORMAL_APPROXIMATION_THRESHOLD
+        self._noise_bank: np.ndarray | None = None
+        self._shape_generation = 0
+        self._read_lock = threading.RLock()
+        self._read_cycle = threading.local()
+
+    def set_seed(self, seed: int | None = None) -> None:
+        """Reseed the random number generator of the simulation.
+
+        Args:
+            seed (int | None): Seed for the generator. If None, a new independent stream is spawned.
+        """
+        seed_sequence = spawn_seed_sequence() if seed is None else np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(seed_sequence)
+        self._noise_bank = None
+
+    def _draw_poisson_approximation(
+        self, lam: np.ndarray, out: np.ndarray, rng: np.random.Generator, noise: NoiseType
+    ) -> np.ndarray:
+        """Draw approximately Poisson distributed counts with lam as mean into out.
+
+        Counts with a mean below self.normal_threshold are drawn exactly, all others are
+        rounded samples of a normal distribution with mean and variance lam. For
+        NoiseType.NOISE_BANK, the standard normal samples are a slice of the noise bank at a
+        random shift, see _get_noise_bank.
+
+        Args:
+            lam (np.ndarray): Mean counts, broadcast to the shape of out.
+            out (np.ndarray): Float output array.
+            rng (np.random.Generator): Generator to draw from.
+            noise (NoiseType): NoiseType.NORMAL or NoiseType.NOISE_BANK.
+        Returns:
+            np.ndarray: out
+        """
+        lam = np.broadcast_to(lam, out.shape)
+        high = lam >= self.normal_threshold
+        num_high = int(np.count_nonzero(high))
+        if num_high == 0:
+            out[...] = rng.poisson(lam)
+            return out
+        if noise == NoiseType.NOISE_BANK:
+            start = rng.integers(NOISE_BANK_SIZE)
+            normal = self._get_noise_bank(num_high)[start : start + num_high]
+        else:
+            normal = rng.standard_normal(num_high, dtype=np.float32)
+        if num_high == out.size:
+            np.sqrt(lam, out=out)
+            out *= normal.reshape(out.shape)
+            out += lam
+            return np.rint(out, out=out)
+        low = ~high
+        out[low] = rng.poisson(lam[low])
+        lam = lam[high]
+        out[high] = np.rint(lam + np.sqrt(lam) * normal)
+        return out
+
+    def _get_noise_bank(self, size: int) -> np.ndarray:
+        """Return the cached bank of standard normal samples of NoiseType.NOISE_BANK.
+
+        The bank holds NOISE_BANK_SIZE float32 samples drawn once from self.rng, repeated
+        periodically to at least NOISE_BANK_SIZE + size samples, so that any slice of size
+        samples starting within the first NOISE_BANK_SIZE samples is contiguous.
+        Samples of different frames are only independent as long as their shifts differ.
+
+        Args:
+            size (int): Largest number of samples taken at once.
+        """
+        bank = self._noise_bank
+        if bank is None:
+            bank = self.rng.standard_normal(NOISE_BANK_SIZE, dtype=np.float32)
+        if bank.size < NOISE_BANK_SIZE + size:
+            bank = np.resize(bank[:NOISE_BANK_SIZE], NOISE_BANK_SIZE + size)
+        self._noise_bank = bank
+        return bank
 
     def execute_simulation_method(self, *args, method=None, signal_name: str = "", **kwargs) -> any:
         """
         Execute either the provided method or reroutes the method execution
         to a device proxy in case it is registered in self.parent.registered_proxies.
         """
+        sim_proxy = self.get_active_proxy(signal_name)
+        if sim_proxy is not None:
+            method = sim_proxy.obj.lookup[self.parent.name]["method"]
+            args = sim_proxy.obj.lookup[self.parent.name]["args"]
+            kwargs = sim_proxy.obj.lookup[self.parent.name]["kwargs"]
+
+        if method is not None:
+            return method(*args, **kwargs)
+        raise SimulatedDataException(f"Method {method} is not available for {self.parent.name}")
+
+    def get_active_proxy(self, signal_name: str) -> any:
+        """
+        Get the enabled device proxy registered for the given signal.
+
+        Args:
+            signal_name (str): Name of the signal.
+
+        Returns:
+            any: Device container of the proxy from the device_manager, or None if no proxy is active.
+        """
         if self.registered_proxies and self.parent.device_manager:
             for proxy_name, signal in self.registered_proxies.items():
                 if signal == signal_name or f"{self.parent.name}_{signal}" == signal_name:
                     sim_proxy = self.parent.device_manager.devices.get(proxy_name, None)
                     if sim_proxy and sim_proxy.enabled is True:
-                        method = sim_proxy.obj.lookup[self.parent.name]["method"]
-                        args = sim_proxy.obj.lookup[self.parent.name]["args"]
-                        kwargs = sim_proxy.obj.lookup[self.parent.name]["kwargs"]
-                    break
-
-        if method is not None:
-            return method(*args, **kwargs)
-        raise SimulatedDataException(f"Method {method} is not available for {self.parent.name}")
+                        return sim_proxy
+                    return None
+        return None
 
     def select_model(self, model: str) -> None:
         """
@@ -135,6 +280,26 @@ class SimulatedDataBase(ABC):
         self._model = model_cls() if callable(model_cls) else model_cls
         self._params = self.get_params_for_model_cls()
         self._params.update(self._get_additional_params())
+        self._invalidate_cache()
+        # The shape of computed signals may depend on the model
+        self._shape_generation += 1
+
+    @property
+    def shape_generation(self) -> int:
+        """Counter that increases whenever the shape of computed signals may change, e.g.
+        when the image shape or the model change. Cached descriptions of older generations
+        are outdated."""
+        return self._shape_generation
+
+    def get_signal_shape(self, signal_name: str) -> tuple | None:
+        """Return the shape of the value a signal computes, without computing it.
+
+        Args:
+            signal_name (str): Name of the signal.
+        Returns:
+            tuple | None: Shape of the computed value, None if it is given by the stored value.
+        """
+        return None
 
     @property
     def params(self) -> dict:
@@ -154,19 +319,43 @@ class SimulatedDataBase(ABC):
     def params(self, params: dict):
         """
         Method to set the parameters for the active simulation model.
+
+        The parameters are applied all at once, if any of them is invalid the previous
+        parameters are restored and the exception is raised.
         """
-        for k, v in params.items():
-            if k in self.params:
-                if k == "noise":
-                    self._params[k] = NoiseType(v)
-                elif k == "hot_pixel_types":
-                    self._params[k] = [HotPixelType(entry) for entry in v]
+        previous = dict(self._params)
+        model_params = self._model_params if isinstance(self._model, Model) else {}
+        previous_model = {k: parameter.value for k, parameter in model_params.items()}
+        try:
+            for k, v in params.items():
+                if k in self.params:
+                    if k == "noise":
+                        self._params[k] = NoiseType(v)
+                    elif k == "hot_pixel_types":
+                        if isinstance(v, str):
+                            self._params[k] = HotPixelType(v)
+                        else:
+                            self._params[k] = [HotPixelType(entry) for entry in v]
+                    else:
+                        self._params[k] = v
+                    if k in model_params:
+                        model_params[k].value = v
                 else:
-                    self._params[k] = v
-                if isinstance(self._model, Model) and k in self._model_params:
-                    self._model_params[k].value = v
-            else:
-                raise SimulatedDataException(f"Parameter {k} not found in {self.params}.")
+                    raise SimulatedDataException(f"Parameter {k} not found in {self.params}.")
+            self._invalidate_cache()
+        except Exception:
+            self._params.clear()
+            self._params.update(previous)
+            for k, value in previous_model.items():
+                model_params[k].value = value
+            self._invalidate_cache()
+            raise
+
+    def _invalidate_cache(self) -> None:
+        """Invalidate precomputed simulation data, called whenever model or parameters change.
+
+        The base class does not cache any data, subclasses may override this method.
+        """
 
     def get_models(self) -> list:
         """
@@ -181,8 +370,49 @@ class SimulatedDataBase(ABC):
             signal_name (str): Name of the signal to update.
             value (any): Value to update in the simulated state.
         """
-        self.sim_state[signal_name]["value"] = value
-        self.sim_state[signal_name]["timestamp"] = ttime.time()
+        # Replace the entry as a whole, so readers never pair a value with another timestamp
+        self.sim_state[signal_name] = {"value": value, "timestamp": ttime.time()}
+
+    @contextmanager
+    def read_cycle(self):
+        """Memoize the states of computed signals within one read of the parent device.
+
+        Signals read repeatedly within the context, e.g. the hinted and normal components of a
+        device, are computed once. Nested contexts share the memo of the outermost one.
+
+        >>> with sim.read_cycle():
+        ...     reading = device.read()
+        """
+        if getattr(self._read_cycle, "memo", None) is not None:
+            yield
+            return
+        self._read_cycle.memo = {}
+        try:
+            yield
+        finally:
+            self._read_cycle.memo = None
+
+    def read_sim_state(self, signal_name: str, compute_readback: bool) -> dict:
+        """Compute the state of a signal once and return it.
+
+        Value and timestamp of the returned state belong to the same evaluation. Within a
+        read_cycle, the state is computed on the first read of the signal only.
+
+        Args:
+            signal_name (str): Name of the signal.
+            compute_readback (bool): Whether to compute a new value.
+        Returns:
+            dict: State of the signal, i.e. {"value": value, "timestamp": timestamp}.
+        """
+        memo = getattr(self._read_cycle, "memo", None)
+        if memo is not None and signal_name in memo:
+            return memo[signal_name]
+        with self._read_lock:
+            self.compute_sim_state(signal_name=signal_name, compute_readback=compute_readback)
+            state = self.sim_state[signal_name]
+        if memo is not None:
+            memo[signal_name] = state
+        return state
 
     @abstractmethod
     def _get_additional_params(self) -> dict:
@@ -259,12 +489,15 @@ class SimulatedDataBase(ABC):
         table._min_table_width = width
         print(table)
 
-    def set_init(self, sim_init: dict["model", "params"]) -> None:
+    def set_init(self, sim_init: dict["model", "params", "seed"]) -> None:
         """Set the initial simulation parameters.
 
         Args:
-            sim_init (dict["model"]): Dictionary to initiate parameters of the simulation.
+            sim_init (dict["model", "params", "seed"]): Dictionary to initiate parameters of the simulation.
+                The optional seed makes the random stream of the device reproducible.
         """
+        if "seed" in sim_init:
+            self.set_seed(sim_init["seed"])
         self.select_model(sim_init.get("model"))
         self.params = sim_init.get("params", {})
 
@@ -302,25 +535,191 @@ class SimulatedPositioner(SimulatedDataBase):
         The position is updated by the parent device, and readback/setpoint values
         have a jitter/tolerance introduced directly in the parent class (SimPositioner).
         """
-        self.sim_state[signal_name].update({"timestamp": ttime.time()})
+        self.sim_state[signal_name] = {**self.sim_state[signal_name], "timestamp": ttime.time()}
         if compute_readback:
             method = None
             value = self.execute_simulation_method(method=method, signal_name=signal_name)
             self.update_sim_state(signal_name, value)
 
 
+class MotorModel(ABC):
+    """Model of a monitor driven by the positions of several reference motors.
+
+    Positions are given as array of shape (..., n_motors), with the motors in the order of
+    the ref_motors parameter. The compiled model is vectorized, so the same callable serves a
+    single position of shape (n_motors,) and arrays of positions, e.g. a grid, alike.
+    """
+
+    DEFAULT_PARAMS: dict = {}
+
+    @abstractmethod
+    def compile(self, params: dict) -> Callable[[np.ndarray], np.ndarray]:
+        """Bind the model to the parameters.
+
+        Args:
+            params (dict): Parameters of the simulation, including ref_motors.
+        Returns:
+            Callable: Numpy callable of the positions x, returning an array of shape (...).
+        """
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}>"
+
+
+def _get_peak_arrays(peaks: list[dict], num_motors: int) -> tuple[np.ndarray, ...]:
+    """Return amplitudes (K,), centers (K, n) and sigmas (K, n) of K gaussian peaks.
+
+    Raises:
+        ValueError: If center or sigma of a peak do not match the number of motors.
+    """
+    amplitudes = np.array([peak["amplitude"] for peak in peaks], dtype=float)
+    centers = np.array([np.broadcast_to(peak["center"], num_motors) for peak in peaks], float)
+    sigmas = np.array([np.broadcast_to(peak["sigma"], num_motors) for peak in peaks], float)
+    return amplitudes, centers, sigmas
+
+
+def _gaussian_peaks(
+    x: np.ndarray, amplitudes: np.ndarray, centers: np.ndarray, sigmas: np.ndarray
+) -> np.ndarray:
+    """Sum of axis-aligned gaussian peaks with the given heights at positions x (..., n)."""
+    x = np.asarray(x, dtype=float)[..., None, :]
+    exponent = np.sum(((x - centers) / sigmas) ** 2, axis=-1)
+    return np.sum(amplitudes * np.exp(-0.5 * exponent), axis=-1)
+
+
+class MotorGaussianModel(MotorModel):
+    """Gaussian peak over the reference motors, e.g. the 2D response of a mesh scan.
+
+    The amplitude is the height of the peak, center and sigma have one entry per motor.
+    """
+
+    DEFAULT_PARAMS = {
+        "ref_motors": ["samx", "samy"],
+        "amplitude": 100,
+        "center": [0, 0],
+        "sigma": [1, 1],
+    }
+
+    def compile(self, params: dict) -> Callable[[np.ndarray], np.ndarray]:
+        try:
+            amplitudes, centers, sigmas = _get_peak_arrays([params], len(params["ref_motors"]))
+        except ValueError as exc:
+            raise SimulatedDataException(
+                f"Center and sigma need one entry per motor of {params['ref_motors']}."
+            ) from exc
+        return partial(_gaussian_peaks, amplitudes=amplitudes, centers=centers, sigmas=sigmas)
+
+
+class MotorPeaksModel(MotorModel):
+    """Sum of gaussian peaks over the reference motors.
+
+    Each peak is a dictionary with amplitude (height), center and sigma, the latter with one
+    entry per motor.
+    """
+
+    DEFAULT_PARAMS = {
+        "ref_motors": ["samx", "samy"],
+        "peaks": [
+            {"amplitude": 100, "center": [-2, -2], "sigma": [1, 1]},
+            {"amplitude": 50, "center": [2, 1], "sigma": [0.5, 2]},
+        ],
+    }
+
+    def compile(self, params: dict) -> Callable[[np.ndarray], np.ndarray]:
+        try:
+            amplitudes, centers, sigmas = _get_peak_arrays(
+                params["peaks"], len(params["ref_motors"])
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise SimulatedDataException(
+                "Peaks need an amplitude, and a center and sigma with one entry per motor of"
+                f" {params['ref_motors']}."
+            ) from exc
+        return partial(_gaussian_peaks, amplitudes=amplitudes, centers=centers, sigmas=sigmas)
+
+
+class MotorExpressionModel(MotorModel):
+    """Numpy expression over the reference motors, with the motors referenced by name.
+
+    The expression is evaluated safely by asteval, all numpy functions are available.
+
+    >>> monitor.sim.select_model("MotorExpressionModel")
+    >>> monitor.sim.params = {"ref_motors": ["samx", "samy"], "expression": "sin(samx) * samy"}
+    """
+
+    DEFAULT_PARAMS = {
+        "ref_motors": ["samx", "samy"],
+        "expression": "100 * exp(-(samx**2 + samy**2) / 2)",
+    }
+
+    def compile(self, params: dict) -> Callable[[np.ndarray], np.ndarray]:
+        motors = list(params["ref_motors"])
+        interpreter = Interpreter()
+        try:
+            node = interpreter.parse(params["expression"])
+        except SyntaxError as exc:
+            raise SimulatedDataException(f"Invalid expression {params['expression']}.") from exc
+        # The interpreter holds the positions in its symbol table
+        lock = threading.Lock()
+
+        def evaluate(x: np.ndarray) -> np.ndarray:
+            x = np.asarray(x, dtype=float)
+            with lock:
+                for ii, motor in enumerate(motors):
+                    interpreter.symtable[motor] = x[..., ii]
+                value = interpreter.run(node, with_raise=True)
+            # Constant expressions are broadcast to the shape of the positions
+            return np.broadcast_to(np.asarray(value, dtype=float), x.shape[:-1])
+
+        try:
+            evaluate(np.zeros(len(motors)))
+        except Exception as exc:
+            raise SimulatedDataException(
+                f"Expression {params['expression']} can not be evaluated for motors {motors}."
+            ) from exc
+        return evaluate
+
+
+# Models of several reference motors, available for monitors
+MOTOR_MODELS = {
+    model_cls.__name__: model_cls
+    for model_cls in (MotorGaussianModel, MotorPeaksModel, MotorExpressionModel)
+}
+
+
 class SimulatedDataMonitor(SimulatedDataBase):
     """Simulated data class for a monitor."""
 
+    # Models of several reference motors, in addition to the lmfit models
+    motor_models = MOTOR_MODELS
+    # Lookups of the available models per class, built on first use and shared by all instances
+    _model_lookups: dict[type, dict] = {}
+    _model_lookups_lock = threading.Lock()
+
     def __init__(self, *args, parent=None, **kwargs) -> None:
-        self._model_lookup = self.init_lmfit_models()
+        self._model_lookup = self.get_model_lookup()
         super().__init__(*args, parent=parent, **kwargs)
         self.bit_depth = self.parent.BIT_DEPTH
+        # Evaluate the model with the compiled callable, False falls back to lmfit
+        self.use_compiled_model = True
+        self._compiled_model: Callable | None = None
+        # Precompute the readbacks for the planned positions of step scans, see prepare_scan
+        self.precompute_scan = False
+        # Maximum deviation of the reference motors from a planned position to serve its readback
+        self.scan_tolerance = 0.5
+        self._scan_motors: list[str] = []
+        self._scan_positions: np.ndarray | None = None
+        self._scan_ref_positions: np.ndarray | None = None
+        self._scan_values: np.ndarray | None = None
+        self._scan_burst = 1
+        self._scan_point = 0
         self._init_default()
 
     def _get_additional_params(self) -> None:
         params = deepcopy(DEFAULT_PARAMS_NOISE)
-        params.update(deepcopy(DEFAULT_PARAMS_MOTOR))
+        # Models of several motors define their ref_motors themselves
+        if not isinstance(self._model, MotorModel):
+            params.update(deepcopy(DEFAULT_PARAMS_MOTOR))
         return params
 
     def _init_default(self) -> None:
@@ -356,6 +755,9 @@ class SimulatedDataMonitor(SimulatedDataBase):
         Returns:
             dict: {name: value} for the active simulation model.
         """
+        if isinstance(self._model, MotorModel):
+            self._model_params = None
+            return deepcopy(self._model.DEFAULT_PARAMS)
         rtr = {}
         params = self._model.make_params()
         for name, parameter in params.items():
@@ -371,11 +773,201 @@ class SimulatedDataMonitor(SimulatedDataBase):
         self._model_params = params
         return rtr
 
+    def _invalidate_cache(self) -> None:
+        """Rebind the parameter values of the compiled model, called whenever model or
+        parameters change."""
+        super()._invalidate_cache()
+        self._compile_model()
+        # Planned readbacks are evaluated again on the next point
+        self._scan_values = None
+
+    def _compile_model(self) -> None:
+        """Compile the active model into a plain numpy callable of x.
+
+        The model function of lmfit is bound to the current parameter values and options, so
+        evaluating it skips the parameter handling of Model.eval. Models of several motors
+        are always compiled, invalid parameters raise a SimulatedDataException and are
+        restored by the params setter.
+        """
+        if isinstance(self._model, MotorModel):
+            self._compiled_model = self._model.compile(self.params)
+            return
+        self._compiled_model = None
+        if not isinstance(self._model, Model) or "x" not in self._model.independent_vars:
+            return
+        funcargs = self._model.make_funcargs(self._model_params)
+        # Further independent variables, e.g. the form of a StepModel, need a default value
+        if all(var in funcargs for var in self._model.independent_vars if var != "x"):
+            self._compiled_model = partial(self._model.func, **funcargs)
+
+    def _eval_model(self, x: float | np.ndarray) -> float | np.ndarray:
+        """Evaluate the active model at x.
+
+        Args:
+            x (float | np.ndarray): Independent variable, i.e. the position of the reference
+                motor, or positions of shape (..., n_motors) for models of several motors.
+        Returns:
+            float | np.ndarray: Value of the model.
+        """
+        if isinstance(self._model, MotorModel) or (
+            self.use_compiled_model and self._compiled_model is not None
+        ):
+            return self._compiled_model(x=x)
+        return self._model.eval(params=self._model_params, x=x)
+
+    def evaluate_model(self, positions: np.ndarray) -> np.ndarray:
+        """Evaluate the active model vectorized over positions of the reference motors,
+        without noise, e.g. to precompute a grid or the readbacks along a fly scan.
+
+        Args:
+            positions (np.ndarray): Positions of the reference motor, with shape (...), or
+                of the reference motors with shape (..., n_motors) for models of several
+                motors, in the order of the ref_motors parameter.
+        Returns:
+            np.ndarray: Values of the model with shape (...).
+        """
+        positions = np.asarray(positions, dtype=float)
+        shape = positions.shape[:-1] if isinstance(self._model, MotorModel) else positions.shape
+        return np.broadcast_to(np.asarray(self._eval_model(positions), dtype=float), shape)
+
+    def set_init(
+        self, sim_init: dict["model", "params", "seed", "precompute_scan", "scan_tolerance"]
+    ) -> None:
+        """Set the initial simulation parameters.
+
+        Args:
+            sim_init (dict["model", "params", "seed", "precompute_scan", "scan_tolerance"]):
+                Dictionary to initiate parameters of the simulation. The optional
+                precompute_scan and scan_tolerance configure the planned readbacks of step
+                scans, see prepare_scan.
+        """
+        super().set_init(sim_init)
+        self.precompute_scan = bool(sim_init.get("precompute_scan", self.precompute_scan))
+        self.scan_tolerance = float(sim_init.get("scan_tolerance", self.scan_tolerance))
+
+    def get_ref_motors(self) -> list[str]:
+        """Return the names of the reference motors of the active model."""
+        if isinstance(self._model, MotorModel):
+            return list(self.params["ref_motors"])
+        return [self.params["ref_motor"]]
+
+    def prepare_scan(self, scan_msg) -> None:
+        """Plan the readbacks for the positions of the reference motors in a step scan.
+
+        If precompute_scan is set and the reference motors are scan motors, the model is
+        evaluated vectorized over their planned positions on the first point. The computed
+        readbacks then serve the points of the scan, with noise drawn per point. Devices with
+        a current_trigger signal serve the point of the trigger without reading the motors,
+        others serve the planned point at the live position of the reference motors, see
+        _get_scan_index. Reads off the plan are evaluated live.
+
+        Args:
+            scan_msg (ScanStatusMessage): Scan status message of the upcoming scan.
+        """
+        self.clear_scan()
+        if not self.precompute_scan or scan_msg is None:
+            return
+        info = scan_msg.info or {}
+        motors = list(info.get("scan_motors") or [])
+        positions = info.get("positions")
+        if not motors or positions is None:
+            return
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim != 2 or not positions.size or positions.shape[1] != len(motors):
+            return
+        self._scan_motors = motors
+        self._scan_positions = positions
+        # Points are repeated for bursts at each position
+        num_points = scan_msg.num_points or len(positions)
+        self._scan_burst = max(num_points // len(positions), 1)
+
+    def clear_scan(self) -> None:
+        """Discard the planned readbacks, the model is evaluated live again."""
+        self._scan_motors = []
+        self._scan_positions = None
+        self._scan_ref_positions = None
+        self._scan_values = None
+        self._scan_burst = 1
+        self._scan_point = 0
+
+    def _get_scan_values(self) -> np.ndarray | None:
+        """Return the planned, noise-free readbacks of the scan, evaluated on first use.
+
+        Returns:
+            np.ndarray | None: Values of the model at the planned positions, None if no scan
+                is planned or the reference motors are not scan motors.
+        """
+        if self._scan_positions is None:
+            return None
+        if self._scan_values is None:
+            ref_motors = self.get_ref_motors()
+            if not set(ref_motors).issubset(self._scan_motors):
+                return None
+            positions = self._scan_positions[:, [self._scan_motors.index(m) for m in ref_motors]]
+            if not isinstance(self._model, MotorModel):
+                positions = positions[:, 0]
+            self._scan_ref_positions = positions
+            self._scan_values = self.evaluate_model(positions)
+        return self._scan_values
+
+    def _get_scan_index(self, position: float | np.ndarray) -> int | None:
+        """Return the index of the planned point at the live position of the reference motors.
+
+        The last served and the next planned point are checked first, the nearest one is
+        served if the reference motors are within scan_tolerance of it. Otherwise the first of
+        the remaining planned points within scan_tolerance is served, e.g. if the reference
+        motor is the outer axis of a grid scan and repeats its positions. Repeated reads at a
+        position, e.g. for bursts or reads outside of the scan, serve the same point.
+
+        Args:
+            position (float | np.ndarray): Live position of the reference motors.
+        Returns:
+            int | None: Index of the planned point, None if the motors are off the plan.
+        """
+        candidates = self._scan_ref_positions[self._scan_point : self._scan_point + 2]
+        deviation = self._get_deviation(candidates, position)
+        nearest = int(np.argmin(deviation))
+        if deviation[nearest] <= self.scan_tolerance:
+            self._scan_point += nearest
+            return self._scan_point
+        remaining = self._scan_ref_positions[self._scan_point + 2 :]
+        matches = np.flatnonzero(self._get_deviation(remaining, position) <= self.scan_tolerance)
+        if not matches.size:
+            return None
+        self._scan_point += 2 + int(matches[0])
+        return self._scan_point
+
+    @staticmethod
+    def _get_deviation(planned: np.ndarray, position: float | np.ndarray) -> np.ndarray:
+        """Return the largest deviation of the reference motors from each planned position."""
+        deviation = np.abs(planned - position)
+        return deviation.max(axis=-1) if deviation.ndim > 1 else deviation
+
     def model_lookup(self):
         """Get available models from lmfit.models."""
         return self._model_lookup
 
-    def init_lmfit_models(self) -> dict:
+    @classmethod
+    def get_model_lookup(cls) -> dict:
+        """Return the lookup of the available models, from LMFit and cls.motor_models.
+
+        The lookup is built once per class and process, on first use, and shared by all
+        instances of the class. It must not be modified.
+
+        Returns:
+            dictionary of model name : model class pairs for available models.
+        """
+        lookup = SimulatedDataMonitor._model_lookups.get(cls)
+        if lookup is None:
+            with SimulatedDataMonitor._model_lookups_lock:
+                lookup = SimulatedDataMonitor._model_lookups.get(cls)
+                if lookup is None:
+                    lookup = {**cls.init_lmfit_models(), **cls.motor_models}
+                    SimulatedDataMonitor._model_lookups[cls] = lookup
+        return lookup
+
+    @staticmethod
+    def init_lmfit_models() -> dict:
         """
         Get available models from lmfit.models.
 
@@ -416,20 +1008,45 @@ class SimulatedDataMonitor(SimulatedDataBase):
             value = self.bit_depth(np.max(value, 0))
             self.update_sim_state(signal_name, value)
 
+    def _read_motor(self, mot_name: str) -> float:
+        """Read the position of a motor, 0 if it is not available."""
+        if self.parent.device_manager and mot_name in self.parent.device_manager.devices:
+            return self.parent.device_manager.devices[mot_name].obj.read()[mot_name]["value"]
+        return 0
+
+    def _get_motor_position(self) -> float | np.ndarray:
+        """Read the position of the reference motor, or the positions of shape (n_motors,) of
+        the reference motors for models of several motors."""
+        if isinstance(self._model, MotorModel):
+            return np.array([self._read_motor(name) for name in self.get_ref_motors()], float)
+        return self._read_motor(self.params["ref_motor"])
+
     def _compute(self, *args, **kwargs) -> int:
         """
         Compute the return value for given motor position and active model.
+        Planned points of a step scan use the precomputed value, see prepare_scan.
 
         Returns:
             float: Value computed by the active model.
         """
-        mot_name = self.params["ref_motor"]
-        if self.parent.device_manager and mot_name in self.parent.device_manager.devices:
-            motor_pos = self.parent.device_manager.devices[mot_name].obj.read()[mot_name]["value"]
+        values = self._get_scan_values()
+        position = None
+        index = None
+        if values is not None:
+            current_trigger = getattr(self.parent, "current_trigger", None)
+            if current_trigger is not None:
+                # Points are repeated for bursts at each position
+                index = int(current_trigger.get()) // self._scan_burst
+            else:
+                position = self._get_motor_position()
+                index = self._get_scan_index(position)
+        if index is not None and index < len(values):
+            value = values[index]
         else:
-            motor_pos = 0
-        method = self._model
-        value = int(method.eval(params=self._model_params, x=motor_pos))
+            if position is None:
+                position = self._get_motor_position()
+            value = self._eval_model(position)
+        value = int(value)
         return self._add_noise(value, self.params["noise"], self.params["noise_multiplier"])
 
     def _add_noise(self, v: int, noise: NoiseType, noise_multiplier: float) -> int:
@@ -442,12 +1059,13 @@ class SimulatedDataMonitor(SimulatedDataBase):
         Returns:
             int: Value with added noise.
         """
-        if noise == NoiseType.POISSON:
-            v = np.random.poisson(v)
+        if noise in (NoiseType.POISSON, NoiseType.NORMAL, NoiseType.NOISE_BANK):
+            # A single count is drawn exactly, approximations only pay off for arrays
+            v = self.rng.poisson(v)
             return v
         elif noise == NoiseType.UNIFORM:
-            noise = np.ceil(np.random.uniform(0, 1) * noise_multiplier).astype(int)
-            v += noise * (np.random.randint(0, 2) * 2 - 1)
+            noise = np.ceil(self.rng.uniform(0, 1) * noise_multiplier).astype(int)
+            v += noise * (self.rng.integers(0, 2) * 2 - 1)
             return v if v > 0 else 0
         return v
 
@@ -460,10 +1078,38 @@ class SimulatedDataWaveform(SimulatedDataMonitor):
     a simulated waveform for each point.
     """
 
+    # The waveform is computed along its index, not from reference motors
+    motor_models = {}
+
     def _get_additional_params(self) -> None:
         params = deepcopy(DEFAULT_PARAMS_NOISE)
         return params
 
+    def update_sim_state(self, signal_name: str, value: any) -> None:
+        """Update the simulated state of the device.
+
+        A change of the waveform shape changes the shape of the computed waveform.
+
+        Args:
+            signal_name (str): Name of the signal to update.
+            value (any): Value to update in the simulated state.
+        """
+        super().update_sim_state(signal_name, value)
+        if signal_name == f"{getattr(self.parent, 'name', None)}_waveform_shape":
+            self._shape_generation += 1
+
+    def get_signal_shape(self, signal_name: str) -> tuple | None:
+        """Return the shape of the waveform, given by the waveform shape of the parent.
+
+        Args:
+            signal_name (str): Name of the signal.
+        """
+        waveform = getattr(self.parent, "waveform", None)
+        if waveform is None or signal_name != waveform.name:
+            return None
+        size = self.parent.waveform_shape.get()
+        return (size[0] if isinstance(size, (tuple, list)) else size,)
+
     def compute_sim_state(self, signal_name: str, compute_readback: bool) -> None:
         """Update the simulated state of the device.
 
@@ -488,10 +1134,10 @@ class SimulatedDataWaveform(SimulatedDataMonitor):
         """
         size = self.parent.waveform_shape.get()
         size = size[0] if isinstance(size, tuple) else size
-        method = self._model
-        value = method.eval(params=self._model_params, x=np.array(range(size)))
+        # Model.eval returns float arrays, also for integer results of e.g. a LinearModel
+        value = np.asarray(self._eval_model(np.arange(size)), dtype=np.float64)
         # Upscale the normalised gaussian if possible
-        if "amplitude" in method.param_names:
+        if "amplitude" in self._model.param_names:
             value *= self.params["amplitude"] / np.max(value)
         return self._add_noise(value, self.params["noise"], self.params["noise_multiplier"])
 
@@ -503,10 +1149,15 @@ class SimulatedDataWaveform(SimulatedDataMonitor):
             noise (NoiseType): Type of noise to add.
         """
         if noise == NoiseType.POISSON:
-            v = np.random.poisson(np.round(v), v.shape)
+            v = self.rng.poisson(np.round(v), v.shape)
             return v
+        if noise in (NoiseType.NORMAL, NoiseType.NOISE_BANK):
+            v = np.asarray(v, dtype=float)
+            return self._draw_poisson_approximation(
+                v, out=np.empty_like(v), rng=self.rng, noise=noise
+            )
         if noise == NoiseType.UNIFORM:
-            v += np.random.uniform(-noise_multiplier, noise_multiplier, v.shape)
+            v += self.rng.uniform(-noise_multiplier, noise_multiplier, v.shape)
             v[v <= 0] = 0
             return v
         if noise == NoiseType.NONE:
@@ -519,6 +1170,14 @@ class SimulatedDataCamera(SimulatedDataBase):
     def __init__(self, *args, parent=None, **kwargs) -> None:
         self._model_lookup = self.init_2D_models()
         self._all_default_model_params = defaultdict(dict)
+        self._grid_cache: tuple[tuple, np.ndarray] | None = None
+        self._template_cache: tuple[tuple, np.ndarray] | None = None
+        self._hot_pixel_cache: tuple[tuple, tuple] | None = None
+        self._scratch_buffers: dict[str, np.ndarray] = {}
+        self._render_lock = threading.Lock()
+        self._generation = 0
+        self._event_cdf_cache: tuple[np.ndarray, np.ndarray] | None = None
+        self.render_workers = 1
         self._init_default_camera_params()
         super().__init__(*args, parent=parent, **kwargs)
         self.bit_depth = self.parent.BIT_DEPTH
@@ -563,6 +1222,39 @@ class SimulatedDataCamera(SimulatedDataBase):
             }
         )
 
+    def _invalidate_cache(self) -> None:
+        """Invalidate the cached noise-free template of the gaussian beam and the hot pixels."""
+        self._template_cache = None
+        self._hot_pixel_cache = None
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Counter that increases whenever model, parameters or image shape change.
+
+        Precomputed frames of an older generation are outdated.
+        """
+        return self._generation
+
+    def update_sim_state(self, signal_name: str, value: any) -> None:
+        """Update the simulated state of the device.
+
+        A change of the image shape, the hardware ROI or the binning invalidates the cached
+        template.
+
+        Args:
+            signal_name (str): Name of the signal to update.
+            value (any): Value to update in the simulated state.
+        """
+        super().update_sim_state(signal_name, value)
+        parent_name = getattr(self.parent, "name", None)
+        if signal_name in (
+            f"{parent_name}_{entry}"
+            for entry in ("image_shape", "readout_offset", "readout_size", "binning")
+        ):
+            self._invalidate_cache()
+            self._shape_generation += 1
+
     def get_model_cls(self, model: str) -> any:
         """For the simulated positioners, no simulation models are currently implemented."""
         if model not in self._model_lookup:
@@ -606,18 +1298,475 @@ class SimulatedDataCamera(SimulatedDataBase):
             )
         else:
             value = self._compute_empty_image()
-        value = self.bit_depth(value)
+        # No copy if the frame was already rendered with the target dtype
+        value = np.asarray(value, dtype=self.bit_depth)
         self.update_sim_state(signal_name, value)
 
+    def compute_burst(
+        self, signal_name: str, burst: int, out: list[np.ndarray] | None = None
+    ) -> np.ndarray | list[np.ndarray]:
+        """Compute a burst of frames as one stack of shape (burst, *frame_shape).
+
+        The noise-free template is computed once and rendered into a preallocated stack,
+        without going through the simulation stack for each frame. If a device proxy is
+        registered for the signal, frames are computed one by one by the proxy.
+        The last frame is stored in sim_state.
+
+        Args:
+            signal_name (str)   : Name of the signal to compute.
+            burst (int)         : Number of frames to compute.
+            out (list)          : Optional list of burst preallocated frame buffers, e.g. from a
+                                  FrameBufferPool. Frames are rendered into them and out is returned.
+
+        Returns:
+            np.ndarray | list[np.ndarray]: Stack of frames with dtype self.bit_depth, or out.
+        """
+        if self.get_active_proxy(signal_name) is not None:
+            frames = []
+            for _ in range(burst):
+                self.compute_sim_state(signal_name=signal_name, compute_readback=True)
+                frames.append(self.sim_state[signal_name]["value"])
+            if out is None:
+                return np.stack(frames)
+            for buffer, frame in zip(out, frames):
+                np.copyto(buffer, frame, casting="unsafe")
+            return out
+        try:
+            shape = self.parent.image_shape.get()
+            readout = self._get_readout(shape)
+            template = self._get_template(shape, readout=readout)
+            if out is None:
+                v = self._render_frame(
+                    template,
+                    out=np.empty((burst, *template.shape), dtype=self.bit_depth),
+                    readout=readout,
+                )
+            else:
+                v = [self._render_frame(template, out=buffer, readout=readout) for buffer in out]
+        except SimulatedDataException as exc:
+            raise SimulatedDataException(
+                f"Could not compute burst for {self.parent.name} with {exc} raised. Deactivate eiger to continue."
+            ) from exc
+        self.update_sim_state(signal_name, v[-1])
+        return v
+
+    def prefetch_frame(self, signal_name: str) -> np.ndarray | None:
+        """Compute a frame ahead of time, i.e. for the prefetch ring of the camera.
+
+        Args:
+            signal_name (str): Name of the signal to compute.
+
+        Returns:
+            np.ndarray | None: Frame with dtype self.bit_depth, None if a device proxy
+                is active for the signal, as its frames depend on the time of the trigger.
+        """
+        if self.get_active_proxy(signal_name) is not None:
+            return None
+        return self._render_image(self.parent.image_shape.get())
+
+    def compute_events(self, signal_name: str) -> dict[str, np.ndarray]:
+        """Sample a frame as sparse list of photon events instead of a dense image.
+
+        The number of photons is drawn from a Poisson distribution with the integrated template
+        intensity as mean, and each photon hits a pixel with a probability proportional to the
+        template. This is equivalent to Poisson noise per pixel, but the cost scales with the
+        number of photons instead of the number of pixels. Hot pixels are applied to the events
+        like to a dense frame. If a device proxy is active, the dense frame is computed and
+        converted.
+
+        Args:
+            signal_name (str): Name of the image signal.
+
+        Returns:
+            dict: Arrays x (column), y (row) and count of the pixels hit, sorted by pixel.
+        """
+        if self.get_active_proxy(signal_name) is not None:
+            self.compute_sim_state(signal_name=signal_name, compute_readback=True)
+            frame = self.sim_state[signal_name]["value"]
+            y, x = np.nonzero(frame)
+            return {"x": x, "y": y, "count": frame[y, x]}
+        readout = self._get_readout(self.parent.image_shape.get())
+        template = self._get_template(self.parent.image_shape.get(), readout=readout)
+        shape = template.shape
+        with self._render_lock:
+            cdf = self._get_event_cdf(template)
+            total = cdf[-1] if cdf.size else 0.0
+            num_photons = self.rng.poisson(total)
+            hits = np.searchsorted(cdf, self.rng.random(num_photons) * total, side="right")
+        pixels, counts = np.unique(np.minimum(hits, cdf.size - 1), return_counts=True)
+        pixels, counts = self._add_hot_pixel_events(
+            pixels, counts.astype(float), shape, readout=readout
+        )
+        counts = np.clip(counts, 0, self._get_max_value(self.bit_depth)).astype(self.bit_depth)
+        y, x = np.divmod(pixels, shape[1])
+        return {"x": x, "y": y, "count": counts}
+
+    def _get_event_cdf(self, template: np.ndarray) -> np.ndarray:
+        """Return the cumulative intensity of the flattened template, cached per template."""
+        cache = self._event_cdf_cache
+        if cache is not None and cache[0] is template:
+            return cache[1]
+        cdf = np.cumsum(template, axis=None, dtype=np.float64)
+        self._event_cdf_cache = (template, cdf)
+        return cdf
+
+    def _add_hot_pixel_events(
+        self, pixels: np.ndarray, counts: np.ndarray, shape: tuple, readout: tuple | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Apply the hot pixels to sorted flat pixel indices and their counts.
+
+        Constant hot pixels are always set, fluctuating hot pixels only if their count exceeds
+        half of the maximum count, same as for dense frames.
+
+        Args:
+            pixels (np.ndarray): Sorted flat indices of the pixels hit.
+            counts (np.ndarray): Counts of the pixels hit.
+            shape (tuple): Shape of the frame.
+            readout (tuple | None): Read out region of the frame, see _get_readout.
+        """
+        rows, cols, values, fluctuating = self._get_hot_pixel_table(
+            self.params["hot_pixel_coords"],
+            self.params["hot_pixel_types"],
+            self.params["hot_pixel_values"],
+            shape=shape,
+            readout=readout,
+        )
+        if rows.size == 0:
+            return pixels, counts
+        hot = rows * shape[1] + cols
+        if pixels.size:
+            index = np.minimum(np.searchsorted(pixels, hot), pixels.size - 1)
+            present = pixels[index] == hot
+            is_hot = present & (counts[index] > 0.5 * counts.max())
+        else:
+            index = np.zeros(hot.shape, dtype=int)
+            present = is_hot = np.zeros(hot.shape, dtype=bool)
+        counts[index[present & ~fluctuating]] = values[present & ~fluctuating]
+        counts[index[is_hot & fluctuating]] = values[is_hot & fluctuating]
+        missing = ~present & ~fluctuating
+        pixels = np.concatenate([pixels, hot[missing]])
+        counts = np.concatenate([counts, values[missing]])
+        order = np.argsort(pixels, kind="stable")
+        return pixels[order], counts[order]
+
+    @staticmethod
+    def events_to_dense(events: dict[str, np.ndarray], shape: tuple, dtype: np.dtype) -> np.ndarray:
+        """Reconstruct a dense frame from photon events.
+
+        Args:
+            events (dict): Arrays x, y and count, as returned by compute_events.
+            shape (tuple): Shape of the frame.
+            dtype (np.dtype): Dtype of the frame.
+        """
+        frame = np.zeros(shape, dtype=dtype)
+        frame[events["y"], events["x"]] = events["count"]
+        return frame
+
+    def get_frame_shape(self) -> tuple:
+        """Return the shape of the frames rendered for the current image shape, model and
+        read out region, without computing a frame."""
+        shape = self.parent.image_shape.get()
+        readout = self._get_readout(shape)
+        if readout is None:
+            return self._get_sensor_shape(shape)
+        return readout[2], readout[3]
+
+    def get_signal_shape(self, signal_name: str) -> tuple | None:
+        """Return the shape of the frames of the image signal of the parent.
+
+        Args:
+            signal_name (str): Name of the signal.
+        """
+        image = getattr(self.parent, "image", None)
+        if image is None or signal_name != image.name:
+            return None
+        return self.get_frame_shape()
+
+    def _get_sensor_shape(self, shape: tuple) -> tuple[int, int]:
+        """Return the shape of the full frame of the active model for an image shape.
+
+        Frames of the gaussian model have the axes of the image shape swapped.
+
+        Args:
+            shape (tuple): Shape of the image.
+        """
+        if self._model == SimulationType2D.GAUSSIAN:
+            return int(shape[1]), int(shape[0])
+        return int(shape[0]), int(shape[1])
+
+    def _get_readout(self, shape: tuple) -> tuple[int, int, int, int, int] | None:
+        """Return the read out region of the frame, set by the hardware ROI and binning
+        signals of the parent.
+
+        The region is clipped to the full frame, with at least one binned pixel.
+
+        Args:
+            shape (tuple): Shape of the image.
+        Returns:
+            tuple | None: First row and column of the region in pixels of the full frame,
+                number of binned rows and columns and the binning. None for the full frame.
+        """
+        if getattr(self.parent, "readout_offset", None) is None:
+            return None
+        num_rows, num_cols = self._get_sensor_shape(shape)
+        col, row = (int(entry) for entry in self.parent.readout_offset.get())
+        width, height = (int(entry) for entry in self.parent.readout_size.get())
+        row = min(max(row, 0), num_rows - 1)
+        col = min(max(col, 0), num_cols - 1)
+        height = num_rows - row if height <= 0 else min(height, num_rows - row)
+        width = num_cols - col if width <= 0 else min(width, num_cols - col)
+        binning = min(max(int(self.parent.binning.get()), 1), height, width)
+        if (row, col, height, width, binning) == (0, 0, num_rows, num_cols, 1):
+            return None
+        return row, col, height // binning, width // binning, binning
+
+    @staticmethod
+    def _apply_readout(v: np.ndarray, readout: tuple | None) -> np.ndarray:
+        """Crop a full frame to the read out region and sum its binned pixels.
+
+        Args:
+            v (np.ndarray): Full frame.
+            readout (tuple | None): Read out region, see _get_readout.
+        Returns:
+            np.ndarray: Frame with shape (binned rows, binned columns).
+        """
+        if readout is None:
+            return v
+        row, col, num_rows, num_cols, binning = readout
+        region = v[row : row + num_rows * binning, col : col + num_cols * binning]
+        return region.reshape(num_rows, binning, num_cols, binning).sum(axis=(1, 3))
+
+    def _render_image(self, shape: tuple) -> np.ndarray:
+        """Render a frame of the active model for the given image shape and the read out
+        region.
+
+        Args:
+            shape (tuple): Shape of the image.
+        Returns:
+            np.ndarray: Frame with dtype self.bit_depth.
+        """
+        readout = self._get_readout(shape)
+        template = self._get_template(shape, readout=readout)
+        return self._render_frame(
+            template, out=np.empty(template.shape, dtype=self.bit_depth), readout=readout
+        )
+
+    def _get_template(self, shape: tuple, readout: tuple | None = None) -> np.ndarray:
+        """Return the noise-free frame of the active model.
+
+        Args:
+            shape (tuple): Shape of the image.
+            readout (tuple | None): Read out region, see _get_readout. None for the full frame.
+        Returns:
+            np.ndarray: Read-only noise-free frame.
+        """
+        if self._model == SimulationType2D.CONSTANT:
+            amplitude = np.float32(self.params.get("amplitude"))
+            if readout is None:
+                return np.broadcast_to(amplitude, tuple(shape))
+            # Binned pixels sum the counts of binning x binning pixels
+            return np.broadcast_to(amplitude * readout[4] ** 2, readout[2:4])
+        if self._model == SimulationType2D.GAUSSIAN:
+            return self._get_gaussian_template(
+                amp=self.params.get("amplitude"),
+                cov=self.params.get("covariance"),
+                cen_off=self.params.get("center_offset"),
+                shape=shape,
+                readout=readout,
+            )
+        raise SimulatedDataException(
+            f"Model {self._model} not found in {self._model_lookup.keys()}."
+        )
+
+    def _render_frame(
+        self, template: np.ndarray, out: np.ndarray, readout: tuple | None = None
+    ) -> np.ndarray:
+        """Render frames from a noise-free template into a preallocated output array.
+
+        Noise and hot pixels are applied in float32 scratch buffers of the size of one frame,
+        which are reused between frames. The result is clipped to the value range of the
+        dtype of out and written into out. If out is a stack of frames, the template is
+        rendered into each frame of the stack.
+
+        Large frames are split into tiles of rows, see RENDER_TILE_SIZE. Noise and casting are
+        computed per tile, in parallel if self.render_workers is larger than 1. Each tile draws
+        its noise from its own generator, spawned from self.rng for every frame.
+
+        Args:
+            template (np.ndarray): Noise-free frame.
+            out (np.ndarray): Output array, typically with dtype self.bit_depth.
+            readout (tuple | None): Read out region of the template, to which the hot pixels
+                are remapped, see _get_readout.
+        Returns:
+            np.ndarray: out
+        """
+        noise = self.params["noise"]
+        noise_multiplier = self.params["noise_multiplier"]
+        max_value = self._get_max_value(out.dtype)
+        frame_shape = out.shape[-2:]
+        template = np.broadcast_to(template, frame_shape)
+        with self._render_lock:
+            v = self._get_scratch_buffer("frame", frame_shape)
+            noise_buffer = None
+            if noise == NoiseType.UNIFORM:
+                noise_buffer = self._get_scratch_buffer("noise", frame_shape)
+            tiles = self._get_tiles(frame_shape)
+            if noise == NoiseType.NOISE_BANK:
+                # Extend the bank before workers read from it concurrently
+                self._get_noise_bank(max(v[rows].size for rows in tiles))
+            for frame in out.reshape(-1, *frame_shape):
+                rngs = self._spawn_tile_rngs(len(tiles))
+
+                def add_noise(index: int) -> None:
+                    rows = tiles[index]
+                    self._add_tile_noise(
+                        template=template[rows],
+                        v=v[rows],
+                        rng=rngs[index],
+                        noise=noise,
+                        noise_multiplier=noise_multiplier,
+                        noise_buffer=None if noise_buffer is None else noise_buffer[rows],
+                    )
+
+                def cast(index: int) -> None:
+                    rows = tiles[index]
+                    np.clip(v[rows], 0, max_value, out=frame[rows], casting="unsafe")
+
+                self._run_tiles(add_noise, len(tiles))
+                self._add_hot_pixel(
+                    v,
+                    coords=self.params["hot_pixel_coords"],
+                    hot_pixel_types=self.params["hot_pixel_types"],
+                    values=self.params["hot_pixel_values"],
+                    readout=readout,
+                )
+                self._run_tiles(cast, len(tiles))
+        return out
+
+    def _add_tile_noise(
+        self,
+        template: np.ndarray,
+        v: np.ndarray,
+        rng: np.random.Generator,
+        noise: NoiseType,
+        noise_multiplier: float,
+        noise_buffer: np.ndarray | None,
+    ) -> None:
+        """Write the template of a tile with added noise into v.
+
+        Args:
+            template (np.ndarray): Noise-free rows of the tile.
+            v (np.ndarray): Rows of the float32 frame buffer for the tile.
+            rng (np.random.Generator): Generator of the tile.
+            noise (NoiseType): Type of noise.
+            noise_multiplier (float): Amplitude of uniform noise.
+            noise_buffer (np.ndarray | None): Rows of the float32 scratch buffer for uniform noise.
+        """
+        if noise == NoiseType.POISSON:
+            self._draw_poisson(template, out=v, rng=rng)
+            return
+        if noise in (NoiseType.NORMAL, NoiseType.NOISE_BANK):
+            self._draw_poisson_approximation(template, out=v, rng=rng, noise=noise)
+            return
+        np.copyto(v, template, casting="unsafe")
+        if noise == NoiseType.UNIFORM:
+            rng.random(dtype=np.float32, out=noise_buffer)
+            noise_buffer *= 2 * noise_multiplier
+            noise_buffer -= noise_multiplier
+            v += noise_buffer
+
+    def _get_tiles(self, shape: tuple) -> list[slice]:
+        """Split a frame into tiles of whole rows with about RENDER_TILE_SIZE pixels each.
+
+        The tiling only depends on the shape, not on the number of workers.
+
+        Args:
+            shape (tuple): Shape of the frame.
+        Returns:
+            list[slice]: Rows of each tile.
+        """
+        rows = max(1, RENDER_TILE_SIZE // max(1, shape[-1]))
+        return [slice(start, start + rows) for start in range(0, max(1, shape[0]), rows)]
+
+    def _spawn_tile_rngs(self, num_tiles: int) -> list[np.random.Generator]:
+        """Return one generator per tile, derived from self.rng.
+
+        A frame with a single tile draws directly from self.rng.
+
+        Args:
+            num_tiles (int): Number of tiles.
+        """
+        if num_tiles == 1:
+            return [self.rng]
+        seed_sequence = np.random.SeedSequence(self.rng.integers(0, 2**63, size=2))
+        return [np.random.default_rng(seed) for seed in seed_sequence.spawn(num_tiles)]
+
+    def _run_tiles(self, func: Callable[[int], None], num_tiles: int) -> None:
+        """Call func for each tile index, on the shared render pool if more than one worker is configured.
+
+        Args:
+            func (Callable): Function called with the index of the tile.
+            num_tiles (int): Number of tiles.
+        """
+        workers = int(self.render_workers)
+        if workers <= 1 or num_tiles == 1:
+            for index in range(num_tiles):
+                func(index)
+            return
+        # list() waits for all tiles and re-raises exceptions of the workers
+        list(get_render_pool(workers).map(func, range(num_tiles)))
+
+    def _draw_poisson(
+        self, template: np.ndarray, out: np.ndarray, rng: np.random.Generator | None = None
+    ) -> np.ndarray:
+        """Draw Poisson distributed counts with the template as mean into out.
+
+        Counts are drawn in blocks of rows, so that the int64 temporaries of the generator
+        stay small compared to the frame.
+
+        Args:
+            template (np.ndarray): Noise-free frame, broadcast to the shape of out.
+            out (np.ndarray): Output frame.
+            rng (np.random.Generator | None): Generator to draw from, defaults to self.rng.
+        Returns:
+            np.ndarray: out
+        """
+        rng = self.rng if rng is None else rng
+        lam = np.broadcast_to(template, out.shape)
+        rows = max(1, POISSON_BLOCK_SIZE // max(1, out.shape[-1]))
+        for start in range(0, out.shape[0], rows):
+            out[start : start + rows] = rng.poisson(lam[start : start + rows])
+        return out
+
+    def _get_scratch_buffer(self, name: str, shape: tuple) -> np.ndarray:
+        """Return a reusable float32 scratch buffer, reallocated only if the shape changes.
+
+        Args:
+            name (str): Name of the buffer.
+            shape (tuple): Shape of the buffer.
+        """
+        buffer = self._scratch_buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.float32)
+            self._scratch_buffers[name] = buffer
+        return buffer
+
+    @staticmethod
+    def _get_max_value(dtype: np.dtype) -> float | None:
+        """Return the largest value representable by an integer dtype, None otherwise."""
+        dtype = np.dtype(dtype)
+        if np.issubdtype(dtype, np.integer):
+            return np.iinfo(dtype).max
+        return None
+
     def _compute_empty_image(self) -> np.ndarray:
         """Computes return value for sim_type = "empty_image".
 
         Returns:
-            float: 0
+            np.ndarray: Zeros with the shape of the read out region.
         """
         try:
-            shape = self.parent.image_shape.get()
-            return np.zeros(shape)
+            return np.zeros(self.get_frame_shape(), dtype=self.bit_depth)
         except SimulatedDataException as exc:
             raise SimulatedDataException(
                 f"Could not compute empty image for {self.parent.name} with {exc} raised. Deactivate eiger to continue."
@@ -626,55 +1775,164 @@ class SimulatedDataCamera(SimulatedDataBase):
     def _compute_constant(self) -> np.ndarray:
         """Compute a return value for SimulationType2D constant."""
         try:
-            shape = self.parent.image_shape.get()
-            v = self.params.get("amplitude") * np.ones(shape, dtype=np.float32)
-            v = self._add_noise(v, self.params["noise"], self.params["noise_multiplier"])
-            return self._add_hot_pixel(
-                v,
-                coords=self.params["hot_pixel_coords"],
-                hot_pixel_types=self.params["hot_pixel_types"],
-                values=self.params["hot_pixel_values"],
-            )
+            return self._render_image(self.parent.image_shape.get())
         except SimulatedDataException as exc:
             raise SimulatedDataException(
                 f"Could not compute constant for {self.parent.name} with {exc} raised. Deactivate eiger to continue."
             ) from exc
 
-    def _compute_gaussian(self) -> float:
+    def _compute_gaussian(self) -> np.ndarray:
         """Computes return value for sim_type = "gauss".
 
         The value is based on the parameters for the gaussian in
         self._active_params and adds noise based on the noise type.
 
-        If computation fails, it returns 0.
-
-        Returns: float
+        Returns:
+            np.ndarray: Frame with dtype self.bit_depth.
         """
 
         try:
-            amp = self.params.get("amplitude")
-            cov = self.params.get("covariance")
-            cen_off = self.params.get("center_offset")
-            shape = self.sim_state[self.parent.image_shape.name]["value"]
-            pos, offset, cov, amp = self._prepare_params_gauss(
-                amp=amp, cov=cov, offset=cen_off, shape=shape
-            )
-
-            v = self._compute_multivariate_gaussian(pos=pos, cen_off=offset, cov=cov, amp=amp)
-            v = self._add_noise(
-                v, noise=self.params["noise"], noise_multiplier=self.params["noise_multiplier"]
-            )
-            return self._add_hot_pixel(
-                v,
-                coords=self.params["hot_pixel_coords"],
-                hot_pixel_types=self.params["hot_pixel_types"],
-                values=self.params["hot_pixel_values"],
-            )
+            return self._render_image(self.sim_state[self.parent.image_shape.name]["value"])
         except SimulatedDataException as exc:
             raise SimulatedDataException(
                 f"Could not compute gaussian for {self.parent.name} with {exc} raised. Deactivate eiger to continue."
             ) from exc
 
+    def _get_gaussian_template(
+        self,
+        amp: float,
+        cov: np.ndarray | list,
+        cen_off: np.ndarray | list,
+        shape: tuple,
+        readout: tuple | None = None,
+    ) -> np.ndarray:
+        """Return the noise-free gaussian beam, computed only if its parameters changed.
+
+        The template is cached and keyed on amplitude, covariance, center offset, shape and
+        read out region. It is stored as read-only float32 array, callers have to copy it
+        before adding noise or hot pixels.
+
+        Args:
+            amp (float): Amplitude of the gaussian.
+            cov (np.ndarray | list): Covariance matrix of the gaussian.
+            cen_off (np.ndarray | list): Offset from the center of the image.
+            shape (tuple): Shape of the image.
+            readout (tuple | None): Read out region, see _get_readout. None for the full frame.
+        Returns:
+            np.ndarray: Read-only noise-free gaussian with dtype float32.
+        """
+        cov = np.asarray(cov, dtype=float)
+        cen_off = np.asarray(cen_off, dtype=float)
+        shape = tuple(int(entry) for entry in shape)
+        key = (
+            float(amp),
+            cov.shape,
+            cov.tobytes(),
+            cen_off.shape,
+            cen_off.tobytes(),
+            shape,
+            readout,
+        )
+        template_cache = self._template_cache
+        if template_cache is not None and template_cache[0] == key:
+            return template_cache[1]
+        if readout is not None:
+            v = self._compute_readout_gaussian(
+                amp=amp, cov=cov, cen_off=cen_off, shape=shape, readout=readout
+            )
+        elif self._is_separable(cov):
+            # Avoid building the full coordinate grid for axis-aligned gaussians
+            x, y = self._get_position_axes(shape)
+            v = self._compute_separable_gaussian(x=x, y=y, cen_off=cen_off, cov=cov, amp=amp)
+        else:
+            pos, offset, cov, amp = self._prepare_params_gauss(
+                amp=amp, cov=cov, offset=cen_off, shape=shape
+            )
+            v = np.empty(pos.shape[:-1])
+            tiles = self._get_tiles(v.shape)
+
+            def evaluate(index: int) -> None:
+                rows = tiles[index]
+                v[rows] = self._compute_gaussian_density(pos=pos[rows], cen_off=offset, cov=cov)
+
+            self._run_tiles(evaluate, len(tiles))
+            v *= amp / np.max(v)
+        v = v.astype(np.float32)
+        v.flags.writeable = False
+        self._template_cache = (key, v)
+        return v
+
+    def _compute_readout_gaussian(
+        self, amp: float, cov: np.ndarray, cen_off: np.ndarray, shape: tuple, readout: tuple
+    ) -> np.ndarray:
+        """Compute the gaussian beam only on the binned pixels of the read out region.
+
+        The gaussian is scaled to the amplitude on the full frame, so the region matches the
+        same region of the full frame. Binned pixels sum the counts of their pixels. For an
+        axis-aligned gaussian, the sums are exact, as they factorize into sums along each axis.
+        Otherwise, the gaussian is evaluated at the center of each binned pixel.
+
+        Args:
+            amp (float): Amplitude of the gaussian.
+            cov (np.ndarray): Covariance matrix of the gaussian.
+            cen_off (np.ndarray): Offset from the center of the image.
+            shape (tuple): Shape of the image.
+            readout (tuple): Read out region, see _get_readout.
+        Returns:
+            np.ndarray: Gaussian with shape (binned rows, binned columns).
+        """
+        row, col, num_rows, num_cols, binning = readout
+        x, y = self._get_position_axes(shape)
+
+        def bin_axis(axis: np.ndarray, start: int, num: int) -> np.ndarray:
+            return axis[start : start + num * binning].reshape(num, binning)
+
+        if self._is_separable(cov):
+            gauss_x = np.exp(-((x - cen_off[0]) ** 2) / (2 * cov[0, 0]))
+            gauss_y = np.exp(-((y - cen_off[1]) ** 2) / (2 * cov[1, 1]))
+            gauss_x = bin_axis(gauss_x / np.max(gauss_x), col, num_cols).sum(axis=1)
+            gauss_y = bin_axis(gauss_y * (amp / np.max(gauss_y)), row, num_rows).sum(axis=1)
+            return np.outer(gauss_y, gauss_x)
+        pos = np.empty((num_rows, num_cols, 2))
+        pos[:, :, 0] = bin_axis(x, col, num_cols).mean(axis=1)
+        pos[:, :, 1] = bin_axis(y, row, num_rows).mean(axis=1)[:, None]
+        v = np.empty((num_rows, num_cols))
+        tiles = self._get_tiles(v.shape)
+
+        def evaluate(index: int) -> None:
+            rows = tiles[index]
+            v[rows] = self._compute_gaussian_density(pos=pos[rows], cen_off=cen_off, cov=cov)
+
+        self._run_tiles(evaluate, len(tiles))
+        v *= amp * binning**2 / self._get_gaussian_grid_max(x=x, y=y, cen_off=cen_off, cov=cov)
+        return v
+
+    def _get_gaussian_grid_max(
+        self, x: np.ndarray, y: np.ndarray, cen_off: np.ndarray, cov: np.ndarray
+    ) -> float:
+        """Return the maximum of the gaussian density on the full grid spanned by x and y.
+
+        Along each row, the exponent is a parabola in x, so the maximum of the row is at one
+        of the two grid points next to the vertex. This needs O(H) instead of O(H*W)
+        evaluations.
+
+        Args:
+            x (np.ndarray): Increasing positions along the second image axis.
+            y (np.ndarray): Positions along the first image axis.
+            cen_off (np.ndarray): Center of the gaussian.
+            cov (np.ndarray): Covariance matrix of the gaussian.
+        """
+        cov_inv = np.linalg.inv(cov)
+        vertex = cen_off[0] - (cov_inv[0, 1] + cov_inv[1, 0]) * (y - cen_off[1]) / (
+            2 * cov_inv[0, 0]
+        )
+        index = np.searchsorted(x, vertex)
+        pos = np.empty((2, len(y), 2))
+        pos[0, :, 0] = x[np.clip(index - 1, 0, len(x) - 1)]
+        pos[1, :, 0] = x[np.clip(index, 0, len(x) - 1)]
+        pos[:, :, 1] = y
+        return float(np.max(self._compute_gaussian_density(pos=pos, cen_off=cen_off, cov=cov)))
+
     def _compute_multivariate_gaussian(
         self, pos: np.ndarray | list, cen_off: np.ndarray | list, cov: np.ndarray | list, amp: float
     ) -> np.ndarray:
@@ -694,6 +1952,28 @@ class SimulatedDataCamera(SimulatedDataBase):
             cen_off = np.array(cen_off)
         if isinstance(cov, list):
             cov = np.array(cov)
+        if pos.ndim == 3 and self._is_separable(cov):
+            return self._compute_separable_gaussian(
+                x=pos[0, :, 0], y=pos[:, 0, 1], cen_off=cen_off, cov=cov, amp=amp
+            )
+        v = self._compute_gaussian_density(pos=pos, cen_off=cen_off, cov=cov)
+        v *= amp / np.max(v)
+        return v
+
+    @staticmethod
+    def _compute_gaussian_density(
+        pos: np.ndarray, cen_off: np.ndarray, cov: np.ndarray
+    ) -> np.ndarray:
+        """Computes the multivariate Gaussian probability density, without scaling to the amplitude.
+
+        Args:
+            pos (np.ndarray): Positions, the last axis holds the coordinates.
+            cen_off (np.ndarray): Center of the gaussian.
+            cov (np.ndarray): Covariance matrix of the gaussian.
+
+        Returns:
+            np.ndarray: Probability density at each position.
+        """
         dim = cen_off.shape[0]
         cov_det = np.linalg.det(cov)
         cov_inv = np.linalg.inv(cov)
@@ -701,9 +1981,40 @@ class SimulatedDataCamera(SimulatedDataBase):
         # This einsum call calculates (x-mu)T.Sigma-1.(x-mu) in a vectorized
         # way across all the input variables.
         fac = np.einsum("...k,kl,...l->...", pos - cen_off, cov_inv, pos - cen_off)
-        v = np.exp(-fac / 2) / norm
-        v *= amp / np.max(v)
-        return v
+        return np.exp(-fac / 2) / norm
+
+    @staticmethod
+    def _is_separable(cov: np.ndarray) -> bool:
+        """Check if the covariance matrix describes an axis-aligned 2D gaussian.
+
+        Args:
+            cov (np.ndarray): Covariance matrix of the gaussian.
+        Returns:
+            bool: True if the covariance matrix is 2x2 and diagonal.
+        """
+        return cov.shape == (2, 2) and cov[0, 1] == 0 and cov[1, 0] == 0
+
+    def _compute_separable_gaussian(
+        self, x: np.ndarray, y: np.ndarray, cen_off: np.ndarray, cov: np.ndarray, amp: float
+    ) -> np.ndarray:
+        """Computes an axis-aligned 2D gaussian as outer product of two 1D gaussians.
+
+        This needs O(H+W) instead of O(H*W) exponentials. The result is identical
+        to _compute_multivariate_gaussian for a diagonal covariance matrix.
+
+        Args:
+            x (np.ndarray): Positions along the second image axis.
+            y (np.ndarray): Positions along the first image axis.
+            cen_off (np.ndarray): Offset from center of image for the gaussian.
+            cov (np.ndarray): Diagonal covariance matrix of the gaussian.
+            amp (float): Amplitude of the gaussian.
+
+        Returns:
+            np.ndarray: 2D gaussian with shape (len(y), len(x)).
+        """
+        gauss_x = np.exp(-((x - cen_off[0]) ** 2) / (2 * cov[0, 0]))
+        gauss_y = np.exp(-((y - cen_off[1]) ** 2) / (2 * cov[1, 1]))
+        return np.outer(gauss_y * (amp / np.max(gauss_y)), gauss_x / np.max(gauss_x))
 
     def _prepare_params_gauss(
         self, amp: float, cov: np.ndarray, offset: np.ndarray, shape: tuple
@@ -718,15 +2029,45 @@ class SimulatedDataCamera(SimulatedDataBase):
         Returns:
             tuple: Positions, offset and covariance matrix for the gaussian.
         """
-        x, y = np.meshgrid(
-            np.linspace(-shape[0] / 2, shape[0] / 2, shape[0]),
-            np.linspace(-shape[1] / 2, shape[1] / 2, shape[1]),
-        )
+        pos = self._get_position_grid(shape)
+        return pos, offset, cov, amp
+
+    def _get_position_grid(self, shape: tuple) -> np.ndarray:
+        """Return the cached coordinate grid for the given image shape.
+
+        The grid is only rebuilt if the shape differs from the cached one. It is
+        read-only, as it is shared between the camera and proxies computing on its behalf.
+
+        Args:
+            shape (tuple): Shape of the image.
+        Returns:
+            np.ndarray: Read-only array of positions with shape (shape[1], shape[0], 2).
+        """
+        shape = tuple(int(entry) for entry in shape)
+        grid_cache = self._grid_cache
+        if grid_cache is not None and grid_cache[0] == shape:
+            return grid_cache[1]
+        x, y = np.meshgrid(*self._get_position_axes(shape))
         pos = np.empty((*x.shape, 2))
         pos[:, :, 0] = x
         pos[:, :, 1] = y
+        pos.flags.writeable = False
+        self._grid_cache = (shape, pos)
+        return pos
 
-        return pos, offset, cov, amp
+    @staticmethod
+    def _get_position_axes(shape: tuple) -> tuple[np.ndarray, np.ndarray]:
+        """Return the 1D coordinate axes spanning the grid for the given image shape.
+
+        Args:
+            shape (tuple): Shape of the image.
+        Returns:
+            tuple: Positions along the second and first axis of the grid.
+        """
+        return (
+            np.linspace(-shape[0] / 2, shape[0] / 2, shape[0]),
+            np.linspace(-shape[1] / 2, shape[1] / 2, shape[1]),
+        )
 
     def _add_noise(self, v: np.ndarray, noise: NoiseType, noise_multiplier: float) -> np.ndarray:
         """Add noise to the simulated data.
@@ -736,30 +2077,136 @@ class SimulatedDataCamera(SimulatedDataBase):
             noise (NoiseType): Type of noise to add.
         """
         if noise == NoiseType.POISSON:
-            v = np.random.poisson(np.round(v), v.shape)
+            v = self.rng.poisson(np.round(v), v.shape)
             return v
+        if noise in (NoiseType.NORMAL, NoiseType.NOISE_BANK):
+            v = np.asarray(v, dtype=float)
+            return self._draw_poisson_approximation(
+                v, out=np.empty_like(v), rng=self.rng, noise=noise
+            )
         if noise == NoiseType.UNIFORM:
-            v += np.random.uniform(-noise_multiplier, noise_multiplier, v.shape)
+            v += self.rng.uniform(-noise_multiplier, noise_multiplier, v.shape)
             v[v <= 0] = 0
             return v
         if noise == NoiseType.NONE:
             return v
 
     def _add_hot_pixel(
-        self, v: np.ndarray, coords: list, hot_pixel_types: list, values: list
+        self,
+        v: np.ndarray,
+        coords: np.ndarray | list | str,
+        hot_pixel_types: list | HotPixelType,
+        values: np.ndarray | list | float,
+        readout: tuple | None = None,
     ) -> np.ndarray:
         """Add hot pixels to the simulated data.
 
+        Hot pixels are applied to the last two axes, so v may also be a stack of frames.
+        Constant and fluctuating pixels are each set in one vectorized operation. A fluctuating
+        pixel is hot if its value exceeds half of the frame maximum, computed once per frame
+        before any hot pixel is applied.
+
         Args:
             v (np.ndarray): Simulated data.
-            hot_pixel (dict): Hot pixel parameters.
-        """
-        for coord, hot_pixel_type, value in zip(coords, hot_pixel_types, values):
-            if coord[0] < v.shape[0] and coord[1] < v.shape[1]:
-                if hot_pixel_type == HotPixelType.CONSTANT:
-                    v[coord[0], coord[1]] = value
-                elif hot_pixel_type == HotPixelType.FLUCTUATING:
-                    maximum = np.max(v) if np.max(v) != 0 else 1
-                    if v[coord[0], coord[1]] / maximum > 0.5:
-                        v[coord[0], coord[1]] = value
+            coords (np.ndarray | list | str): Coordinates with shape (N, 2), a boolean mask or
+                the path to a boolean mask stored as .npy file.
+            hot_pixel_types (list | HotPixelType): Type per hot pixel, or one type for all.
+            values (np.ndarray | list | float): Value per hot pixel, or one value for all.
+            readout (tuple | None): Read out region of v, see _get_readout. The coordinates
+                refer to the full frame and are remapped to the region.
+        """
+        rows, cols, values, fluctuating = self._get_hot_pixel_table(
+            coords, hot_pixel_types, values, shape=v.shape[-2:], readout=readout
+        )
+        if rows.size == 0:
+            return v
+        if fluctuating.any():
+            maximum = np.max(v, axis=(-2, -1))
+            maximum = np.where(maximum != 0, maximum, 1)
+            f_rows, f_cols = rows[fluctuating], cols[fluctuating]
+            pixel = v[..., f_rows, f_cols]
+            hot = pixel / np.expand_dims(maximum, -1) > 0.5
+            v[..., f_rows, f_cols] = np.where(hot, values[fluctuating], pixel)
+        constant = ~fluctuating
+        v[..., rows[constant], cols[constant]] = values[constant]
         return v
+
+    @staticmethod
+    def _get_content_key(value: np.ndarray | list | str | float) -> tuple:
+        """Return a hashable key of the content of a parameter, e.g. a list of coordinates.
+
+        Paths are compared by name, all other values by dtype, shape and data.
+        """
+        if isinstance(value, str):
+            return (value,)
+        array = np.asarray(value)
+        return (array.dtype.str, array.shape, array.tobytes())
+
+    def _get_hot_pixel_table(
+        self,
+        coords: np.ndarray | list | str,
+        hot_pixel_types: list | HotPixelType,
+        values: np.ndarray | list | float,
+        shape: tuple,
+        readout: tuple | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Convert the hot pixel parameters to index and value arrays.
+
+        The result is cached until the hot pixel parameters, the frame shape or the read out
+        region change. With a read out region, hot pixels are remapped to the binned pixel
+        containing them, which takes the value of the hot pixel.
+
+        Args:
+            coords (np.ndarray | list | str): Coordinates, boolean mask or path to a .npy mask file.
+            hot_pixel_types (list | HotPixelType): Type per hot pixel, or one type for all.
+            values (np.ndarray | list | float): Value per hot pixel, or one value for all.
+            shape (tuple): Shape of the frame, hot pixels outside of the frame are dropped.
+            readout (tuple | None): Read out region, see _get_readout.
+
+        Returns:
+            tuple: rows, columns, values and a boolean array flagging fluctuating hot pixels.
+        """
+        # Keyed on content, so in-place edits of the parameters are honoured
+        key = (
+            self._get_content_key(coords),
+            self._get_content_key(hot_pixel_types),
+            self._get_content_key(values),
+            tuple(shape),
+            readout,
+        )
+        hot_pixel_cache = self._hot_pixel_cache
+        if hot_pixel_cache is not None and hot_pixel_cache[0] == key:
+            return hot_pixel_cache[1]
+        if isinstance(coords, str):
+            coords = np.load(coords)
+        coords = np.asarray(coords)
+        if coords.dtype == bool:
+            coords = np.argwhere(coords)
+        coords = coords.reshape(-1, 2).astype(int)
+        if isinstance(hot_pixel_types, str):
+            is_fluctuating = HotPixelType(hot_pixel_types) == HotPixelType.FLUCTUATING
+            fluctuating = np.full(len(coords), is_fluctuating)
+        else:
+            fluctuating = np.array(
+                [HotPixelType(entry) == HotPixelType.FLUCTUATING for entry in hot_pixel_types],
+                dtype=bool,
+            )
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 0:
+            values = np.full(len(coords), values)
+        # Surplus entries are ignored, same as zipping the parameter lists
+        num_pixels = min(len(coords), len(fluctuating), len(values))
+        coords, fluctuating, values = (
+            coords[:num_pixels],
+            fluctuating[:num_pixels],
+            values[:num_pixels],
+        )
+        inside = np.ones(len(coords), dtype=bool)
+        if readout is not None:
+            coords = coords - np.array(readout[:2])
+            inside = (coords >= 0).all(axis=1)
+            coords = coords // readout[4]
+        inside &= (coords[:, 0] < shape[0]) & (coords[:, 1] < shape[1])
+        table = (coords[inside, 0], coords[inside, 1], values[inside], fluctuating[inside])
+        self._hot_pixel_cache = (key, table)
+        return table
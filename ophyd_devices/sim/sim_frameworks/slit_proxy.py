@@ -72,6 +72,9 @@ class SlitProxy(DeviceProxy):
         )
         valid_mask = self._blur_image(valid_mask, sigma=self._gaussian_blur_sigma)
         v *= valid_mask
+        # Only the read out region of the camera is returned
+        readout = device_obj.sim._get_readout(shape)
+        v = device_obj.sim._apply_readout(v, readout)
         v = device_obj.sim._add_noise(
             v, noise=params["noise"], noise_multiplier=params["noise_multiplier"]
         )
@@ -80,6 +83,7 @@ class SlitProxy(DeviceProxy):
             coords=params["hot_pixel_coords"],
             hot_pixel_types=params["hot_pixel_types"],
             values=params["hot_pixel_values"],
+            readout=readout,
         )
         return v
 
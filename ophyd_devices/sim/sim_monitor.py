@@ -5,12 +5,13 @@ from bec_lib import messages
 from bec_lib.endpoints import MessageEndpoints
 from bec_lib.logger import bec_logger
 from ophyd import Component as Cpt
-from ophyd import Device, Kind, StatusBase
+from ophyd import Device, Kind, Staged, StatusBase
 
 from ophyd_devices.interfaces.base_classes.psi_device_base import PSIDeviceBase
 from ophyd_devices.sim.sim_data import SimulatedDataMonitor
 from ophyd_devices.sim.sim_signals import ReadOnlySignal, SetableSignal
 from ophyd_devices.utils import bec_utils
+from ophyd_devices.utils.array_encoding import encode_signals
 
 logger = bec_logger.logger
 
@@ -39,6 +40,8 @@ class SimMonitor(ReadOnlySignal):
                               Default is Kind.normal. See Kind for options.
     device_manager          : DeviceManager from BEC, optional . Within startup of simulation,
                               device_manager is passed on automatically.
+    scan_info               : ScanInfo from BEC, optional. Within startup of simulation,
+                              scan_info is passed on automatically.
 
     """
 
@@ -56,11 +59,14 @@ class SimMonitor(ReadOnlySignal):
         parent=None,
         kind: Kind = None,
         device_manager=None,
+        scan_info=None,
         **kwargs,
     ):
         self.precision = precision
         self.sim_init = sim_init
         self.device_manager = device_manager
+        self.scan_info = scan_info
+        self._staged = Staged.no
         self.sim = self.sim_cls(parent=self, **kwargs)
         self._registered_proxies = {}
 
@@ -81,6 +87,23 @@ class SimMonitor(ReadOnlySignal):
         """Dictionary of registered signal_names and proxies."""
         return self._registered_proxies
 
+    def stage(self) -> list[object]:
+        """Stage the monitor for the upcoming scan.
+
+        If sim.precompute_scan is set, the readbacks for the planned positions of the scan
+        are precomputed from the scan_info.
+        """
+        if self.scan_info is not None:
+            self.sim.prepare_scan(self.scan_info.msg)
+        self._staged = Staged.yes
+        return [self]
+
+    def unstage(self) -> list[object]:
+        """Unstage the monitor, discarding the planned readbacks."""
+        self.sim.clear_scan()
+        self._staged = Staged.no
+        return [self]
+
 
 class SimMonitorAsyncControl(Device):
     """SimMonitor Sync Control Device"""
@@ -93,6 +116,8 @@ class SimMonitorAsyncControl(Device):
     readback = Cpt(ReadOnlySignal, value=BIT_DEPTH(0), kind=Kind.hinted, compute_readback=True)
     current_trigger = Cpt(SetableSignal, value=BIT_DEPTH(0), kind=Kind.config)
     async_update = Cpt(SetableSignal, value="extend", kind=Kind.config)
+    # Encoding of the bundled data in async readback messages, see ArrayEncoding
+    array_encoding = Cpt(SetableSignal, value="none", kind=Kind.config)
 
     SUB_READBACK = "readback"
     SUB_PROGRESS = "progress"
@@ -120,6 +145,11 @@ class SimMonitorAsyncControl(Device):
         """Buffer for data to be sent asynchronously."""
         return self._data_buffer
 
+    def read(self):
+        """Read the device, computing each simulated signal at most once."""
+        with self.sim.read_cycle():
+            return super().read()
+
     @property
     def registered_proxies(self) -> None:
         """Dictionary of registered signal_names and proxies."""
@@ -155,7 +185,7 @@ class SimMonitorAsync(PSIDeviceBase, SimMonitorAsyncControl):
 
     def prep_random_interval(self):
         """Prepare counter and random interval to send data to BEC."""
-        self._random_send_interval = np.random.randint(1, 10)
+        self._random_send_interval = self.sim.rng.integers(1, 10)
         self.current_trigger.set(0).wait()
         self._counter = self.current_trigger.get()
 
@@ -163,6 +193,11 @@ class SimMonitorAsync(PSIDeviceBase, SimMonitorAsyncControl):
         """Prepare the device for staging."""
         self.clear_buffer()
         self.prep_random_interval()
+        self.sim.prepare_scan(self.scan_info.msg)
+
+    def on_unstage(self):
+        """Discard the planned readbacks of the scan."""
+        self.sim.clear_scan()
 
     def on_complete(self) -> StatusBase:
         """Prepare the device for completion."""
@@ -182,12 +217,13 @@ class SimMonitorAsync(PSIDeviceBase, SimMonitorAsyncControl):
 
         if async_update == "extend":
             metadata = {"async_update": {"type": "add", "max_shape": [None]}}
-        elif async_update == "append":
+        else:
             metadata = {"async_update": {"type": "add", "max_shape": [None, None]}}
 
-        msg = messages.DeviceMessage(
-            signals={self.readback.name: self.data_buffer}, metadata=metadata
+        signals = encode_signals(
+            {self.readback.name: self.data_buffer}, encoding=self.array_encoding.get()
         )
+        msg = messages.DeviceMessage(signals=signals, metadata=metadata)
         self.connector.xadd(
             MessageEndpoints.device_async_readback(
                 scan_id=self.scan_info.msg.scan_id, device=self.name
@@ -202,8 +238,9 @@ class SimMonitorAsync(PSIDeviceBase, SimMonitorAsyncControl):
 
         def trigger_action():
             """Trigger actions"""
-            self.data_buffer["value"].append(self.readback.get())
-            self.data_buffer["timestamp"].append(self.readback.timestamp)
+            reading = self.readback.read()[self.readback.name]
+            self.data_buffer["value"].append(reading["value"])
+            self.data_buffer["timestamp"].append(reading["timestamp"])
             self._counter += 1
             self.current_trigger.set(self._counter).wait()
             if self._counter % self._random_send_interval == 0:
@@ -136,8 +136,7 @@ class SimPositioner(Device, PositionerBase):
     @typechecked
     def _set_sim_state(self, signal_name: str, value: any) -> None:
         """Update the simulated state of the device."""
-        self.sim.sim_state[signal_name]["value"] = value
-        self.sim.sim_state[signal_name]["timestamp"] = ttime.time()
+        self.sim.sim_state[signal_name] = {"value": value, "timestamp": ttime.time()}
 
     def _get_sim_state(self, signal_name: str) -> any:
         """Return the simulated state of the device."""
@@ -149,11 +148,12 @@ class SimPositioner(Device, PositionerBase):
         self._set_sim_state(self.readback.name, val)
 
         # Run subscription on "readback"
+        state = self.sim.sim_state[self.readback.name]
         self._run_subs(
             sub_type=self.SUB_READBACK,
             old_value=old_readback,
-            value=self.sim.sim_state[self.readback.name]["value"],
-            timestamp=self.sim.sim_state[self.readback.name]["timestamp"],
+            value=state["value"],
+            timestamp=state["timestamp"],
         )
 
     def _move_to_setpoint(self) -> None:
@@ -164,13 +164,13 @@ class SimPositioner(Device, PositionerBase):
                 value = self.readback.get()
 
                 increment = np.sign(setpoint - value) * self.velocity.get() / self.update_frequency
-                next_val = value + increment + np.random.uniform(-1, 1) * self.tolerance.get()
+                next_val = value + increment + self.sim.rng.uniform(-1, 1) * self.tolerance.get()
 
                 # Check if next_val would overshoot the setpoint
                 if (increment > 0 and next_val > setpoint) or (
                     increment < 0 and next_val < setpoint
                 ):
-                    next_val = setpoint + np.random.uniform(-1, 1) * self.tolerance.get()
+                    next_val = setpoint + self.sim.rng.uniform(-1, 1) * self.tolerance.get()
 
                 self._update_state(next_val)
                 if np.isclose(setpoint, next_val, atol=self.tolerance.get()):
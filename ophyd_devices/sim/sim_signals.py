@@ -1,6 +1,7 @@
 """Module for signals of the ophyd_devices simulation."""
 
 import time
+from copy import deepcopy
 
 import numpy as np
 from bec_lib import bec_logger
@@ -8,6 +9,7 @@ from ophyd import DeviceStatus, Kind, Signal
 from ophyd.utils import ReadOnlyError
 
 from ophyd_devices.utils.bec_device_base import BECDeviceBase
+from ophyd_devices.utils.socket import data_shape, data_type
 
 logger = bec_logger.logger
 
@@ -15,6 +17,30 @@ logger = bec_logger.logger
 PRECISION = 3
 
 
+def describe_signal(signal: Signal, value: any, shape: tuple | None = None) -> dict:
+    """Describe a signal from a value and its declared shape, without reading the signal.
+
+    The result matches Signal.describe of ophyd for a signal holding value.
+
+    Args:
+        signal (Signal): Signal to describe.
+        value (any): Value the dtype and, if shape is None, the shape are inferred from.
+        shape (tuple | None): Declared shape of the values of the signal.
+    """
+    shape = list(data_shape(value) if shape is None else shape)
+    dtype_numpy = getattr(signal, "_value_dtype_str", "")
+    if dtype_numpy and not shape:
+        dtype = "integer" if "int" in dtype_numpy else "number"
+    else:
+        dtype = "array" if shape else data_type(value)
+    res = {signal.name: {"source": signal.source_name, "dtype": dtype, "shape": shape}}
+    if dtype_numpy:
+        res[signal.name]["dtype_numpy"] = dtype_numpy
+    if signal.precision is not None:
+        res[signal.name]["precision"] = signal.precision
+    return res
+
+
 class SetableSignal(Signal):
     """Setable signal for simulated devices.
 
@@ -52,6 +78,7 @@ class SetableSignal(Signal):
         self._value = value
         self.precision = precision
         self.sim = getattr(self.parent, "sim", None)
+        self._description = None
         self._update_sim_state(value)
         self._metadata.update(write_access=True)
 
@@ -90,6 +117,7 @@ class SetableSignal(Signal):
         self.check_value(value)
         self._update_sim_state(value)
         self._value = value
+        self._description = None
         self._run_subs(sub_type=self.SUB_VALUE, value=value)
 
     def set(self, value):
@@ -102,12 +130,11 @@ class SetableSignal(Signal):
     def describe(self):
         """Describe the readback signal.
 
-        Core function for signal.
+        Core function for signal. The description is cached until a new value is put.
         """
-        res = super().describe()
-        if self.precision is not None:
-            res[self.name]["precision"] = self.precision
-        return res
+        if self._description is None:
+            self._description = describe_signal(self, self._get_value())
+        return deepcopy(self._description)
 
     @property
     def timestamp(self):
@@ -155,6 +182,7 @@ class ReadOnlySignal(Signal):
         self.precision = precision
         self.compute_readback = compute_readback
         self.sim = sim if sim is not None else getattr(self.parent, "sim", None)
+        self._description = None
         if self.sim:
             self._init_sim_state()
         self._metadata.update(write_access=False)
@@ -163,10 +191,6 @@ class ReadOnlySignal(Signal):
         """Create the initial sim_state in the SimulatedData class of the parent device."""
         self.sim.update_sim_state(self.name, self._value)
 
-    def _update_sim_state(self) -> None:
-        """Update the readback value."""
-        self.sim.compute_sim_state(signal_name=self.name, compute_readback=self.compute_readback)
-
     def _get_value(self) -> any:
         """Update the timestamp of the readback value."""
         return self.sim.sim_state[self.name]["value"]
@@ -175,15 +199,31 @@ class ReadOnlySignal(Signal):
         """Update the timestamp of the readback value."""
         return self.sim.sim_state[self.name]["timestamp"]
 
+    def _read_sim_state(self) -> dict:
+        """Compute the readback once and return value and timestamp of this evaluation."""
+        state = self.sim.read_sim_state(self.name, self.compute_readback)
+        self._value = state["value"]
+        return state
+
     # pylint: disable=arguments-differ
     def get(self):
         """Get the current position of the simulated device."""
         if self.sim:
-            self._update_sim_state()
-            self._value = self._get_value()
-            return self._value
+            return self._read_sim_state()["value"]
         return np.random.rand()
 
+    def read(self):
+        """Read the signal.
+
+        Value and timestamp stem from a single evaluation of the simulation. Within a
+        read_cycle of the simulation, e.g. during the read of the parent device, the value
+        is computed once.
+        """
+        if not self.sim:
+            return super().read()
+        state = self._read_sim_state()
+        return {self.name: {"value": state["value"], "timestamp": state["timestamp"]}}
+
     # pylint: disable=arguments-differ
     def put(self, value) -> None:
         """Put method, should raise ReadOnlyError since the signal is readonly."""
@@ -192,12 +232,19 @@ class ReadOnlySignal(Signal):
     def describe(self):
         """Describe the readback signal.
 
-        Core function for signal.
+        Core function for signal. The description is computed from the shape the simulation
+        declares for the signal and the last value, so no new value is computed. It is cached
+        until the shape generation of the simulation changes, e.g. with the image shape.
         """
-        res = super().describe()
-        if self.precision is not None:
-            res[self.name]["precision"] = self.precision
-        return res
+        if not self.sim:
+            return describe_signal(self, self._value)
+        generation = self.sim.shape_generation
+        if self._description is None or self._description[0] != generation:
+            description = describe_signal(
+                self, self._get_value(), shape=self.sim.get_signal_shape(self.name)
+            )
+            self._description = (generation, description)
+        return deepcopy(self._description[1])
 
     @property
     def timestamp(self):
@@ -1,11 +1,19 @@
 import math
 import os
+import sys
+import threading
 import time
+from collections import deque
+from multiprocessing import resource_tracker, shared_memory
 from pathlib import Path
+from typing import Callable
 
 import h5py
 import hdf5plugin
 import numpy as np
+from bec_lib.logger import bec_logger
+
+logger = bec_logger.logger
 
 
 class H5Writer:
@@ -17,6 +25,9 @@ class H5Writer:
         self.h5_file = None
         self.file_handle = None
         self.data_container = []
+        self.event_container = []
+        self._num_event_frames = 0
+        self._pending_releases = []
 
     def create_dir(self):
         """Create directory if it does not exist"""
@@ -25,15 +36,42 @@ class H5Writer:
         if not os.path.exists(base_dir):
             os.makedirs(base_dir)
 
-    def receive_data(self, data: any):
-        """Store data to be written to h5 file"""
-        self.data_container.append(data)
+    def receive_data(
+        self, data: any, stacked: bool = False, release: Callable[[], None] | None = None
+    ):
+        """Store data to be written to h5 file
+
+        Args:
+            data (any): Data of a single frame, or a block of frames if stacked is True.
+            stacked (bool): If True, data is a block of frames stacked along the first axis.
+            release (Callable): Called once the data is written to disk or dropped, e.g. to
+                return pooled frame buffers.
+        """
+        if stacked:
+            self.data_container.extend(data)
+        else:
+            self.data_container.append(data)
+        if release is not None:
+            self._pending_releases.append(release)
         if len(self.data_container) > 2:
             self.write_data()
 
+    def receive_events(self, events: dict[str, np.ndarray]):
+        """Store the photon events of a frame to be written to h5 file as event list
+
+        Args:
+            events (dict): Arrays of equal length per event property, e.g. x, y and count.
+        """
+        self.event_container.append(events)
+        if len(self.event_container) > 2:
+            self.write_events()
+
     def on_stage(self, file_path: str, h5_entry: str):
         """Prepare to write data to h5 file"""
         self.data_container.clear()
+        self.event_container.clear()
+        self._num_event_frames = 0
+        self._release_data()
         self.file_path = file_path
         self.h5_entry = h5_entry
         self.create_dir()
@@ -45,6 +83,8 @@ class H5Writer:
         """Write data to h5 file"""
         if len(self.data_container) > 0:
             self.write_data()
+        if len(self.event_container) > 0:
+            self.write_events()
 
     def on_unstage(self):
         """Close file handle"""
@@ -67,6 +107,430 @@ class H5Writer:
                 f[dataset].resize((f[dataset].shape[0] + len(value)), axis=0)
                 f[dataset][-len(value) :] = np.array(value)
             self.data_container.clear()
+        self._release_data()
+
+    def write_events(self):
+        """Append the stored events to the event list in the h5 group h5_entry.
+
+        Each event property is concatenated over all frames into a 1D dataset h5_entry/<key>.
+        The dataset h5_entry/frame holds the index of the frame of each event, and the
+        attribute num_frames of the group the number of frames, including frames without events.
+        """
+        frame_index = [
+            np.full(len(next(iter(events.values()))), self._num_event_frames + index)
+            for index, events in enumerate(self.event_container)
+        ]
+        columns = {
+            key: np.concatenate([events[key] for events in self.event_container])
+            for key in self.event_container[0]
+        }
+        columns["frame"] = np.concatenate(frame_index)
+        with h5py.File(self.file_path, "a") as f:
+            group = f.require_group(self.h5_entry)
+            for key, value in columns.items():
+                if key not in group:
+                    group.create_dataset(
+                        key, data=value, maxshape=(None,), chunks=(2**14,), **hdf5plugin.LZ4()
+                    )
+                else:
+                    group[key].resize((group[key].shape[0] + len(value)), axis=0)
+                    group[key][-len(value) :] = value
+            self._num_event_frames += len(self.event_container)
+            group.attrs["num_frames"] = self._num_event_frames
+        self.event_container.clear()
+
+    def _release_data(self):
+        """Run the release callbacks of data that is no longer held by the writer."""
+        releases, self._pending_releases = self._pending_releases, []
+        for release in releases:
+            release()
+
+
+class FramePrefetcher:
+    """Utility class to keep a bounded ring of precomputed frames, filled by a producer thread.
+
+    Every frame is tagged with the generation of the simulation it was computed for.
+    Frames of an outdated generation, i.e. computed before parameters or shape changed,
+    are flushed instead of being handed out.
+
+    Args:
+        produce (Callable): Function returning a new frame, or None if frames can not be prefetched.
+        generation (Callable): Function returning the current generation of the simulation.
+        size (int): Number of frames to keep ready.
+    """
+
+    def __init__(
+        self, produce: Callable[[], any], generation: Callable[[], int], size: int = 0
+    ) -> None:
+        self._produce = produce
+        self._generation = generation
+        self._size = size
+        self._ring = deque()
+        self._pending_refills = deque(maxlen=1000)
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self.hits = 0
+        self.misses = 0
+        self.refill_lag = 0.0
+
+    @property
+    def size(self) -> int:
+        """Number of frames to keep ready."""
+        return self._size
+
+    @property
+    def running(self) -> bool:
+        """True if the producer thread is running."""
+        return self._running
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def start(self, size: int) -> None:
+        """Start or resize the ring and its producer thread.
+
+        Args:
+            size (int): Number of frames to keep ready, 0 stops the producer.
+        """
+        if size <= 0:
+            self.stop()
+            return
+        with self._condition:
+            self._size = size
+            while len(self._ring) > size:
+                self._ring.popleft()
+            self._condition.notify_all()
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._fill, name="frame_prefetcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the producer thread and flush the ring."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Drop all prefetched frames."""
+        with self._condition:
+            self._ring.clear()
+            self._pending_refills.clear()
+            self._condition.notify_all()
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss and refill lag statistics."""
+        with self._condition:
+            self.hits = 0
+            self.misses = 0
+            self.refill_lag = 0.0
+
+    def pop(self) -> any:
+        """Return the oldest ready frame of the current generation, or None on a miss."""
+        with self._condition:
+            generation = self._generation()
+            while self._ring and self._ring[0][0] != generation:
+                self._ring.popleft()
+            self._pending_refills.append(time.time())
+            self._condition.notify_all()
+            if self._ring:
+                self.hits += 1
+                return self._ring.popleft()[1]
+            self.misses += 1
+            return None
+
+    def _fill(self) -> None:
+        """Producer loop, keeps the ring filled with frames of the current generation."""
+        while True:
+            with self._condition:
+                while self._running and len(self._ring) >= self._size:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                generation = self._generation()
+            try:
+                frame = self._produce()
+            except Exception:  # pylint: disable=broad-except
+                # Keep the producer alive, triggers compute frames on demand in the meantime
+                logger.exception("Failed to prefetch a frame, retrying.")
+                frame = None
+            with self._condition:
+                if frame is None:
+                    # Frames can currently not be prefetched, check again later
+                    self._condition.wait(0.1)
+                    continue
+                if generation != self._generation():
+                    continue
+                self._ring.append((generation, frame))
+                if self._pending_refills:
+                    self.refill_lag = time.time() - self._pending_refills.popleft()
+
+
+class FrameBufferPool:
+    """Utility class to reuse preallocated frame buffers instead of allocating a frame per trigger.
+
+    Buffers are checked out by the producer of the frames and carry a reference count. Every
+    consumer that holds on to a frame beyond a callback, e.g. the H5Writer, retains it and
+    releases it once done. A buffer returns to the pool when its count drops to zero.
+    If all buffers are in use, checkout falls back to fresh allocations, which are counted as
+    exhaustion events and are not returned to the pool.
+
+    Args:
+        size (int): Number of buffers, 0 disables pooling.
+        shape (tuple): Shape of a frame.
+        dtype (np.dtype): Dtype of a frame.
+    """
+
+    def __init__(self, size: int = 0, shape: tuple = (), dtype: np.dtype = np.uint16) -> None:
+        self._lock = threading.Lock()
+        self._free = []
+        self._refcounts = {}
+        self._size = 0
+        self._layout = ((), np.dtype(dtype))
+        self.exhausted = 0
+        self.resize(size=size, shape=shape, dtype=dtype)
+
+    @property
+    def size(self) -> int:
+        """Number of buffers of the pool."""
+        return self._size
+
+    @property
+    def in_use(self) -> int:
+        """Number of pooled buffers currently checked out."""
+        with self._lock:
+            return len(self._refcounts)
+
+    def resize(self, size: int, shape: tuple, dtype: np.dtype) -> None:
+        """Set the number of buffers and the frame layout.
+
+        Free buffers are preallocated. Buffers checked out with a previous layout are dropped
+        once they are released.
+
+        Args:
+            size (int): Number of buffers, 0 disables pooling.
+            shape (tuple): Shape of a frame.
+            dtype (np.dtype): Dtype of a frame.
+        """
+        layout = (tuple(int(entry) for entry in shape), np.dtype(dtype))
+        with self._lock:
+            if layout != self._layout:
+                self._free.clear()
+                self._refcounts.clear()
+                self._layout = layout
+            self._size = max(0, int(size))
+            num_free = self._size - len(self._refcounts)
+            del self._free[max(0, num_free) :]
+            while len(self._free) < num_free:
+                self._free.append(np.empty(*layout))
+
+    def checkout(self, num: int) -> list[np.ndarray]:
+        """Check out buffers for num frames, each with a reference count of one.
+
+        Args:
+            num (int): Number of frames.
+        """
+        buffers = []
+        with self._lock:
+            for _ in range(num):
+                if self._free:
+                    buffer = self._free.pop()
+                    self._refcounts[id(buffer)] = [buffer, 1]
+                else:
+                    if self._size:
+                        self.exhausted += 1
+                    buffer = np.empty(*self._layout)
+                buffers.append(buffer)
+        return buffers
+
+    def retain(self, buffers: list[np.ndarray]) -> None:
+        """Increase the reference count of pooled buffers."""
+        with self._lock:
+            for buffer in buffers:
+                entry = self._refcounts.get(id(buffer))
+                if entry is not None and entry[0] is buffer:
+                    entry[1] += 1
+
+    def release(self, buffers: list[np.ndarray]) -> None:
+        """Decrease the reference count of pooled buffers, and return unused ones to the pool."""
+        with self._lock:
+            for buffer in buffers:
+                entry = self._refcounts.get(id(buffer))
+                if entry is None or entry[0] is not buffer:
+                    continue
+                entry[1] -= 1
+                if entry[1] > 0:
+                    continue
+                del self._refcounts[id(buffer)]
+                if len(self._free) + len(self._refcounts) < self._size:
+                    self._free.append(buffer)
+
+
+# Names of the shared memory blocks created by this process
+_OWNED_SHARED_MEMORY: set[str] = set()
+
+
+class SharedFrameRing:
+    """Utility class to hand frames to other processes on the same host through shared memory.
+
+    Frames are written into a ring of slots in a named multiprocessing.shared_memory block, the
+    oldest slot is overwritten first. Consumers only need a small descriptor with the name of the
+    block, the slot index, shape, dtype and frame number, see write. They attach to the block by
+    name and read frames without a copy of the frame travelling between the processes.
+
+    The block starts with the number of slots and the size of a slot. Each slot starts with the
+    number of the frame it holds, -1 while the frame is written, so that consumers can detect
+    frames that were overwritten while reading them.
+
+    >>> ring = SharedFrameRing(slots=8, slot_nbytes=frame.nbytes)
+    >>> descriptor = ring.write(frame)
+    >>> consumer = SharedFrameRing.attach(descriptor["shm_name"])
+    >>> frame = consumer.read(descriptor)
+
+    Args:
+        slots (int): Number of slots.
+        slot_nbytes (int): Maximum size of a frame in bytes.
+        name (str): Name of an existing block to attach to. If None, a new block is created.
+    """
+
+    HEADER_NBYTES = 16
+    SLOT_HEADER_NBYTES = 8
+
+    def __init__(self, slots: int = 0, slot_nbytes: int = 0, name: str | None = None) -> None:
+        self._owner = name is None
+        if self._owner:
+            if slots <= 0:
+                raise ValueError(f"Number of slots must be positive, got {slots}.")
+            # Keep slots 8 byte aligned for all numeric dtypes
+            slot_nbytes = -(-max(1, slot_nbytes) // 8) * 8
+            size = self.HEADER_NBYTES + slots * (self.SLOT_HEADER_NBYTES + slot_nbytes)
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            _OWNED_SHARED_MEMORY.add(self._shm.name)
+            np.ndarray(2, dtype=np.int64, buffer=self._shm.buf)[:] = (slots, slot_nbytes)
+        else:
+            self._shm = self._attach_block(name)
+            slots, slot_nbytes = np.ndarray(2, dtype=np.int64, buffer=self._shm.buf).tolist()
+        self.slots = int(slots)
+        self.slot_nbytes = int(slot_nbytes)
+        self._headers = np.ndarray(
+            self.slots,
+            dtype=np.int64,
+            buffer=self._shm.buf,
+            offset=self.HEADER_NBYTES,
+            strides=(self.SLOT_HEADER_NBYTES + self.slot_nbytes,),
+        )
+        if self._owner:
+            self._headers[:] = -1
+        self.frames_written = 0
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Attach to the ring of another process.
+
+        Args:
+            name (str): Name of the shared memory block, shm_name of a descriptor.
+        """
+        return cls(name=name)
+
+    @staticmethod
+    def _attach_block(name: str) -> shared_memory.SharedMemory:
+        """Attach to an existing block, without taking over the responsibility to unlink it.
+
+        Before Python 3.13, attaching registers the block with the resource tracker of the
+        consumer, which would unlink it when the consumer exits, so it is unregistered again.
+        Blocks created by this process stay registered for their owner.
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        shm = shared_memory.SharedMemory(name=name)
+        if shm.name not in _OWNED_SHARED_MEMORY:
+            # pylint: disable=protected-access
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    def _slot_view(self, slot: int, shape: tuple, dtype: np.dtype) -> np.ndarray:
+        """Return the frame stored in a slot as array backed by the shared memory."""
+        offset = (
+            self.HEADER_NBYTES
+            + slot * (self.SLOT_HEADER_NBYTES + self.slot_nbytes)
+            + self.SLOT_HEADER_NBYTES
+        )
+        return np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+
+    def fits(self, frame: np.ndarray) -> bool:
+        """True if the frame fits into a slot."""
+        return frame.nbytes <= self.slot_nbytes
+
+    def write(self, frame: np.ndarray) -> dict:
+        """Copy a frame into the next slot of the ring.
+
+        Args:
+            frame (np.ndarray): Frame to write, must fit into a slot.
+
+        Returns:
+            dict: Descriptor of the frame with shm_name, slot, shape, dtype and frame_number.
+        """
+        if not self._owner:
+            raise RuntimeError(f"Ring {self.name} is attached, only its owner can write frames.")
+        if not self.fits(frame):
+            raise ValueError(
+                f"Frame with {frame.nbytes} bytes does not fit into slots of {self.slot_nbytes} bytes."
+            )
+        frame_number = self.frames_written
+        slot = frame_number % self.slots
+        self._headers[slot] = -1
+        np.copyto(self._slot_view(slot, frame.shape, frame.dtype), frame)
+        self._headers[slot] = frame_number
+        self.frames_written += 1
+        return {
+            "shm_name": self.name,
+            "slot": slot,
+            "shape": tuple(frame.shape),
+            "dtype": frame.dtype.str,
+            "frame_number": frame_number,
+        }
+
+    def read(self, descriptor: dict, copy: bool = True) -> np.ndarray | None:
+        """Read the frame of a descriptor.
+
+        Args:
+            descriptor (dict): Descriptor returned by write.
+            copy (bool): If False, return a view into the shared memory, which is only valid
+                until the slot is overwritten.
+
+        Returns:
+            np.ndarray | None: Frame, or None if the slot already holds a newer frame.
+        """
+        slot, frame_number = descriptor["slot"], descriptor["frame_number"]
+        if self._headers[slot] != frame_number:
+            return None
+        frame = self._slot_view(slot, tuple(descriptor["shape"]), np.dtype(descriptor["dtype"]))
+        if not copy:
+            return frame
+        frame = frame.copy()
+        if self._headers[slot] != frame_number:
+            return None
+        return frame
+
+    def close(self) -> None:
+        """Release the shared memory, the owner also removes the block."""
+        # Views into the buffer have to be released before the block can be closed
+        self._headers = None
+        self._shm.close()
+        if self._owner:
+            _OWNED_SHARED_MEMORY.discard(self._shm.name)
+            self._shm.unlink()
 
 
 class LinearTrajectory:
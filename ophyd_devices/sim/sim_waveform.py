@@ -17,7 +17,9 @@ from typeguard import typechecked
 from ophyd_devices.sim.sim_data import SimulatedDataWaveform
 from ophyd_devices.sim.sim_signals import ReadOnlySignal, SetableSignal
 from ophyd_devices.utils import bec_utils
+from ophyd_devices.utils.array_encoding import encode_signals
 from ophyd_devices.utils.errors import DeviceStopError
+from ophyd_devices.utils.psi_device_base_utils import PreviewHandler
 
 logger = bec_logger.logger
 
@@ -92,6 +94,12 @@ class SimWaveform(Device):
     # Can be extend or append
     async_update = Cpt(AsyncUpdateSignal, value="add", kind=Kind.config)
     slice_size = Cpt(SetableSignal, value=100, dtype=np.int32, kind=Kind.config)
+    # Encoding of the waveform in async readback messages, see ArrayEncoding
+    array_encoding = Cpt(SetableSignal, name="array_encoding", value="none", kind=Kind.config)
+    # Maximum rate in Hz of the preview on SUB_MONITOR, 0 publishes every waveform,
+    # and number of samples averaged into one preview sample
+    preview_rate = Cpt(SetableSignal, name="preview_rate", value=0.0, kind=Kind.config)
+    preview_binning = Cpt(SetableSignal, name="preview_binning", value=1, kind=Kind.config)
 
     def __init__(
         self,
@@ -124,6 +132,13 @@ class SimWaveform(Device):
         if self.sim_init:
             self.sim.set_init(self.sim_init)
         self._slice_index = 0
+        self.preview = PreviewHandler(parent=self, sub_type=self.SUB_MONITOR)
+        self.preview_rate.subscribe(self._update_preview, run=False)
+        self.preview_binning.subscribe(self._update_preview, run=False)
+
+    def _update_preview(self, **kwargs) -> None:
+        """Apply the preview rate and binning."""
+        self.preview.configure(max_rate=self.preview_rate.get(), binning=self.preview_binning.get())
 
     @property
     def delay_slice_update(self) -> bool:
@@ -135,6 +150,11 @@ class SimWaveform(Device):
     def delay_slice_update(self, value: bool) -> None:
         self._delay_slice_update = value
 
+    def read(self):
+        """Read the device, computing each simulated signal at most once."""
+        with self.sim.read_cycle():
+            return super().read()
+
     @property
     def registered_proxies(self) -> None:
         """Dictionary of registered signal_names and proxies."""
@@ -165,7 +185,7 @@ class SimWaveform(Device):
                             logger.info(
                                 f"Sending slice {i} of {self._slice_index} with length {len(value_slice)}"
                             )
-                            self._run_subs(sub_type=self.SUB_MONITOR, value=value_slice)
+                            self.preview.update(value_slice)
                             self._send_async_update(index=self._slice_index, value=value_slice)
                             if self.delay_slice_update is True:
                                 time.sleep(0.025)  # 25ms to be really fast
@@ -174,7 +194,7 @@ class SimWaveform(Device):
                         self._slice_index += 1
                     # option add
                     elif self.async_update.get() == "add":
-                        self._run_subs(sub_type=self.SUB_MONITOR, value=values)
+                        self.preview.update(values)
                         self._send_async_update(value=values)
                     else:
                         # This should never happen, but just in case
@@ -223,10 +243,11 @@ class SimWaveform(Device):
                 f"Invalid async_update type: {async_update_type} for device {self.name}"
             )
 
-        msg = messages.DeviceMessage(
-            signals={self.waveform.name: {"value": value, "timestamp": time.time()}},
-            metadata=metadata,
+        signals = encode_signals(
+            {self.waveform.name: {"value": value, "timestamp": time.time()}},
+            encoding=self.array_encoding.get(),
         )
+        msg = messages.DeviceMessage(signals=signals, metadata=metadata)
         # Send the message to BEC
         self.connector.xadd(
             MessageEndpoints.device_async_readback(
@@ -283,6 +304,11 @@ class SimWaveform(Device):
         self._trigger_thread = None
         super().stop(success=success)
 
+    def destroy(self):
+        """Stop the preview and destroy the device"""
+        self.preview.shutdown()
+        super().destroy()
+
 
 if __name__ == "__main__":  # pragma: no cover
     waveform = SimWaveform(name="waveform")
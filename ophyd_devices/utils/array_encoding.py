@@ -0,0 +1,170 @@
+"""
+Compact encoding of array payloads for device messages.
+
+By default, arrays in the signals of a DeviceMessage are serialized generically by the connector.
+The encoder in this module wraps large arrays as dtype, shape and contiguous bytes instead,
+optionally compressed with LZ4 or bitshuffle/LZ4. The compression uses the HDF5 filters of
+hdf5plugin on an in-memory file, so no additional compression library is needed.
+
+>>> signals = encode_signals({"waveform": {"value": data, "timestamp": time.time()}}, "lz4")
+>>> msg = messages.DeviceMessage(signals=signals, metadata=metadata)
+>>> data = decode_signals(msg.signals)["waveform"]["value"]
+"""
+
+from __future__ import annotations
+
+import enum
+import uuid
+from typing import Any
+
+import h5py
+import hdf5plugin
+import numpy as np
+
+# Key marking a dictionary as encoded array, holding the encoding
+ENCODED_ARRAY_KEY = "__ophyd_array__"
+
+# Arrays with fewer bytes are not encoded, as the overhead outweighs the gain
+MIN_ENCODED_NBYTES = 4096
+
+
+class ArrayEncoding(str, enum.Enum):
+    """Encoding of array payloads in device messages."""
+
+    NONE = "none"
+    RAW = "raw"
+    LZ4 = "lz4"
+    BITSHUFFLE = "bitshuffle"
+
+
+def _get_filter(encoding: ArrayEncoding) -> hdf5plugin.FilterBase:
+    """Return the HDF5 filter compressing with the given encoding."""
+    if encoding == ArrayEncoding.LZ4:
+        return hdf5plugin.LZ4()
+    return hdf5plugin.Bitshuffle(cname="lz4")
+
+
+def _create_chunked_dataset(
+    file: h5py.File, shape: tuple, dtype: np.dtype, encoding: ArrayEncoding
+) -> h5py.Dataset:
+    """Create a dataset stored as a single chunk, compressed with the given encoding."""
+    return file.create_dataset(
+        "data", shape=shape, dtype=dtype, chunks=shape, **_get_filter(encoding)
+    )
+
+
+def _in_memory_file() -> h5py.File:
+    """Open an HDF5 file that only lives in memory."""
+    return h5py.File(uuid.uuid4().hex, "w", driver="core", backing_store=False)
+
+
+def encode_array(
+    value: Any,
+    encoding: ArrayEncoding | str = ArrayEncoding.LZ4,
+    min_nbytes: int = MIN_ENCODED_NBYTES,
+) -> Any:
+    """Encode an array as dtype, shape and contiguous, optionally compressed, bytes.
+
+    Lists of numbers are converted to arrays. Values that are no numeric arrays and arrays
+    with less than min_nbytes bytes are returned unchanged.
+
+    Args:
+        value (Any): Value to encode.
+        encoding (ArrayEncoding | str): Encoding, ArrayEncoding.NONE returns value unchanged.
+        min_nbytes (int): Minimum number of bytes of arrays to encode.
+
+    Returns:
+        Any: Dictionary with the encoded array, or value.
+    """
+    encoding = ArrayEncoding(encoding)
+    if encoding == ArrayEncoding.NONE or not isinstance(value, (np.ndarray, list)):
+        return value
+    try:
+        array = np.asarray(value)
+    except ValueError:
+        # Ragged lists
+        return value
+    if array.dtype.kind not in "biufc" or array.ndim == 0 or array.nbytes < min_nbytes:
+        return value
+    encoded = {
+        ENCODED_ARRAY_KEY: encoding.value,
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "filter_mask": 0,
+    }
+    if encoding == ArrayEncoding.RAW:
+        encoded["data"] = np.ascontiguousarray(array).tobytes()
+        return encoded
+    with _in_memory_file() as file:
+        dataset = _create_chunked_dataset(file, array.shape, array.dtype, encoding)
+        dataset[...] = array
+        filter_mask, data = dataset.id.read_direct_chunk((0,) * array.ndim)
+    # A set bit in the filter mask flags an optional filter that was skipped
+    encoded["filter_mask"] = filter_mask
+    encoded["data"] = bytes(data)
+    return encoded
+
+
+def decode_array(value: Any) -> Any:
+    """Decode an array encoded by encode_array.
+
+    Args:
+        value (Any): Encoded array. Any other value is returned unchanged.
+
+    Returns:
+        Any: Decoded array, or value.
+    """
+    if not isinstance(value, dict) or ENCODED_ARRAY_KEY not in value:
+        return value
+    encoding = ArrayEncoding(value[ENCODED_ARRAY_KEY])
+    dtype = np.dtype(value["dtype"])
+    shape = tuple(value["shape"])
+    if encoding == ArrayEncoding.RAW:
+        return np.frombuffer(value["data"], dtype=dtype).reshape(shape).copy()
+    array = np.empty(shape, dtype=dtype)
+    with _in_memory_file() as file:
+        dataset = _create_chunked_dataset(file, shape, dtype, encoding)
+        dataset.id.write_direct_chunk(
+            (0,) * len(shape), value["data"], filter_mask=value["filter_mask"]
+        )
+        dataset.read_direct(array)
+    return array
+
+
+def encode_signals(
+    signals: dict,
+    encoding: ArrayEncoding | str = ArrayEncoding.LZ4,
+    min_nbytes: int = MIN_ENCODED_NBYTES,
+) -> dict:
+    """Encode the arrays of the signals of a DeviceMessage.
+
+    Args:
+        signals (dict): Signals, i.e. {name: {"value": value, "timestamp": timestamp}}.
+        encoding (ArrayEncoding | str): Encoding of the arrays.
+        min_nbytes (int): Minimum number of bytes of arrays to encode.
+
+    Returns:
+        dict: Signals with encoded arrays.
+    """
+    return {
+        name: {
+            key: encode_array(entry, encoding=encoding, min_nbytes=min_nbytes)
+            for key, entry in content.items()
+        }
+        for name, content in signals.items()
+    }
+
+
+def decode_signals(signals: dict) -> dict:
+    """Decode the arrays of the signals of a DeviceMessage encoded by encode_signals.
+
+    Args:
+        signals (dict): Signals with encoded arrays.
+
+    Returns:
+        dict: Signals with decoded arrays.
+    """
+    return {
+        name: {key: decode_array(entry) for key, entry in content.items()}
+        for name, content in signals.items()
+    }
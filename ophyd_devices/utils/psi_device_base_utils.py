@@ -2,11 +2,13 @@
 
 import ctypes
 import threading
+import time
 import traceback
 import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Callable
 
+import numpy as np
 from bec_lib.file_utils import get_full_path
 from bec_lib.logger import bec_logger
 from bec_lib.utils.import_utils import lazy_import_from
@@ -184,6 +186,135 @@ class TaskHandler:
                 self.kill_task(info[0])
 
 
+class PreviewHandler:
+    """Handler to publish a rate-limited and binned preview of detector data to the GUI.
+
+    Data is offered with update, e.g. for every frame, while the full-rate path to the file
+    writer is unaffected. With max_rate > 0, a worker thread publishes the latest offered data
+    at most max_rate times per second on the subscription sub_type of the parent, data replaced
+    before it was published is counted as dropped (latest-frame-wins). With max_rate 0, data is
+    published directly in the calling thread. Before publishing, blocks of binning pixels along
+    each axis are averaged.
+
+    The handler keeps a reference to the offered data until it is published, so buffers that
+    are reused by the detector have to be copied before update.
+
+    >>> self.preview = PreviewHandler(parent=self, sub_type=self.SUB_DEVICE_MONITOR_2D, max_rate=5)
+    >>> self.preview.update(frame)
+    """
+
+    def __init__(self, parent: Device, sub_type: str, max_rate: float = 0, binning: int = 1):
+        """Initialize the handler
+
+        Args:
+            parent: The device publishing the preview.
+            sub_type: Subscription to publish the preview on, e.g. device_monitor_2d.
+            max_rate: Maximum number of previews per second, 0 for no limit.
+            binning: Number of pixels along each axis averaged into one preview pixel.
+        """
+        self._parent = parent
+        self.sub_type = sub_type
+        self.max_rate = max_rate
+        self.binning = binning
+        self.dropped = 0
+        self._pending = None
+        self._last_publish = 0.0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def configure(self, max_rate: float | None = None, binning: int | None = None) -> None:
+        """Change the maximum rate or the binning of the preview.
+
+        Args:
+            max_rate: Maximum number of previews per second, 0 for no limit.
+            binning: Number of pixels along each axis averaged into one preview pixel.
+        """
+        with self._condition:
+            if max_rate is not None:
+                self.max_rate = float(max_rate)
+            if binning is not None:
+                self.binning = max(1, int(binning))
+            self._condition.notify_all()
+
+    def update(self, value: np.ndarray) -> None:
+        """Offer data for the preview, replacing data that was not published yet.
+
+        Args:
+            value: Data of one frame, i.e. a 1D or 2D array.
+        """
+        if self.max_rate <= 0:
+            self._publish(value)
+            return
+        with self._condition:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = value
+            self._condition.notify_all()
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="preview", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop the worker thread, data that was not published yet is discarded."""
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Worker loop, publishes the latest pending data once the rate limit allows it."""
+        while True:
+            with self._condition:
+                while self._running and self._pending is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                if self.max_rate > 0:
+                    delay = self._last_publish + 1 / self.max_rate - time.monotonic()
+                    if delay > 0:
+                        # Newer data may replace the pending data in the meantime
+                        self._condition.wait(delay)
+                        continue
+                value, self._pending = self._pending, None
+                self._last_publish = time.monotonic()
+            try:
+                self._publish(value)
+            except Exception:  # pylint: disable=broad-except
+                content = traceback.format_exc()
+                logger.warning(f"Exception while publishing preview, Traceback: {content}")
+
+    def _publish(self, value: np.ndarray) -> None:
+        """Bin the data and run the preview subscription of the parent."""
+        # pylint: disable=protected-access
+        self._parent._run_subs(sub_type=self.sub_type, value=self.bin(value, self.binning))
+
+    @staticmethod
+    def bin(value: np.ndarray, binning: int) -> np.ndarray:
+        """Average blocks of binning elements along each axis, keeping the dtype.
+
+        Trailing elements that do not fill a block are dropped.
+
+        Args:
+            value: 1D or 2D array.
+            binning: Block size along each axis.
+        """
+        if binning <= 1:
+            return value
+        value = np.asarray(value)
+        shape = tuple(max(1, size // binning) for size in value.shape)
+        block = tuple(min(binning, size) for size in value.shape)
+        cropped = value[tuple(slice(0, n * b) for n, b in zip(shape, block))]
+        blocks = cropped.reshape([entry for pair in zip(shape, block) for entry in pair])
+        binned = blocks.mean(axis=tuple(range(1, 2 * value.ndim, 2)))
+        return binned.astype(value.dtype, copy=False)
+
+
 class FileHandler:
     """Utility class for file operations."""
 
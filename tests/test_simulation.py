@@ -4,6 +4,7 @@
 import os
 import threading
 import time
+from copy import deepcopy
 from types import SimpleNamespace
 from unittest import mock
 
@@ -24,6 +25,7 @@ from ophyd_devices.interfaces.protocols.bec_protocols import (
     BECPositionerProtocol,
     BECSignalProtocol,
 )
+from ophyd_devices.sim import sim_data
 from ophyd_devices.sim.sim_camera import SimCamera
 from ophyd_devices.sim.sim_flyer import SimFlyer
 from ophyd_devices.sim.sim_frameworks.h5_image_replay_proxy import H5ImageReplayProxy
@@ -32,9 +34,10 @@ from ophyd_devices.sim.sim_frameworks.stage_camera_proxy import StageCameraProxy
 from ophyd_devices.sim.sim_monitor import SimMonitor, SimMonitorAsync
 from ophyd_devices.sim.sim_positioner import SimLinearTrajectoryPositioner, SimPositioner
 from ophyd_devices.sim.sim_signals import ReadOnlySignal
-from ophyd_devices.sim.sim_utils import H5Writer, LinearTrajectory
+from ophyd_devices.sim.sim_utils import FramePrefetcher, H5Writer, LinearTrajectory, SharedFrameRing
 from ophyd_devices.sim.sim_waveform import SimWaveform
 from ophyd_devices.tests.utils import get_mock_scan_info
+from ophyd_devices.utils.array_encoding import decode_signals
 from ophyd_devices.utils.bec_device_base import BECDevice, BECDeviceBase
 
 
@@ -180,6 +183,24 @@ def test_monitor_with_sim_init():
         assert sim.sim.params[k] == params[k]
 
 
+def test_sim_init_seed():
+    """Test that seeded devices produce reproducible, independent random streams."""
+    dm = DMMock()
+    sim_init = {"model": "gaussian", "params": {"noise": "poisson"}, "seed": 42}
+    cam_1 = SimCamera(name="cam_1", device_manager=dm, sim_init=sim_init)
+    cam_2 = SimCamera(name="cam_2", device_manager=dm, sim_init=sim_init)
+    cam_3 = SimCamera(name="cam_3", device_manager=dm, sim_init={**sim_init, "seed": 7})
+    img_1 = cam_1.image.get()
+    assert np.array_equal(img_1, cam_2.image.get())
+    assert not np.array_equal(img_1, cam_3.image.get())
+    cam_1.sim.set_seed(42)
+    assert np.array_equal(img_1, cam_1.image.get())
+    mon_init = {"model": "ConstantModel", "params": {"noise": "poisson"}, "seed": 1}
+    mon_1 = SimMonitor(name="mon_1", device_manager=dm, sim_init=mon_init)
+    mon_2 = SimMonitor(name="mon_2", device_manager=dm, sim_init=mon_init)
+    assert [mon_1.get() for _ in range(10)] == [mon_2.get() for _ in range(10)]
+
+
 def test_signal__init__(signal):
     """Test the BECProtocol class"""
     assert isinstance(signal, BECSignalProtocol)
@@ -209,6 +230,224 @@ def test_flyer__init__(flyer):
     assert isinstance(flyer, BECFlyerProtocol)
 
 
+def test_monitor_precompute_scan(monitor):
+    """Test that SimMonitor serves the planned positions of a step scan from the precomputed
+    model, and falls back to live evaluation."""
+    monitor.device_manager.add_device(name="samx", value=3)
+    monitor.scan_info = get_mock_scan_info(device=monitor)
+    monitor.sim.select_model("GaussianModel")
+    monitor.sim.params = {"ref_motor": "samx", "center": 0, "sigma": 5, "noise": "none"}
+    positions = np.asarray(monitor.scan_info.msg.info["positions"])[:, 0]
+    expected = [int(monitor.sim._eval_model(pos)) for pos in positions]
+    motor = monitor.device_manager.devices["samx"].obj
+    # Without precompute_scan, the motor is read at every point
+    monitor.stage()
+    with mock.patch.object(motor, "read", wraps=motor.read) as mock_read:
+        monitor.get()
+        assert mock_read.call_count == 1
+    monitor.unstage()
+    monitor.sim.precompute_scan = True
+    monitor.stage()
+    values = []
+    with mock.patch.object(monitor.sim, "_eval_model", wraps=monitor.sim._eval_model) as mock_eval:
+        for pos in positions:
+            motor.readback.put(pos + 0.1)
+            values.append(monitor.read()[monitor.name]["value"])
+            # Reads outside of the scan at the same position do not shift the later points
+            assert monitor.get() == values[-1]
+        assert values == expected
+        # The model is evaluated once, vectorized over the planned positions
+        assert mock_eval.call_count == 1
+        # Positions off the plan are evaluated live
+        motor.readback.put(3)
+        monitor.get()
+        assert mock_eval.call_count == 2
+        mock_eval.assert_called_with(3)
+        assert monitor.sim._scan_point == len(positions) - 1
+    monitor.unstage()
+    assert monitor.sim._scan_positions is None
+    # Noise is drawn per point
+    monitor.sim.params = {"noise": "poisson"}
+    monitor.stage()
+    values = []
+    for pos in positions:
+        motor.readback.put(pos)
+        values.append(monitor.get())
+    assert values != expected
+    assert np.allclose(values, expected, atol=10 * np.sqrt(np.max(expected)))
+    monitor.unstage()
+
+
+def test_monitor_precompute_grid_scan():
+    """Test the planned readbacks of a grid scan with the reference motor on the outer axis,
+    configured through sim_init."""
+    dm = DMMock()
+    dm.add_device(name="samx", value=0)
+    dm.add_device(name="samy", value=0)
+    monitor = SimMonitor(
+        name="monitor",
+        device_manager=dm,
+        sim_init={
+            "model": "GaussianModel",
+            "params": {"ref_motor": "samx", "center": 0, "sigma": 2, "noise": "none"},
+            "precompute_scan": True,
+            "scan_tolerance": 0.1,
+        },
+    )
+    assert monitor.sim.precompute_scan is True and monitor.sim.scan_tolerance == 0.1
+    x, y = np.meshgrid(np.linspace(-2, 2, 5), np.linspace(-2, 2, 5), indexing="ij")
+    positions = np.stack([x.ravel(), y.ravel()], axis=-1)
+    monitor.scan_info = get_mock_scan_info(device=monitor)
+    monitor.scan_info.msg.num_points = len(positions)
+    monitor.scan_info.msg.info.update(scan_motors=["samx", "samy"], positions=positions)
+    monitor.stage()
+    values = []
+    with mock.patch.object(monitor.sim, "_eval_model", wraps=monitor.sim._eval_model) as mock_eval:
+        for x_pos, y_pos in positions:
+            dm.devices["samx"].readback.put(x_pos)
+            dm.devices["samy"].readback.put(y_pos)
+            values.append(monitor.get())
+        # No point is evaluated live
+        assert mock_eval.call_count == 1
+    assert values == [int(monitor.sim._eval_model(pos)) for pos in positions[:, 0]]
+    assert monitor.sim._scan_point == len(positions) - 5
+    monitor.unstage()
+
+
+def test_async_mon_precompute_scan(async_monitor):
+    """Test that SimMonitorAsync serves each trigger from the precomputed model."""
+    async_monitor.scan_info = get_mock_scan_info(device=async_monitor)
+    async_monitor.sim.precompute_scan = True
+    async_monitor.sim.select_model("GaussianModel")
+    async_monitor.sim.params = {"ref_motor": "samx", "center": 0, "sigma": 5, "noise": "none"}
+    positions = np.asarray(async_monitor.scan_info.msg.info["positions"])[:, 0]
+    with mock.patch.object(async_monitor, "_send_data_to_bec"):
+        async_monitor.stage()
+        for _ in positions:
+            # Reads outside of a trigger do not shift the points of the triggers
+            async_monitor.read()
+            status_wait(async_monitor.on_trigger())
+        expected = [int(async_monitor.sim._eval_model(pos)) for pos in positions]
+        assert async_monitor.data_buffer["value"] == expected
+        async_monitor.unstage()
+    assert async_monitor.sim._scan_positions is None
+
+
+def test_monitor_motor_models(monitor):
+    """Test the models of several reference motors for scalar reads and bulk evaluation."""
+    monitor.device_manager.add_device(name="samx", value=1)
+    monitor.device_manager.add_device(name="samy", value=-2)
+    x, y = np.meshgrid(np.linspace(-5, 5, 11), np.linspace(-4, 4, 9))
+    grid = np.stack([x, y], axis=-1)
+    monitor.sim.select_model("MotorGaussianModel")
+    assert "ref_motor" not in monitor.sim.params
+    monitor.sim.params = {"center": [1, -1], "sigma": [2, 0.5], "noise": "none"}
+    expected = 100 * np.exp(-0.5 * (((x - 1) / 2) ** 2 + ((y + 1) / 0.5) ** 2))
+    np.testing.assert_allclose(monitor.sim.evaluate_model(grid), expected)
+    assert monitor.get() == int(100 * np.exp(-0.5 * 4))
+    monitor.sim.select_model("MotorPeaksModel")
+    monitor.sim.params = {
+        "peaks": [
+            {"amplitude": 100, "center": [1, -2], "sigma": 1},
+            {"amplitude": 50, "center": [0, 0], "sigma": [1, 2]},
+        ],
+        "noise": "none",
+    }
+    expected = 100 * np.exp(-0.5 * ((x - 1) ** 2 + (y + 2) ** 2)) + 50 * np.exp(
+        -0.5 * (x**2 + (y / 2) ** 2)
+    )
+    np.testing.assert_allclose(monitor.sim.evaluate_model(grid), expected)
+    assert monitor.get() == int(100 + 50 * np.exp(-0.5 * 2))
+    monitor.sim.select_model("MotorExpressionModel")
+    monitor.sim.params = {"expression": "10 * samx**2 + abs(samy)", "noise": "none"}
+    np.testing.assert_allclose(monitor.sim.evaluate_model(grid), 10 * x**2 + np.abs(y))
+    assert monitor.get() == 12
+    monitor.sim.params = {"expression": "42"}
+    assert monitor.sim.evaluate_model(grid).shape == x.shape
+    with pytest.raises(sim_data.SimulatedDataException):
+        monitor.sim.params = {"expression": "samz + 1"}
+    monitor.sim.select_model("MotorGaussianModel")
+    monitor.sim.params = {"noise": "none"}
+    params = deepcopy(monitor.sim.params)
+    value = monitor.get()
+    with pytest.raises(sim_data.SimulatedDataException):
+        monitor.sim.params = {"ref_motors": ["samx", "samy", "samz"], "center": [0, 1]}
+    # Invalid parameters are not applied, the device keeps working
+    assert monitor.sim.params == params
+    assert monitor.get() == value
+    monitor.sim.select_model("GaussianModel")
+    monitor.sim.params = {"center": 2, "noise": "none"}
+    value = monitor.get()
+    with pytest.raises(sim_data.SimulatedDataException):
+        monitor.sim.params = {"center": 5, "unknown": 1}
+    assert monitor.sim.params["center"] == 2
+    assert monitor.get() == value
+
+
+def test_monitor_motor_model_precompute_scan(monitor):
+    """Test the precomputation of a grid scan over the reference motors of a motor model."""
+    monitor.device_manager.add_device(name="samx", value=0)
+    monitor.device_manager.add_device(name="samy", value=0)
+    monitor.scan_info = get_mock_scan_info(device=monitor)
+    x, y = np.meshgrid(np.linspace(-3, 3, 7), np.linspace(-2, 2, 5))
+    positions = np.stack([x.ravel(), y.ravel()], axis=-1)
+    monitor.scan_info.msg.num_points = len(positions)
+    monitor.scan_info.msg.info.update(scan_motors=["samy", "samx"], positions=positions[:, ::-1])
+    monitor.sim.precompute_scan = True
+    monitor.sim.select_model("MotorGaussianModel")
+    monitor.sim.params = {"center": [1, 0], "sigma": [1, 2], "amplitude": 1000, "noise": "none"}
+    expected = monitor.sim.evaluate_model(positions).astype(int)
+    monitor.stage()
+    values = []
+    with mock.patch.object(monitor.sim, "_eval_model", wraps=monitor.sim._eval_model) as mock_eval:
+        for x_pos, y_pos in positions:
+            monitor.device_manager.devices["samx"].readback.put(x_pos)
+            monitor.device_manager.devices["samy"].readback.put(y_pos)
+            values.append(monitor.get())
+        assert mock_eval.call_count == 1
+    assert values == expected.tolist()
+    monitor.unstage()
+
+
+def test_monitor_model_lookup_shared(monitor, waveform):
+    """Test that the model lookup is built once per class and shared by its instances."""
+    assert "GaussianModel" in monitor.sim.model_lookup()
+    assert "MotorGaussianModel" in monitor.sim.model_lookup()
+    assert "MotorGaussianModel" not in waveform.sim.model_lookup()
+    assert SimWaveform(name="other_waveform").sim.model_lookup() is waveform.sim.model_lookup()
+    with mock.patch("ophyd_devices.sim.sim_data.inspect.getmembers") as mock_getmembers:
+        other = SimMonitor(name="other", device_manager=DMMock())
+        assert other.sim.model_lookup() is monitor.sim.model_lookup()
+        assert mock_getmembers.call_count == 0
+
+
+def test_monitor_compiled_model(monitor, waveform):
+    """Test that the compiled model evaluates like lmfit and is rebound by the params setter."""
+    x = np.linspace(-20, 20, 41)
+    # The waveform offers the lmfit models only
+    for model_name in waveform.sim.get_models():
+        monitor.sim.select_model(model_name)
+        assert monitor.sim._compiled_model is not None
+        with np.errstate(all="ignore"):
+            expected = monitor.sim._model.eval(params=monitor.sim._model_params, x=x)
+            np.testing.assert_allclose(monitor.sim._eval_model(x), expected, equal_nan=True)
+    monitor.sim.select_model("GaussianModel")
+    monitor.sim.params = {"center": 1, "sigma": 2, "noise": "none"}
+    expected = monitor.sim._model.eval(params=monitor.sim._model_params, x=0)
+    assert monitor.sim._eval_model(0) == pytest.approx(expected)
+    with mock.patch.object(monitor.sim._model, "eval", wraps=monitor.sim._model.eval) as mock_eval:
+        assert monitor.get() == int(expected)
+        assert mock_eval.call_count == 0
+        monitor.sim.use_compiled_model = False
+        assert monitor.get() == int(expected)
+        assert mock_eval.call_count == 1
+    waveform.sim.select_model("GaussianModel")
+    waveform.sim.params = {"center": 100, "sigma": 10, "noise": "none"}
+    reference = waveform.waveform.get()
+    waveform.sim.use_compiled_model = False
+    np.testing.assert_array_equal(waveform.waveform.get(), reference)
+
+
 def test_init_async_monitor(async_monitor):
     """Test the __init__ method of SimMonitorAsync."""
     assert isinstance(async_monitor, SimMonitorAsync)
@@ -379,6 +618,73 @@ def test_sim_linear_trajectory_positioner(linear_traj_positioner):
     assert pytest.approx(linear_traj_positioner.position - expected_pos, abs=1e-1) == 0
 
 
+def test_camera_position_grid_cache(camera):
+    """Test that the coordinate grid is cached per image shape."""
+    # pylint: disable=protected-access
+    camera.image.get()
+    grid = camera.sim._grid_cache[1]
+    assert not grid.flags.writeable
+    camera.image.get()
+    assert camera.sim._grid_cache[1] is grid
+    pos, _, _, _ = camera.sim._prepare_params_gauss(
+        amp=1, cov=None, offset=None, shape=list(camera.SHAPE)
+    )
+    assert pos is grid
+    camera.image_shape.set((40, 30)).wait()
+    assert camera.image.get().shape == (30, 40)
+    assert camera.sim._grid_cache[0] == (40, 30)
+    assert camera.sim._grid_cache[1] is not grid
+
+
+def test_camera_gaussian_template_cache(camera):
+    """Test that the noise-free gaussian is cached and invalidated on parameter changes."""
+    # pylint: disable=protected-access
+    camera.sim.params = {"noise": "none", "hot_pixel_coords": [], "hot_pixel_types": []}
+    camera.sim.params = {"hot_pixel_values": []}
+    img = camera.image.get()
+    template = camera.sim._template_cache[1]
+    assert not template.flags.writeable
+    assert np.array_equal(img, camera.BIT_DEPTH(template))
+    camera.image.get()
+    assert camera.sim._template_cache[1] is template
+    camera.sim.params = {"amplitude": 50}
+    assert camera.sim._template_cache is None
+    assert camera.image.get().max() == 50
+    template = camera.sim._template_cache[1]
+    # Direct modifications of the params dict are picked up as well
+    camera.sim.params["covariance"] = np.array([[100, 0], [0, 100]])
+    camera.image.get()
+    assert camera.sim._template_cache[1] is not template
+    camera.image_shape.set((50, 50)).wait()
+    assert camera.sim._template_cache is None
+    assert camera.image.get().shape == (50, 50)
+
+
+@pytest.mark.parametrize(
+    "cov, separable",
+    [([[400, 0], [0, 100]], True), ([[400, 100], [100, 400]], False), ([[50, 0], [0, 50]], True)],
+)
+def test_camera_separable_gaussian(camera, cov, separable):
+    """Test the separable fast path of the gaussian for diagonal covariance matrices."""
+    # pylint: disable=protected-access
+    shape = (120, 80)
+    cov = np.array(cov)
+    cen_off = np.array([10, -5])
+    pos = camera.sim._get_position_grid(shape)
+    fac = np.einsum("...k,kl,...l->...", pos - cen_off, np.linalg.inv(cov), pos - cen_off)
+    expected = np.exp(-fac / 2)
+    expected *= 100 / np.max(expected)
+    with mock.patch.object(
+        camera.sim, "_compute_separable_gaussian", wraps=camera.sim._compute_separable_gaussian
+    ) as separable_mock:
+        template = camera.sim._get_gaussian_template(amp=100, cov=cov, cen_off=cen_off, shape=shape)
+        v = camera.sim._compute_multivariate_gaussian(pos=pos, cen_off=cen_off, cov=cov, amp=100)
+        assert separable_mock.call_count == (2 if separable else 0)
+    assert template.shape == (80, 120)
+    assert np.allclose(template, expected)
+    assert np.allclose(v, expected)
+
+
 @pytest.mark.parametrize("proxy_active", [True, False])
 def test_sim_camera_proxies(camera, proxy_active):
     """Test mocking compute_method with framework class"""
@@ -504,6 +810,12 @@ def test_slitproxy(slitproxy_fixture):
     )
     assert (img[:, : edges[0]] == 0).all()
     assert (img[:, edges[1] :] == 0).all()
+    # Frames of the proxy are cropped and binned to the read out region of the camera
+    camera.readout_offset.set((10, 5)).wait()
+    camera.readout_size.set((40, 30)).wait()
+    assert np.array_equal(camera.image.get(), img[5:35, 10:50])
+    camera.binning.set(2).wait()
+    assert camera.image.get().shape == camera.sim.get_frame_shape() == (15, 20)
 
 
 def test_proxy_config_and_props_stay_in_sync(h5proxy_fixture: tuple[H5ImageReplayProxy, SimCamera]):
@@ -631,6 +943,679 @@ def test_cam_trigger(camera):
         assert mock_h5_writer.receive_data.call_count == 2
 
 
+@pytest.mark.parametrize("model", ["constant", "gaussian"])
+def test_camera_compute_burst(camera, model):
+    """Test that a burst of frames is computed as one stack."""
+    camera.sim.select_model(model)
+    camera.sim.params = {"noise": "none", "hot_pixel_coords": [[1, 1], [2, 2]]}
+    camera.sim.params = {"hot_pixel_types": ["constant", "fluctuating"]}
+    camera.sim.params = {"hot_pixel_values": [1000, 2000]}
+    data = camera.sim.compute_burst(signal_name=camera.image.name, burst=4)
+    assert data.shape == (4, *camera.SHAPE)
+    assert data.dtype == camera.BIT_DEPTH
+    assert (data[:, 1, 1] == 1000).all()
+    assert np.array_equal(data[0], camera.image.get())
+    assert np.array_equal(data[-1], camera.sim.sim_state[camera.image.name]["value"])
+    camera.sim.params = {"noise": "poisson"}
+    data = camera.sim.compute_burst(signal_name=camera.image.name, burst=3)
+    assert data.shape == (3, *camera.SHAPE)
+    assert not np.array_equal(data[0], data[1])
+
+
+@pytest.mark.parametrize("noise", ["none", "uniform", "poisson"])
+def test_camera_frame_pipeline(camera, noise):
+    """Test that frames are rendered in the target dtype, clipped and with reused buffers."""
+    # pylint: disable=protected-access
+    camera.sim.params = {"noise": noise, "amplitude": 1e6}
+    img = camera.image.get()
+    assert img.dtype == camera.BIT_DEPTH
+    assert img.max() == np.iinfo(camera.BIT_DEPTH).max
+    assert img.min() >= 0
+    buffers = dict(camera.sim._scratch_buffers)
+    assert all(buffer.dtype == np.float32 for buffer in buffers.values())
+    camera.image.get()
+    assert all(camera.sim._scratch_buffers[k] is v for k, v in buffers.items())
+    camera.sim.params = {"amplitude": 100, "hot_pixel_coords": []}
+    img = camera.image.get()
+    template = camera.sim._template_cache[1]
+    assert np.isclose(img.mean(), template.mean(), rtol=0.1, atol=1)
+
+
+@pytest.mark.parametrize("noise", ["poisson", "uniform", "none", "normal", "noise_bank"])
+def test_camera_tiled_rendering(camera, noise, monkeypatch):
+    """Test that tiled frames are identical for a fixed seed, independent of the worker count."""
+    # pylint: disable=protected-access
+    monkeypatch.setattr(sim_data, "RENDER_TILE_SIZE", 1000)
+    camera.image_shape.set((64, 48)).wait()
+    camera.sim.params = {"noise": noise, "covariance": [[400, 100], [100, 300]]}
+    assert len(camera.sim._get_tiles((64, 48))) == 4
+    frames = []
+    for workers in (1, 3):
+        camera.render_workers.set(workers).wait()
+        camera.sim.set_seed(11)
+        camera.sim._invalidate_cache()
+        frames.append(camera.sim.compute_burst(signal_name=camera.image.name, burst=2))
+    assert camera.sim.render_workers == 3
+    assert np.array_equal(frames[0], frames[1])
+    template = camera.sim._template_cache[1]
+    monkeypatch.setattr(sim_data, "RENDER_TILE_SIZE", 2**18)
+    camera.sim._invalidate_cache()
+    assert np.allclose(camera.sim._get_template((64, 48)), template)
+
+
+@pytest.mark.parametrize("noise", ["normal", "noise_bank"])
+@pytest.mark.parametrize("amplitude", [20, 1000])
+def test_camera_poisson_approximation(camera, noise, amplitude):
+    """Test that the approximations of Poisson noise match its mean, variance and distribution."""
+    camera.sim.select_model("constant")
+    camera.image_shape.set((200, 250)).wait()
+    camera.sim.params = {
+        "amplitude": amplitude,
+        "hot_pixel_coords": [],
+        "hot_pixel_types": [],
+        "hot_pixel_values": [],
+    }
+    camera.sim.set_seed(0)
+    frames = {}
+    for noise_type in ("poisson", noise):
+        camera.sim.params = {"noise": noise_type}
+        frames[noise_type] = camera.sim.compute_burst(signal_name=camera.image.name, burst=4)
+    counts = frames[noise].astype(float)
+    # Counts are integers, with the mean and variance of the Poisson distribution
+    assert np.array_equal(counts, np.rint(counts))
+    error = np.sqrt(amplitude / counts.size)
+    assert abs(counts.mean() - amplitude) < 5 * error
+    assert abs(counts.var() / amplitude - 1) < 5 * np.sqrt(2 / counts.size)
+    # Same distribution as the exact Poisson noise, compared on quantiles. The tolerance
+    # covers the skewness of the Poisson distribution neglected by the normal approximation
+    quantiles = [0.01, 0.1, 0.5, 0.9, 0.99]
+    exact = np.quantile(frames["poisson"], quantiles)
+    assert np.allclose(np.quantile(counts, quantiles), exact, atol=1 + 0.1 * np.sqrt(amplitude))
+    # Frames of a burst are independent
+    assert not np.array_equal(frames[noise][0], frames[noise][1])
+    camera.sim.set_seed(3)
+    first = camera.image.get()
+    camera.sim.set_seed(3)
+    assert np.array_equal(first, camera.image.get())
+
+
+def test_camera_poisson_approximation_threshold(camera):
+    """Test that counts below the threshold are drawn exactly and above from the noise bank."""
+    # pylint: disable=protected-access
+    lam = np.tile(np.array([0.5, 5, 150, 5000], dtype=np.float32), (20, 1))
+    out = np.empty(lam.shape, dtype=np.float32)
+    camera.sim.set_seed(1)
+    camera.sim._draw_poisson_approximation(lam, out=out, rng=camera.sim.rng, noise="noise_bank")
+    assert out[:, :2].max() < 30
+    # Counts above the threshold are rounded normal samples of the bank, at a random shift
+    rng = np.random.default_rng(np.random.SeedSequence(1))
+    start = rng.integers(sim_data.NOISE_BANK_SIZE)
+    bank = np.resize(rng.standard_normal(sim_data.NOISE_BANK_SIZE, dtype=np.float32), start + 40)
+    high = lam[:, 2:].ravel()
+    expected = np.rint(high + np.sqrt(high) * bank[start : start + 40])
+    assert np.array_equal(out[:, 2:].ravel(), expected)
+    assert camera.sim._noise_bank.size >= sim_data.NOISE_BANK_SIZE + 40
+    camera.sim.normal_threshold = np.inf
+    camera.sim._draw_poisson_approximation(lam, out=out, rng=camera.sim.rng, noise="normal")
+    assert np.array_equal(out, np.rint(out))
+
+
+@pytest.mark.parametrize("noise", ["normal", "noise_bank"])
+def test_waveform_poisson_approximation(waveform, noise):
+    """Test the approximations of Poisson noise for the waveform."""
+    waveform.waveform_shape.put(20000)
+    waveform.sim.select_model("ConstantModel")
+    waveform.sim.params = {"c": 400, "noise": noise}
+    data = waveform.waveform.get().astype(float)
+    assert data.shape == (20000,)
+    assert abs(data.mean() - 400) < 5 * np.sqrt(400 / data.size)
+    assert abs(data.var() / 400 - 1) < 5 * np.sqrt(2 / data.size)
+
+
+@pytest.mark.parametrize(
+    "cov", [[[400, 0], [0, 300]], [[400, 100], [100, 300]], [[90, 80], [80, 90]]]
+)
+def test_camera_readout_region(camera, cov):
+    """Test that the hardware ROI and binning only simulate the read out pixels."""
+    # pylint: disable=protected-access
+    camera.image_shape.set((120, 90)).wait()
+    camera.sim.params = {"noise": "none", "covariance": cov, "center_offset": [30, -20]}
+    full = camera.sim._get_template((120, 90)).astype(float)
+    camera.sim._grid_cache = None
+    camera.readout_offset.set((10, 5)).wait()
+    camera.readout_size.set((70, 60)).wait()
+    assert camera.sim.get_frame_shape() == (60, 70)
+    readout = camera.sim._get_readout((120, 90))
+    assert np.allclose(camera.sim._get_template((120, 90), readout=readout), full[5:65, 10:80])
+    assert camera.image.get().shape == (60, 70)
+    camera.sim.compute_sim_state(signal_name=camera.image.name, compute_readback=False)
+    assert camera.sim.sim_state[camera.image.name]["value"].shape == (60, 70)
+    # The coordinate grid of the full frame is not built
+    assert camera.sim._grid_cache is None
+    camera.binning.set(4).wait()
+    assert camera.sim.get_frame_shape() == (15, 17)
+    binned = full[5:65, 10:78].reshape(15, 4, 17, 4).sum(axis=(1, 3))
+    readout = camera.sim._get_readout((120, 90))
+    template = camera.sim._get_template((120, 90), readout=readout)
+    if camera.sim._is_separable(np.array(cov)):
+        assert np.allclose(template, binned, rtol=1e-5)
+    else:
+        # Binned pixels are evaluated at their center
+        assert np.isclose(template.sum(), binned.sum(), rtol=0.05)
+        assert np.argmax(template) == np.argmax(binned)
+    # Size 0 extends to the edge of the frame, the region is clipped to the frame
+    camera.readout_size.set((0, 200)).wait()
+    camera.binning.set(1).wait()
+    assert camera.sim.get_frame_shape() == (85, 110)
+    camera.readout_offset.set((0, 0)).wait()
+    camera.readout_size.set((0, 0)).wait()
+    assert camera.sim._get_readout((120, 90)) is None
+    assert np.array_equal(camera.sim._get_template((120, 90)), full.astype(np.float32))
+
+
+def test_camera_readout_region_hot_pixels(camera):
+    """Test that hot pixels are remapped to the read out region and frames have its shape."""
+    camera.sim.select_model("constant")
+    camera.sim.params = {
+        "noise": "none",
+        "amplitude": 10,
+        "hot_pixel_coords": [[20, 30], [21, 31], [2, 2], [50, 20]],
+        "hot_pixel_types": ["constant", "constant", "constant", "fluctuating"],
+        "hot_pixel_values": [1000, 1000, 1000, 1000],
+    }
+    camera.readout_offset.set((20, 10)).wait()
+    camera.readout_size.set((60, 40)).wait()
+    camera.binning.set(2).wait()
+    frame = camera.image.get()
+    assert frame.shape == (20, 30)
+    expected = np.full((20, 30), 40)
+    expected[5, 5] = 1000
+    assert np.array_equal(frame, expected)
+    events = camera.sim.compute_events(signal_name=camera.image.name)
+    assert np.array_equal(events["y"][events["count"] == 1000], [5])
+    camera.burst.put(2)
+    camera.frame_pool_size.put(2)
+    data = camera._acquire_frames(burst=2)  # pylint: disable=protected-access
+    assert all(entry.shape == (20, 30) for entry in data)
+
+
+def test_camera_hot_pixels_vectorized(camera, tmp_path):
+    """Test hot pixels given as coordinate arrays, scalar values and boolean masks."""
+    # pylint: disable=protected-access
+    v = np.zeros((2, 10, 10))
+    v[0, 5, 5] = 10
+    v[1, 5, 5] = 1
+    v[:, 6, 6] = 6
+    coords = np.array([[5, 5], [6, 6], [1, 2], [20, 20]])
+    types = ["fluctuating", "fluctuating", "constant", "constant"]
+    out = camera.sim._add_hot_pixel(v.copy(), coords=coords, hot_pixel_types=types, values=100)
+    # The frame maximum is computed once, before hot pixels are applied
+    assert out[0, 5, 5] == 100 and out[0, 6, 6] == 100
+    assert out[1, 5, 5] == 1 and out[1, 6, 6] == 100
+    assert (out[:, 1, 2] == 100).all()
+    assert out.sum() == 100 * 5 + 1
+    mask = np.zeros((10, 10), dtype=bool)
+    mask[3, 4] = mask[7, 8] = True
+    out = camera.sim._add_hot_pixel(
+        np.zeros((10, 10)), coords=mask, hot_pixel_types="constant", values=5
+    )
+    assert np.array_equal(out, 5 * mask)
+    mask_file = str(tmp_path / "mask.npy")
+    np.save(mask_file, mask)
+    camera.sim.params = {"noise": "none", "hot_pixel_coords": mask_file}
+    camera.sim.params = {"hot_pixel_types": "constant", "hot_pixel_values": 1000}
+    img = camera.image.get()
+    assert img[3, 4] == 1000 and img[7, 8] == 1000
+    coords = [[5, 5], [10, 10]]
+    camera.sim.params = {"hot_pixel_coords": coords, "hot_pixel_types": ["constant", "constant"]}
+    assert camera.image.get()[10, 10] == 1000
+    # In-place edits of the parameters are picked up by the cached hot pixel table
+    camera.sim.params["hot_pixel_coords"][1] = [60, 60]
+    img = camera.image.get()
+    assert img[60, 60] == 1000 and img[10, 10] != 1000
+
+
+def test_cam_trigger_burst(camera):
+    """Test that a burst is published frame by frame and written to disk as one block."""
+    camera.burst.put(5)
+    camera.write_to_disk.put(True)
+    with (
+        mock.patch.object(camera, "h5_writer") as mock_h5_writer,
+        mock.patch.object(camera, "_run_subs") as mock_run_subs,
+    ):
+        status = camera.trigger()
+        status_wait(status)
+        assert mock_run_subs.call_count == 5
+        assert mock_run_subs.call_args.kwargs["value"].shape == camera.SHAPE
+        assert mock_h5_writer.receive_data.call_count == 1
+        data = mock_h5_writer.receive_data.call_args.args[0]
+        assert data.shape == (5, *camera.SHAPE)
+        assert mock_h5_writer.receive_data.call_args.kwargs["stacked"] is True
+
+
+def test_cam_prefetch_frames(camera):
+    """Test serving triggers from the prefetch ring and flushing it on parameter changes."""
+    assert camera.prefetcher.running is False
+    camera.prefetch_frames.put(3)
+    try:
+        assert camera.prefetcher.running is True
+        timeout = time.time() + 10
+        while len(camera.prefetcher) < 3 and time.time() < timeout:
+            time.sleep(0.01)
+        assert len(camera.prefetcher) == 3
+        status = camera.trigger()
+        status_wait(status)
+        assert camera.prefetch_hits.get() == 1
+        assert camera.prefetch_misses.get() == 0
+        # Frames prefetched with the old parameters are flushed, not served
+        camera.sim.params = {"noise": "none", "hot_pixel_coords": []}
+        frame = None
+        while frame is None and time.time() < timeout:
+            frame = camera.prefetcher.pop()
+        assert np.array_equal(frame, camera.image.get())
+        assert camera.prefetch_refill_lag.get() >= 0
+    finally:
+        camera.prefetch_frames.put(0)
+    assert camera.prefetcher.running is False
+    assert len(camera.prefetcher) == 0
+
+
+def test_frame_prefetcher_survives_producer_errors():
+    """Test that the producer thread keeps running if computing a frame raises."""
+    calls = []
+
+    def produce():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ValueError("simulated failure")
+        return np.zeros(2)
+
+    prefetcher = FramePrefetcher(produce, lambda: 0)
+    prefetcher.start(2)
+    try:
+        timeout = time.time() + 10
+        while len(prefetcher) < 2 and time.time() < timeout:
+            time.sleep(0.01)
+        assert prefetcher.running is True
+        assert len(prefetcher) == 2
+        assert prefetcher.pop() is not None
+    finally:
+        prefetcher.stop()
+    assert prefetcher.running is False
+
+
+def test_cam_shared_memory_frames(camera):
+    """Test handing frames to consumers through the shared memory ring."""
+    descriptors = []
+    camera.subscribe(
+        lambda value, **kwargs: descriptors.append(value), event_type=camera.SUB_SHARED_FRAME
+    )
+    camera.shared_memory_slots.put(2)
+    camera.burst.put(3)
+    try:
+        status_wait(camera.trigger())
+        assert [entry["frame_number"] for entry in descriptors] == [0, 1, 2]
+        assert [entry["slot"] for entry in descriptors] == [0, 1, 0]
+        assert descriptors[-1]["shape"] == tuple(camera.image_shape.get())
+        assert np.dtype(descriptors[-1]["dtype"]) == camera.BIT_DEPTH
+        consumer = SharedFrameRing.attach(camera.shared_memory_name.get())
+        try:
+            # The first frame was overwritten by the third one
+            assert consumer.read(descriptors[0]) is None
+            last_frame = camera.sim.sim_state[camera.image.name]["value"]
+            assert np.array_equal(consumer.read(descriptors[2]), last_frame)
+            with pytest.raises(RuntimeError):
+                consumer.write(camera.image.get())
+        finally:
+            consumer.close()
+        # The ring is reallocated if frames do not fit into its slots anymore
+        name = camera.shared_memory_name.get()
+        camera.image_shape.set((200, 200)).wait()
+        status_wait(camera.trigger())
+        assert camera.shared_memory_name.get() != name
+        assert camera.shared_ring.frames_written == 3
+    finally:
+        camera.shared_memory_slots.put(0)
+    assert camera.shared_ring is None
+    assert camera.shared_memory_name.get() == ""
+
+
+def test_cam_frame_pool(camera, tmp_path):
+    """Test that triggers reuse pooled frame buffers once the H5Writer and sim_state are done."""
+    camera.frame_pool_size.put(4)
+    assert camera.frame_pool.size == 4 and camera.frame_pool.in_use == 0
+    camera.burst.put(2)
+    status_wait(camera.trigger())
+    # The last frame is held by sim_state until the next trigger
+    assert camera.frame_pool_in_use.get() == 1
+    held = camera.sim.sim_state[camera.image.name]["value"]
+    status_wait(camera.trigger())
+    assert camera.frame_pool_in_use.get() == 1
+    # The previously held frame went back to the pool
+    # pylint: disable=protected-access
+    assert any(buffer is held for buffer in camera.frame_pool._free)
+    # Frames are held by the H5Writer until they are written to disk
+    camera.h5_writer.on_stage(file_path=str(tmp_path / "data.h5"), h5_entry="/entry/data/data")
+    camera.write_to_disk.put(True)
+    status_wait(camera.trigger())
+    assert camera.frame_pool_in_use.get() == 2
+    # Two buffers are free, the third frame of the burst is a fresh allocation
+    camera.burst.put(3)
+    status_wait(camera.trigger())
+    assert camera.frame_pool_exhausted.get() == 1
+    # The writer flushed all frames to disk and the last frame is not pooled
+    assert camera.frame_pool_in_use.get() == 0
+    with h5py.File(tmp_path / "data.h5", "r") as f:
+        assert f["/entry/data/data"].shape == (5, *camera.SHAPE)
+    camera.write_to_disk.put(False)
+    camera.image_shape.set((20, 30)).wait()
+    status_wait(camera.trigger())
+    frame_shape = camera.sim.sim_state[camera.image.name]["value"].shape
+    assert camera.frame_pool.checkout(1)[0].shape == frame_shape
+
+
+def test_cam_movie_bank(camera, tmp_path):
+    """Test that triggers cycle through the movie bank prepared on stage."""
+    published = []
+    camera.subscribe(
+        lambda value, **kwargs: published.append(value), event_type="device_monitor_2d"
+    )
+    camera.scan_info = get_mock_scan_info(device=camera)
+    camera.movie_bank_frames.put(3)
+    with mock.patch.object(camera.file_utils, "get_full_path", return_value=""):
+        camera.stage()
+    try:
+        assert camera.movie_bank.shape == (3, *camera.SHAPE)
+        assert camera.movie_bank.flags.writeable is False
+        for _ in range(4):
+            status_wait(camera.trigger())
+        assert all(frame is not None for frame in published)
+        assert np.shares_memory(published[0], camera.movie_bank)
+        assert np.array_equal(published[3], published[0])
+        assert not np.array_equal(published[1], published[0])
+    finally:
+        camera.unstage()
+    assert camera.movie_bank is None
+    bank = np.arange(2 * 4 * 5).reshape(2, 4, 5)
+    np.save(tmp_path / "bank.npy", bank)
+    camera.movie_bank_frames.put(0)
+    camera.movie_bank_file.put(str(tmp_path / "bank.npy"))
+    camera.prepare_movie_bank()
+    assert np.array_equal(camera.movie_bank, bank)
+    assert camera.movie_bank.dtype == camera.BIT_DEPTH
+    with h5py.File(tmp_path / "bank.h5", "w") as f:
+        f.create_dataset(camera.H5_ENTRY, data=bank)
+    camera.movie_bank_frames.put(1)
+    camera.movie_bank_file.put(str(tmp_path / "bank.h5"))
+    camera.prepare_movie_bank()
+    assert np.array_equal(camera.movie_bank, bank[:1])
+
+
+def test_cam_free_running(camera):
+    """Test free-running acquisition between kickoff and complete with dropped frame accounting."""
+    numbers = []
+    camera.subscribe(
+        lambda **kwargs: numbers.append(camera.frame_number.get()), event_type=camera.SUB_MONITOR
+    )
+    camera.frame_period.put(0.01)
+    status_wait(camera.kickoff())
+    time.sleep(0.2)
+    status_wait(camera.complete())
+    assert camera._free_run_thread is None  # pylint: disable=protected-access
+    num_frames = len(numbers)
+    time.sleep(0.05)
+    assert len(numbers) == num_frames > 5
+    assert numbers[0] == 0
+    # Slow consumers block the loop, frames are late and dropped
+    camera.subscribe(lambda **kwargs: time.sleep(0.05), event_type=camera.SUB_MONITOR)
+    numbers.clear()
+    status_wait(camera.kickoff())
+    time.sleep(0.3)
+    status_wait(camera.complete())
+    assert camera.late_frames.get() > 0
+    assert camera.dropped_frames.get() > 0
+    # Frame numbers increase monotonically, with gaps for the dropped frames
+    assert all(later > earlier for earlier, later in zip(numbers, numbers[1:]))
+    assert numbers[-1] + 1 - len(numbers) <= camera.dropped_frames.get()
+
+
+def test_camera_photon_events(camera):
+    """Test sampling sparse photon events, equivalent to dense frames with poisson noise."""
+    camera.sim.set_seed(3)
+    camera.sim.params = {"amplitude": 2, "noise": "poisson", "hot_pixel_coords": []}
+    shape = camera.sim.get_frame_shape()
+    events = camera.sim.compute_events(signal_name=camera.image.name)
+    assert set(events) == {"x", "y", "count"}
+    assert events["count"].dtype == camera.BIT_DEPTH
+    assert (events["count"] > 0).all()
+    frame = camera.sim.events_to_dense(events, shape=shape, dtype=camera.BIT_DEPTH)
+    template = camera.sim._template_cache[1]  # pylint: disable=protected-access
+    assert np.isclose(frame.sum(), template.sum(), rtol=0.05)
+    assert np.isclose(frame.sum(), camera.image.get().sum(), rtol=0.05)
+    # Hot pixels are applied as for dense frames
+    camera.sim.params = {
+        "hot_pixel_coords": np.array([[1, 2], [3, 4], [50, 50]]),
+        "hot_pixel_types": ["constant", "fluctuating", "fluctuating"],
+        "hot_pixel_values": np.array([1e4, 1e4, 1e4]),
+        "amplitude": 1e3,
+    }
+    frame = camera.sim.events_to_dense(
+        camera.sim.compute_events(signal_name=camera.image.name), shape, camera.BIT_DEPTH
+    )
+    assert frame[1, 2] == 10000 and frame[3, 4] < 10000 and frame[50, 50] == 10000
+
+
+def test_cam_photon_events_trigger(camera, tmp_path):
+    """Test publishing and writing sparse photon events on trigger."""
+    published = []
+    camera.subscribe(lambda value, **kwargs: published.append(value), event_type=camera.SUB_EVENTS)
+    camera.sparse_events.put(True)
+    camera.burst.put(4)
+    camera.write_to_disk.put(True)
+    assert camera.h5_entry == camera.H5_EVENT_ENTRY
+    file_path = str(tmp_path / "events.h5")
+    camera.h5_writer.on_stage(file_path=file_path, h5_entry=camera.h5_entry)
+    status_wait(camera.trigger())
+    status_wait(camera.complete())
+    assert len(published) == 4
+    with h5py.File(file_path, "r") as f:
+        group = f[camera.H5_EVENT_ENTRY]
+        assert group.attrs["num_frames"] == 4
+        assert len(group["x"]) == sum(len(events["x"]) for events in published)
+        assert np.array_equal(group["count"][: len(published[0]["count"])], published[0]["count"])
+        assert np.array_equal(np.unique(group["frame"]), np.arange(4))
+
+
+def test_cam_roi_statistics(camera):
+    """Test the statistics of the regions of interest, computed when frames are published."""
+    # Disabled ROIs are neither read nor hinted
+    assert camera.read() == {}
+    assert camera.hints == {"fields": []}
+    camera.roi1.region.put((10, 20, 30, 15))
+    camera.roi2.region.put((90, 90, 50, 50))
+    status_wait(camera.trigger())
+    frame = camera.sim.sim_state[camera.image.name]["value"].astype(float)
+    roi = frame[20:35, 10:40]
+    assert camera.roi1.roi_sum.get() == roi.sum()
+    assert camera.roi1.mean.get() == roi.mean()
+    assert camera.roi1.roi_max.get() == roi.max()
+    rows, cols = np.indices(frame.shape)
+    assert np.isclose(camera.roi1.centroid_x.get(), (roi * cols[20:35, 10:40]).sum() / roi.sum())
+    assert np.isclose(camera.roi1.centroid_y.get(), (roi * rows[20:35, 10:40]).sum() / roi.sum())
+    # Regions are clipped to the frame
+    assert camera.roi2.roi_sum.get() == frame[90:, 90:].sum()
+    assert camera.roi3.roi_sum.get() == 0
+    reading = camera.read()
+    assert camera.roi1.roi_sum.name in reading and camera.roi1.centroid_y.name in reading
+    assert camera.roi1.roi_sum.name in camera.hints["fields"]
+    assert camera.roi3.roi_sum.name not in reading
+    assert camera.roi3.roi_sum.name not in camera.hints["fields"]
+    camera.roi1.region.put((0, 0, 0, 0))
+    assert camera.roi1.roi_sum.name not in camera.read()
+    assert camera.roi1.roi_sum.name not in camera.hints["fields"]
+    camera.roi1.region.put((10, 20, 30, 15))
+    # The statistics of a burst cover all of its frames
+    frames = []
+    camera.subscribe(lambda value, **kwargs: frames.append(value), event_type=camera.SUB_MONITOR)
+    camera.sim.params = {"noise": "poisson"}
+    camera.burst.put(3)
+    status_wait(camera.trigger())
+    stack = np.stack(frames[-3:]).astype(float)[:, 20:35, 10:40]
+    assert camera.roi1.roi_sum.get() == stack.sum()
+    assert np.isclose(camera.roi1.mean.get(), stack.mean())
+    assert camera.roi1.roi_max.get() == stack.max()
+    summed = stack.sum(axis=0)
+    assert np.isclose(
+        camera.roi1.centroid_x.get(), (summed * cols[20:35, 10:40]).sum() / summed.sum()
+    )
+    # Photon events give the same statistics as their dense frames
+    camera.sparse_events.put(True)
+    events = []
+    camera.subscribe(lambda value, **kwargs: events.append(value), event_type=camera.SUB_EVENTS)
+    status_wait(camera.trigger())
+    stack = np.stack(
+        [
+            camera.sim.events_to_dense(entry, shape=frame.shape, dtype=camera.BIT_DEPTH)
+            for entry in events[-3:]
+        ]
+    ).astype(float)[:, 20:35, 10:40]
+    assert camera.roi1.roi_sum.get() == stack.sum()
+    assert np.isclose(camera.roi1.mean.get(), stack.mean())
+    assert camera.roi1.roi_max.get() == stack.max()
+    summed = stack.sum(axis=0)
+    assert np.isclose(
+        camera.roi1.centroid_x.get(), (summed * cols[20:35, 10:40]).sum() / summed.sum()
+    )
+
+
+def test_cam_preview(camera):
+    """Test the rate-limited and binned preview, published independently of the frame rate."""
+    previews = []
+    camera.subscribe(lambda value, **kwargs: previews.append(value), event_type=camera.SUB_MONITOR)
+    # Without rate limit, every frame is published directly
+    camera.burst.put(3)
+    status_wait(camera.trigger())
+    assert len(previews) == 3
+    assert previews[-1].shape == camera.sim.get_frame_shape()
+    # Binned preview, trailing pixels that do not fill a block are dropped
+    camera.preview_binning.put(3)
+    status_wait(camera.trigger())
+    frame = camera.sim.sim_state[camera.image.name]["value"]
+    rows, cols = (size // 3 for size in frame.shape)
+    binned = frame[: rows * 3, : cols * 3].reshape(rows, 3, cols, 3).mean(axis=(1, 3))
+    assert previews[-1].shape == (rows, cols)
+    assert previews[-1].dtype == frame.dtype
+    assert np.array_equal(previews[-1], binned.astype(frame.dtype))
+    # Rate limited, the latest frame wins and replaced frames are counted as dropped
+    previews.clear()
+    camera.preview_binning.put(1)
+    camera.preview_rate.put(5)
+    camera.burst.put(10)
+    status_wait(camera.trigger())
+    frame = camera.sim.sim_state[camera.image.name]["value"].copy()
+    timeout = time.time() + 5
+    while len(previews) < 1 or not np.array_equal(previews[-1], frame):
+        assert time.time() < timeout
+        time.sleep(0.05)
+    assert len(previews) < 10
+    assert camera.preview_dropped.get() == 10 - len(previews)
+    camera.destroy()
+    assert not camera.preview._running
+
+
+def test_waveform_preview(waveform):
+    """Test the binned preview of the waveform."""
+    waveform.waveform_shape.put(100)
+    waveform.preview_binning.put(10)
+    waveform.connector = mock.MagicMock()
+    mock_run_subs = waveform._run_subs = mock.MagicMock()
+    waveform.scan_info = get_mock_scan_info(device=waveform)
+    status_wait(waveform.trigger())
+    assert mock_run_subs.call_count == 1
+    assert mock_run_subs.call_args.kwargs["value"].shape == (10,)
+
+
+def test_describe_without_simulation(camera, waveform):
+    """Test that computed signals are described from their declared shape, without computing."""
+    with mock.patch.object(camera.sim, "compute_sim_state") as mock_compute:
+        camera.image_shape.set((300, 200)).wait()
+        assert camera.image.describe()[camera.image.name]["shape"] == [200, 300]
+        camera.sim.select_model("constant")
+        assert camera.image.describe()[camera.image.name]["shape"] == [300, 200]
+        camera.readout_size.set((50, 40)).wait()
+        camera.binning.set(2).wait()
+        assert camera.image.describe()[camera.image.name]["shape"] == [20, 25]
+        camera.describe()
+        camera.describe_configuration()
+        assert mock_compute.call_count == 0
+    assert camera.image.get().shape == (20, 25)
+    with mock.patch.object(waveform.sim, "compute_sim_state") as mock_compute:
+        description = waveform.describe()[waveform.waveform.name]
+        assert description == {
+            "source": f"SIM:{waveform.waveform.name}",
+            "dtype": "array",
+            "shape": [1000],
+            "precision": 3,
+        }
+        waveform.waveform_shape.put(50)
+        assert waveform.describe()[waveform.waveform.name]["shape"] == [50]
+        assert mock_compute.call_count == 0
+    # The description is cached until the shape changes
+    with mock.patch("ophyd_devices.sim.sim_signals.describe_signal") as mock_describe:
+        waveform.describe()
+        assert mock_describe.call_count == 0
+        waveform.waveform_shape.put(60)
+        waveform.describe()
+        waveform.waveform_shape.describe()
+        assert mock_describe.call_count == 2
+
+
+def test_read_single_evaluation(monitor, async_monitor):
+    """Test that value and timestamp of a read stem from the same evaluation."""
+    timestamps = iter(range(100))
+    with mock.patch("ophyd_devices.sim.sim_data.ttime.time", side_effect=lambda: next(timestamps)):
+        reading = monitor.read()[monitor.name]
+        state = monitor.sim.sim_state[monitor.name]
+        assert reading == {"value": state["value"], "timestamp": state["timestamp"]}
+        # A later evaluation replaces the state instead of updating the previous one
+        monitor.get()
+        assert monitor.sim.sim_state[monitor.name] is not state
+        assert state["timestamp"] == reading["timestamp"]
+    # Keep the data buffer, the random send interval may flush it on the first trigger
+    with (
+        mock.patch.object(
+            async_monitor.sim, "read_sim_state", wraps=async_monitor.sim.read_sim_state
+        ) as mock_read,
+        mock.patch.object(async_monitor, "_send_data_to_bec"),
+    ):
+        async_monitor.on_stage()
+        status_wait(async_monitor.on_trigger())
+        assert mock_read.call_count == 1
+    assert async_monitor.data_buffer["value"][-1] == async_monitor.readback._value
+
+
+def test_read_cycle_memoizes_computation(camera, waveform):
+    """Test that computed signals are evaluated once within a read of the device."""
+    with mock.patch.object(
+        camera.sim, "compute_sim_state", wraps=camera.sim.compute_sim_state
+    ) as mock_compute:
+        with camera.sim.read_cycle():
+            image = camera.image.get()
+            with camera.sim.read_cycle():
+                reading = camera.image.read()[camera.image.name]
+            assert reading["value"] is image
+        assert mock_compute.call_count == 1
+        # Outside of a read cycle, every read computes a new value
+        assert camera.image.get() is not image
+        assert mock_compute.call_count == 2
+    with mock.patch.object(
+        waveform.sim, "compute_sim_state", wraps=waveform.sim.compute_sim_state
+    ) as mock_compute:
+        reading = waveform.read()[waveform.waveform.name]
+        assert mock_compute.call_count == 1
+        assert reading["timestamp"] == waveform.sim.sim_state[waveform.waveform.name]["timestamp"]
+
+
 def test_h5writer(tmp_path):
     """Test the H5Writer class"""
 
@@ -653,6 +1638,11 @@ def test_h5writer(tmp_path):
     h5_writer.receive_data(new_data)
     h5_writer.on_complete()
     assert h5_writer.data_container == []
+    h5_writer.receive_data(np.array([[5, 6], [7, 8]]), stacked=True)
+    assert len(h5_writer.data_container) == 2
+    h5_writer.on_complete()
+    with h5py.File(fp, "r") as f:
+        assert f["entry/data/data"].shape == (6, 2)
 
 
 def test_async_monitor_stage(async_monitor):
@@ -725,6 +1715,20 @@ def test_async_mon_send_data_to_bec(async_monitor):
         assert async_monitor.data_buffer["value"] == []
 
 
+def test_async_mon_send_data_to_bec_encoded(async_monitor):
+    """Test that the bundled data of SimMonitorAsync is sent encoded if configured."""
+    async_monitor.scan_info = get_mock_scan_info(device=async_monitor)
+    async_monitor.array_encoding.put("lz4")
+    async_monitor.data_buffer.update({"value": list(range(1000)), "timestamp": [0.0] * 1000})
+    with mock.patch.object(async_monitor.connector, "xadd") as mock_xadd:
+        async_monitor._send_data_to_bec()
+    signals = mock_xadd.call_args.args[1]["data"].signals
+    assert signals[async_monitor.readback.name]["value"]["__ophyd_array__"] == "lz4"
+    decoded = decode_signals(signals)[async_monitor.readback.name]
+    assert np.array_equal(decoded["value"], np.arange(1000))
+    assert np.array_equal(decoded["timestamp"], np.zeros(1000))
+
+
 def test_positioner_updated_timestamp(positioner):
     """Test the updated_timestamp method of SimPositioner."""
     positioner.sim.sim_state[positioner.name]["value"] = 1
@@ -1,9 +1,19 @@
 import threading
 import time
 
+import numpy as np
 import pytest
+from bec_lib import messages
+from bec_lib.serialization import MsgpackSerialization
 from ophyd import Device
 
+from ophyd_devices.utils.array_encoding import (
+    ENCODED_ARRAY_KEY,
+    decode_array,
+    decode_signals,
+    encode_array,
+    encode_signals,
+)
 from ophyd_devices.utils.psi_device_base_utils import (
     FileHandler,
     TaskHandler,
@@ -180,3 +190,44 @@ def test_utils_task_handler_shutdown(task_handler):
     assert status1.state == TaskState.KILLED
     assert status2.state == TaskState.KILLED
     assert status1.exception().__class__ == TaskKilledError
+
+
+@pytest.mark.parametrize("encoding", ["raw", "lz4", "bitshuffle"])
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.arange(5000, dtype=np.float64),
+        np.random.default_rng(0).poisson(5, size=(200, 300)).astype(np.uint16),
+        np.random.default_rng(1).random((64, 32, 3)).astype(np.float32)[:, ::2],
+        list(range(2000)),
+    ],
+)
+def test_utils_array_encoding(encoding, value):
+    """Test that encoded arrays are decoded unchanged, also after serialization."""
+    encoded = encode_array(value, encoding=encoding)
+    assert encoded[ENCODED_ARRAY_KEY] == encoding
+    assert isinstance(encoded["data"], bytes)
+    msg = messages.DeviceMessage(signals={"dev": {"value": encoded, "timestamp": 1.0}})
+    msg = MsgpackSerialization.loads(MsgpackSerialization.dumps(msg))
+    decoded = decode_array(msg.signals["dev"]["value"])
+    assert np.array_equal(decoded, np.asarray(value))
+    assert decoded.dtype == np.asarray(value).dtype
+    if encoding != "raw" and decoded.dtype.kind in "iu":
+        # Counts compress well, random floats do not
+        assert len(encoded["data"]) < decoded.nbytes
+
+
+def test_utils_array_encoding_passthrough():
+    """Test that small arrays, scalars and other values are not encoded."""
+    assert encode_array(np.zeros(10), encoding="lz4").shape == (10,)
+    assert encode_array(5, encoding="lz4") == 5
+    assert encode_array(["a"] * 5000, encoding="lz4") == ["a"] * 5000
+    assert encode_array([[1, 2], [3]], encoding="raw") == [[1, 2], [3]]
+    value = np.zeros(5000)
+    assert encode_array(value, encoding="none") is value
+    assert decode_array(value) is value
+    signals = {"dev": {"value": value, "timestamp": 1.0}}
+    encoded = encode_signals(signals, encoding="bitshuffle")
+    assert encoded["dev"]["timestamp"] == 1.0
+    assert ENCODED_ARRAY_KEY in encoded["dev"]["value"]
+    assert np.array_equal(decode_signals(encoded)["dev"]["value"], value)